@@ -126,6 +126,11 @@ def main():
                 "content": response
             })
 
+            # The agent has said goodbye
+            if conversation_handler.is_complete:
+                print("[OK] Conversation completed!")
+                break
+
             stage += 1
 
         # End of call
@@ -2,30 +2,137 @@
 AI Conversation Handler using Claude API
 """
 import anthropic
+import json
 import logging
-from typing import List, Dict, Optional
-from config import SYSTEM_PROMPT, CONVERSATION_FLOW
+import random
+import re
+from string import Formatter
+from typing import List, Dict, Iterator, Optional, Tuple
+from config import SYSTEM_PROMPT, CONVERSATION_FLOW, INTENT_TEMPLATES
+from context import ContextWindow, estimate_tokens
+from extraction import CallOutcome, extract_entities
+from intent import IntentClassifier, END_CALL, CALL_BACK_LATER, NO_OPENINGS, TRANSFER
 
 logger = logging.getLogger(__name__)
 
+FALLBACK_RESPONSE = "I apologize, I'm having technical difficulties. Thank you for your time."
+SUMMARY_ERROR = "Error generating summary"
+
+# Shared compiled classifier; classification is stateless
+INTENTS = IntentClassifier()
+
+# Prompts for replies where the callee's intent overrides the scripted stage
+INTENT_PROMPTS = {
+    END_CALL: "The person wants to end the call. Thank them warmly for their time and say goodbye professionally. Keep it very brief (1 sentence).",
+    CALL_BACK_LATER: "The person is busy right now. Politely say you'll call back at a better time and say goodbye. Keep it very brief (1 sentence).",
+    NO_OPENINGS: "The person says they have no openings right now. Thank them for letting you know and end the call politely. Keep it very brief (1-2 sentences).",
+    TRANSFER: "The person is transferring you to someone else. Thank them and say you'll hold. Keep it very brief (1 sentence).",
+}
+
+# Sentence terminator followed by optional closing quotes/brackets and whitespace
+SENTENCE_BOUNDARY = re.compile(r'[.!?]+["\')\]]*\s+')
+
+# Replies that ask something back or push back need a real answer, not a draft or template
+NEEDS_FRESH_RESPONSE = re.compile(
+    r"\?|\b(no|not|don't|doesn't|isn't|aren't|can't|won't|never|wait|sorry|actually|"
+    r"what|who|why|how|which|when|where)\b",
+    re.IGNORECASE
+)
+
+
+def split_sentences(text: str) -> List[str]:
+    """
+    Split text into sentence-sized fragments
+
+    Args:
+        text: Text to split
+
+    Returns:
+        Non-empty sentences in order
+    """
+    sentences = []
+    start = 0
+    for match in SENTENCE_BOUNDARY.finditer(text):
+        sentences.append(text[start:match.end()].strip())
+        start = match.end()
+    sentences.append(text[start:].strip())
+    return [sentence for sentence in sentences if sentence]
+
+
+def template_phrases() -> List[str]:
+    """
+    List every template sentence that needs no slot filling
+
+    Returns:
+        Sentences that can be rendered ahead of time
+    """
+    templates = [template for stage in CONVERSATION_FLOW for template in stage.get("templates", [])]
+    templates += [template for variants in INTENT_TEMPLATES.values() for template in variants]
+
+    return [
+        sentence
+        for template in templates
+        if not any(field for _, field, _, _ in Formatter().parse(template))
+        for sentence in split_sentences(template)
+    ]
+
 
 class ConversationHandler:
     """Manages AI-powered conversation flow using Claude"""
 
-    def __init__(self, api_key: str, model: str = "claude-3-5-sonnet-20241022"):
+    def __init__(self, api_key: str, model: str = "claude-3-5-sonnet-20241022",
+                 prompt_caching: bool = True, max_context_turns: int = 8,
+                 context_token_budget: int = 2000):
         """
         Initialize conversation handler
 
         Args:
             api_key: Anthropic API key
             model: Claude model to use
+            prompt_caching: Mark the system prompt and prior turns as cacheable
+            max_context_turns: Most recent messages sent verbatim
+            context_token_budget: Estimated tokens allowed for prior turns in a request
         """
         self.client = anthropic.Anthropic(api_key=api_key)
         self.model = model
+        self.prompt_caching = prompt_caching
         self.conversation_history: List[Dict[str, str]] = []
+        self.context = ContextWindow(max_turns=max_context_turns, token_budget=context_token_budget)
         self.current_stage = 0
+        self.is_complete = False
+        self.entities: Dict[str, str] = {}
+        self.outcome = CallOutcome()
+        self.usage_log: List[Dict] = []
+        self._draft: Optional[Dict] = None
         logger.info(f"Initialized ConversationHandler with model: {model}")
 
+    def reset(self):
+        """Clear conversation state so the handler can start a new call"""
+        self.conversation_history = []
+        self.context.clear()
+        self.current_stage = 0
+        self.is_complete = False
+        self.entities = {}
+        self.outcome = CallOutcome()
+        self.usage_log = []
+        self._draft = None
+
+    def restore(self, conversation: List[Dict[str, str]], current_stage: int):
+        """
+        Load a finished conversation, e.g. to summarize it after a restart
+
+        Args:
+            conversation: Conversation history messages
+            current_stage: Stage the conversation reached
+        """
+        self.reset()
+        self.current_stage = current_stage
+        for message in conversation:
+            self.conversation_history.append(message)
+            self.context.append(message["role"], message["content"])
+            if message["role"] == "user":
+                self.outcome.update(message["content"], INTENTS.classify(message["content"]))
+
     def start_conversation(self) -> str:
         """
         Start a new conversation
@@ -33,8 +140,7 @@ class ConversationHandler:
         Returns:
             Initial greeting message
         """
-        self.conversation_history = []
-        self.current_stage = 0
+        self.reset()
 
         # Get initial greeting
         initial_message = self._generate_response(
@@ -44,6 +150,24 @@ class ConversationHandler:
         logger.info(f"Started conversation: {initial_message}")
         return initial_message
 
+    def start_conversation_stream(self) -> Iterator[str]:
+        """
+        Start a new conversation, yielding the greeting sentence by sentence
+
+        Yields:
+            Sentence-sized fragments of the initial greeting
+        """
+        self.reset()
+
+        sentences = []
+        for sentence in self._generate_response_stream(
+            "Generate a professional greeting introducing yourself as an AI assistant calling on behalf of a job seeker to inquire about job openings. Keep it brief (1-2 sentences)."
+        ):
+            sentences.append(sentence)
+            yield sentence
+
+        logger.info(f"Started conversation: {' '.join(sentences)}")
+
     def process_response(self, user_input: str) -> Optional[str]:
         """
         Process user's response and generate next message
@@ -54,23 +178,155 @@ class ConversationHandler:
         Returns:
             AI's response or None if conversation is complete
         """
+        turn = self._prepare_turn(user_input)
+        if turn is None:
+            return None
+
+        prompt, template = turn
+        response = template or self._take_draft(user_input) or self._generate_response(prompt)
+        self._finish_turn(response)
+        return response
+
+    def process_response_stream(self, user_input: str) -> Iterator[str]:
+        """
+        Process user's response and stream the next message
+
+        Sentences are yielded as soon as Claude completes them so the caller
+        can start speech synthesis before the full reply is available. Once
+        the generator is exhausted, is_complete tells the caller whether the
+        conversation is over.
+
+        Args:
+            user_input: Transcribed speech from HR representative
+
+        Yields:
+            Sentence-sized fragments of the AI's response
+        """
+        turn = self._prepare_turn(user_input)
+        if turn is None:
+            return
+
+        prompt, template = turn
+        ready = template or self._take_draft(user_input)
+        fragments = split_sentences(ready) if ready else self._generate_response_stream(prompt)
+
+        sentences = []
+        for sentence in fragments:
+            sentences.append(sentence)
+            yield sentence
+
+        if sentences:
+            self._finish_turn(" ".join(sentences))
+
+    def draft_next_response(self) -> Optional[str]:
+        """
+        Speculatively draft the next stage's message while the user is talking
+
+        The next stage of CONVERSATION_FLOW is known before the user finishes,
+        so its message can be generated ahead of time. The draft is used by the
+        next turn if the user's reply doesn't call for a different response.
+
+        Returns:
+            Draft text or None if there is no next stage to draft
+        """
+        history_len = len(self.conversation_history)
+        next_stage = self.current_stage + 1
+        if next_stage >= len(CONVERSATION_FLOW):
+            return None
+
+        # Templated stages don't need Claude, and a hybrid stage only
+        # escalates for replies that a draft couldn't be used for either
+        if CONVERSATION_FLOW[next_stage].get("mode", "llm") != "llm":
+            return None
+
+        text = self._generate_response(self._stage_prompt(next_stage))
+        if text == FALLBACK_RESPONSE:
+            return None
+
+        self._draft = {"stage": next_stage, "history_len": history_len, "text": text}
+        logger.info(f"Drafted stage {next_stage}: {text}")
+        return text
+
+    def _take_draft(self, user_input: str) -> Optional[str]:
+        """
+        Use the speculative draft for this turn if it still fits
+
+        Args:
+            user_input: Transcribed speech from HR representative
+
+        Returns:
+            Draft text or None if a fresh response is needed
+        """
+        draft, self._draft = self._draft, None
+        if draft is None:
+            return None
+
+        # The draft must be for this stage, written before exactly this reply
+        if draft["stage"] != self.current_stage or draft["history_len"] != len(self.conversation_history) - 1:
+            return None
+
+        if NEEDS_FRESH_RESPONSE.search(user_input):
+            logger.info("Discarding draft, reply needs a fresh response")
+            return None
+
+        logger.info(f"Using drafted response for stage {self.current_stage}")
+        return draft["text"]
+
+    def _stage_prompt(self, stage: int) -> str:
+        """Build the generation prompt for a conversation stage"""
+        return f"{CONVERSATION_FLOW[stage]['prompt']} Keep your response brief and natural (1-2 sentences)."
+
+    def _fill_template(self, templates: List[str]) -> Optional[str]:
+        """
+        Pick a template variant whose slots can all be filled
+
+        Args:
+            templates: Template variants with {slot} placeholders
+
+        Returns:
+            Filled template or None if no variant fits
+        """
+        usable = [
+            template for template in templates
+            if all(field in self.entities for _, field, _, _ in Formatter().parse(template) if field)
+        ]
+        if not usable:
+            return None
+
+        return random.choice(usable).format_map(self.entities)
+
+    def _prepare_turn(self, user_input: str) -> Optional[Tuple[str, Optional[str]]]:
+        """
+        Record user input and work out how to produce the next response
+
+        Args:
+            user_input: Transcribed speech from HR representative
+
+        Returns:
+            Tuple of (prompt, templated response or None when Claude is needed),
+            or None if conversation is complete
+        """
         # Add user input to history
         self.conversation_history.append({
             "role": "user",
             "content": user_input
         })
-
-        # Check if conversation should end
-        if self._should_end_conversation(user_input):
-            closing_message = self._generate_response(
-                "The person wants to end the call. Thank them warmly for their time and say goodbye professionally. Keep it very brief (1 sentence)."
-            )
-            self.conversation_history.append({
-                "role": "assistant",
-                "content": closing_message
-            })
-            logger.info("Conversation ended")
-            return closing_message
+        self.context.append("user", user_input)
+        self.entities.update(extract_entities(user_input))
+
+        # The callee's intent can override the scripted flow
+        intent = INTENTS.classify(user_input)
+        self.outcome.update(user_input, intent)
+        if intent is not None:
+            # A speculative draft assumed the scripted flow
+            self._draft = None
+            if intent != TRANSFER:
+                # This reply is the goodbye; the call ends once it has been spoken
+                logger.info(f"Conversation ending ({intent})")
+                self.current_stage = len(CONVERSATION_FLOW) - 1
+                self.is_complete = True
+            # A transfer stays on the current stage for whoever picks up
+            return INTENT_PROMPTS[intent], self._fill_template(INTENT_TEMPLATES.get(intent, []))
 
         # Move to next stage if needed
         self.current_stage += 1
@@ -78,21 +334,149 @@ class ConversationHandler:
         # Check if we've completed all stages
         if self.current_stage >= len(CONVERSATION_FLOW):
             logger.info("All conversation stages completed")
+            self.is_complete = True
             return None
 
+        # The closing stage's reply is the goodbye; the call ends once it has been spoken
+        if self.current_stage == len(CONVERSATION_FLOW) - 1:
+            logger.info("Conversation ending (closing stage)")
+            self.is_complete = True
+
         # Generate next response based on current stage
         stage_info = CONVERSATION_FLOW[self.current_stage]
-        prompt = f"{stage_info['prompt']} Keep your response brief and natural (1-2 sentences)."
+        mode = stage_info.get("mode", "llm")
 
-        response = self._generate_response(prompt)
+        template = None
+        if mode == "template" or (mode == "hybrid" and not NEEDS_FRESH_RESPONSE.search(user_input)):
+            template = self._fill_template(stage_info.get("templates", []))
+            if template:
+                logger.info(f"Using template for stage {self.current_stage} ({stage_info['stage']})")
 
+        return self._stage_prompt(self.current_stage), template
+
+    def _finish_turn(self, response: str):
+        """
+        Record the AI's response in the conversation history
+
+        Args:
+            response: Complete AI response for this turn
+        """
         self.conversation_history.append({
             "role": "assistant",
             "content": response
         })
+        self.context.append("assistant", response)
 
-        logger.info(f"Stage {self.current_stage} ({stage_info['stage']}): {response}")
-        return response
+        if self.current_stage < len(CONVERSATION_FLOW):
+            stage_name = CONVERSATION_FLOW[self.current_stage]['stage']
+            logger.info(f"Stage {self.current_stage} ({stage_name}): {response}")
+
+    def _build_messages(self, prompt: str) -> List[Dict[str, str]]:
+        """
+        Build the message list for an API request
+
+        Args:
+            prompt: Prompt for response generation
+
+        Returns:
+            Bounded conversation context followed by the prompt
+        """
+        messages = self.context.messages()
+
+        # Everything before the new prompt is a stable prefix
+        if self.prompt_caching and messages:
+            last = messages[-1]
+            messages[-1] = {
+                "role": last["role"],
+                "content": [{
+                    "type": "text",
+                    "text": last["content"],
+                    "cache_control": {"type": "ephemeral"}
+                }]
+            }
+
+        messages.append({
+            "role": "user",
+            "content": prompt
+        })
+        return messages
+
+    def estimate_prompt_tokens(self, prompt: str) -> int:
+        """
+        Estimate the input size of a request before it is sent
+
+        Args:
+            prompt: Prompt for response generation
+
+        Returns:
+            Estimated input tokens (system prompt, context and prompt)
+        """
+        return estimate_tokens(SYSTEM_PROMPT) + self.context.tokens + estimate_tokens(prompt)
+
+    def _check_prompt_size(self, prompt: str) -> int:
+        """
+        Estimate a request before sending it, compacting the context if it is over budget
+
+        Args:
+            prompt: Prompt for response generation
+
+        Returns:
+            Estimated input tokens of the request that will be sent
+        """
+        # Appending keeps the last two turns verbatim; a request may fold all but the newest
+        if self.context.tokens > self.context.token_budget:
+            self.context.compact(min_turns=1)
+            if self.context.tokens > self.context.token_budget:
+                logger.warning(f"Context over budget after compaction (~{self.context.tokens} tokens)")
+        return self.estimate_prompt_tokens(prompt)
+
+    def _build_system(self):
+        """Build the system prompt, marked cacheable when enabled"""
+        if not self.prompt_caching:
+            return SYSTEM_PROMPT
+
+        return [{
+            "type": "text",
+            "text": SYSTEM_PROMPT,
+            "cache_control": {"type": "ephemeral"}
+        }]
+
+    def _record_usage(self, purpose: str, usage, estimated_input_tokens: Optional[int] = None):
+        """
+        Record token usage for one API call
+
+        Args:
+            purpose: What the call was for (response, stream, summary)
+            usage: Usage object returned by the API
+            estimated_input_tokens: Estimate made before the request was sent, if any
+        """
+        entry = {
+            "purpose": purpose,
+            "estimated_input_tokens": estimated_input_tokens,
+            "input_tokens": usage.input_tokens,
+            "output_tokens": usage.output_tokens,
+            "cache_creation_input_tokens": getattr(usage, 'cache_creation_input_tokens', 0) or 0,
+            "cache_read_input_tokens": getattr(usage, 'cache_read_input_tokens', 0) or 0
+        }
+        self.usage_log.append(entry)
+        estimate = f" (estimated ~{estimated_input_tokens})" if estimated_input_tokens is not None else ""
+        logger.info(
+            f"Token usage ({purpose}): input={entry['input_tokens']}{estimate}, "
+            f"cache_write={entry['cache_creation_input_tokens']}, "
+            f"cache_read={entry['cache_read_input_tokens']}, output={entry['output_tokens']}"
+        )
+
+    def get_usage_totals(self) -> Dict[str, int]:
+        """
+        Sum token usage over all API calls made for this conversation
+
+        Returns:
+            Dictionary of token counts
+        """
+        keys = ["input_tokens", "output_tokens", "cache_creation_input_tokens", "cache_read_input_tokens"]
+        totals = {key: sum(entry[key] for entry in self.usage_log) for key in keys}
+        totals["api_calls"] = len(self.usage_log)
+        return totals
 
     def _generate_response(self, prompt: str) -> str:
         """
@@ -105,20 +489,16 @@ class ConversationHandler:
             Generated response
         """
         try:
-            # Build messages for API
-            messages = self.conversation_history.copy()
-            messages.append({
-                "role": "user",
-                "content": prompt
-            })
+            estimated = self._check_prompt_size(prompt)
 
             # Call Claude API
             response = self.client.messages.create(
                 model=self.model,
                 max_tokens=150,
-                system=SYSTEM_PROMPT,
-                messages=messages
+                system=self._build_system(),
+                messages=self._build_messages(prompt)
             )
+            self._record_usage("response", response.usage, estimated)
 
             # Extract text from response
             generated_text = response.content[0].text.strip()
@@ -127,83 +507,121 @@ class ConversationHandler:
 
         except Exception as e:
             logger.error(f"Error generating response: {str(e)}")
-            return "I apologize, I'm having technical difficulties. Thank you for your time."
+            return FALLBACK_RESPONSE
 
-    def _should_end_conversation(self, user_input: str) -> bool:
+    def _generate_response_stream(self, prompt: str) -> Iterator[str]:
         """
-        Determine if conversation should end based on user input
+        Stream AI response from Claude, split at sentence boundaries
 
         Args:
-            user_input: User's message
-
-        Returns:
-            True if conversation should end
-        """
-        end_phrases = [
-            "goodbye",
-            "bye",
-            "have to go",
-            "can't talk",
-            "busy right now",
-            "call back later",
-            "not interested",
-            "no thank you"
-        ]
-
-        user_lower = user_input.lower()
-        return any(phrase in user_lower for phrase in end_phrases)
+            prompt: Prompt for response generation
 
-    def get_conversation_summary(self) -> Dict[str, any]:
+        Yields:
+            Complete sentences as soon as they are available
         """
-        Generate a summary of the conversation
+        buffer = ""
+        yielded = False
 
-        Returns:
-            Dictionary with conversation summary
-        """
         try:
-            # Build full conversation text
-            conversation_text = ""
-            for msg in self.conversation_history:
-                role = "Agent" if msg["role"] == "assistant" else "HR Rep"
-                conversation_text += f"{role}: {msg['content']}\n"
+            estimated = self._check_prompt_size(prompt)
+            with self.client.messages.stream(
+                model=self.model,
+                max_tokens=150,
+                system=self._build_system(),
+                messages=self._build_messages(prompt)
+            ) as stream:
+                for text in stream.text_stream:
+                    buffer += text
+
+                    # Emit every complete sentence in the buffer
+                    match = SENTENCE_BOUNDARY.search(buffer)
+                    while match:
+                        sentence = buffer[:match.end()].strip()
+                        buffer = buffer[match.end():]
+                        if sentence:
+                            yielded = True
+                            yield sentence
+                        match = SENTENCE_BOUNDARY.search(buffer)
+
+                self._record_usage("stream", stream.get_final_message().usage, estimated)
+
+            # Flush whatever is left after the final token
+            if buffer.strip():
+                yielded = True
+                yield buffer.strip()
 
-            # Generate summary using Claude
-            summary_prompt = f"""Based on this conversation, provide a structured summary:
+        except Exception as e:
+            logger.error(f"Error streaming response: {str(e)}")
+            if not yielded:
+                yield FALLBACK_RESPONSE
 
-{conversation_text}
+    def get_conversation_summary(self, fill_gaps: bool = True) -> Dict[str, any]:
+        """
+        Build the structured call outcome and its summary
 
-Please provide:
-1. Key information gathered
-2. Job availability status
-3. Required qualifications (if mentioned)
-4. Next steps (if any)
-5. Overall outcome
+        Fields are extracted locally on every turn; Claude is only asked about
+        fields that are still empty when the call ends.
 
-Format as a clear, bullet-pointed summary."""
+        Args:
+            fill_gaps: Ask Claude for fields the local extractors missed
 
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=500,
-                messages=[{
-                    "role": "user",
-                    "content": summary_prompt
-                }]
-            )
+        Returns:
+            Dictionary with conversation summary and outcome fields
+        """
+        summary = {
+            "conversation": self.conversation_history,
+            "stages_completed": self.current_stage,
+            "total_exchanges": len(self.conversation_history) // 2
+        }
+
+        missing = self.outcome.missing() if fill_gaps else []
+        has_replies = any(message["role"] == "user" for message in self.conversation_history)
+        if missing and has_replies:
+            try:
+                self.outcome.merge(self._extract_fields(missing))
+            except Exception as e:
+                logger.error(f"Error generating summary: {str(e)}")
+                summary.update({
+                    "summary": SUMMARY_ERROR,
+                    "outcome": self.outcome.to_dict(),
+                    "token_usage": self.get_usage_totals()
+                })
+                return summary
+
+        summary.update({
+            "summary": self.outcome.render(),
+            "outcome": self.outcome.to_dict(),
+            "token_usage": self.get_usage_totals()
+        })
+        return summary
 
-            summary = response.content[0].text.strip()
+    def _extract_fields(self, fields: List[str]) -> Dict:
+        """
+        Ask Claude for outcome fields the local extractors could not find
 
-            return {
-                "conversation": self.conversation_history,
-                "summary": summary,
-                "stages_completed": self.current_stage,
-                "total_exchanges": len(self.conversation_history) // 2
-            }
+        Args:
+            fields: Names of the missing fields
 
-        except Exception as e:
-            logger.error(f"Error generating summary: {str(e)}")
-            return {
-                "conversation": self.conversation_history,
-                "summary": "Error generating summary",
-                "stages_completed": self.current_stage,
-                "total_exchanges": len(self.conversation_history) // 2
-            }
+        Returns:
+            Parsed field values
+        """
+        # Ask after the conversation itself, so the system prompt and
+        # turns are read from the prompt cache
+        prompt = f"""The call is over. Reply with only a JSON object containing these keys: {", ".join(fields)}.
+openings and experience_years are integers, roles, skills and next_steps are lists of strings,
+apply_url and apply_email are strings, and outcome is one of: openings_available, no_openings,
+call_back_later, transferred, declined, unknown. Use null or [] for anything not mentioned in the call."""
+
+        response = self.client.messages.create(
+            model=self.model,
+            max_tokens=300,
+            system=self._build_system(),
+            messages=self._build_messages(prompt)
+        )
+        self._record_usage("summary", response.usage)
+
+        text = response.content[0].text
+        match = re.search(r"\{.*\}", text, re.DOTALL)
+        if not match:
+            raise ValueError(f"No JSON object in extraction reply: {text[:100]}")
+        return json.loads(match.group(0))
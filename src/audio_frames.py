@@ -0,0 +1,96 @@
+"""
+Binary audio framing for Socket.IO
+Audio travels as binary attachments with a small header instead of base64 inside JSON
+"""
+import base64
+import struct
+from typing import Optional, Tuple, Union
+
+# version, codec, 2 bytes padding, sequence number, sample rate (network byte order)
+HEADER = struct.Struct("!BBxxII")
+VERSION = 1
+
+CODEC_PCM16 = 1  # raw 16-bit little-endian mono PCM
+CODEC_WAV = 2    # complete WAV file
+
+TRANSPORT_BINARY = "binary"
+TRANSPORT_BASE64 = "base64"
+
+
+def negotiate_transport(offered) -> str:
+    """
+    Pick the audio transport for a call
+
+    Args:
+        offered: Transports the client listed in start_call, most preferred first
+
+    Returns:
+        binary if the client supports it, otherwise base64 (what older clients send)
+    """
+    if isinstance(offered, (list, tuple)) and TRANSPORT_BINARY in offered:
+        return TRANSPORT_BINARY
+    return TRANSPORT_BASE64
+
+
+def pack_frame(sequence: int, sample_rate: int, codec: int, payload: bytes) -> bytes:
+    """
+    Prefix audio with a frame header
+
+    Args:
+        sequence: Per-direction frame counter
+        sample_rate: Sample rate of the audio
+        codec: CODEC_* constant
+        payload: Encoded audio
+
+    Returns:
+        Header and payload
+    """
+    return HEADER.pack(VERSION, codec, sequence & 0xFFFFFFFF, sample_rate) + payload
+
+
+def unpack_frame(frame: bytes) -> Tuple[int, int, int, memoryview]:
+    """
+    Split a frame into its header fields and payload
+
+    Args:
+        frame: Bytes received from the client
+
+    Returns:
+        Tuple of (sequence, sample_rate, codec, payload); the payload is a view, not a copy
+
+    Raises:
+        ValueError: If the frame is too short or uses an unknown version
+    """
+    if len(frame) < HEADER.size:
+        raise ValueError(f"Audio frame too short ({len(frame)} bytes)")
+
+    version, codec, sequence, sample_rate = HEADER.unpack_from(frame)
+    if version != VERSION:
+        raise ValueError(f"Unsupported audio frame version: {version}")
+    return sequence, sample_rate, codec, memoryview(frame)[HEADER.size:]
+
+
+def wav_sample_rate(audio_data: bytes) -> int:
+    """Sample rate from a canonical WAV header, 0 if it isn't one"""
+    if len(audio_data) >= 28 and audio_data[:4] == b"RIFF" and audio_data[8:12] == b"WAVE":
+        return struct.unpack_from("<I", audio_data, 24)[0]
+    return 0
+
+
+def speech_payload(audio_data: Optional[bytes], transport: str, sequence: int) -> Union[bytes, str, None]:
+    """
+    Encode synthesized speech for an agent_speaking event
+
+    Args:
+        audio_data: WAV bytes from the TTS engine, or None
+        transport: Negotiated transport for the call
+        sequence: Outbound frame counter for the call
+
+    Returns:
+        A binary frame, a base64 string, or None when there is no audio
+    """
+    if not audio_data:
+        return None
+    if transport == TRANSPORT_BINARY:
+        return pack_frame(sequence, wav_sample_rate(audio_data), CODEC_WAV, audio_data)
+    return base64.b64encode(audio_data).decode('utf-8')
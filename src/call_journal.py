@@ -0,0 +1,91 @@
+"""
+Append-only call journal
+One JSON line per call event, written while the call is running
+"""
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+
+def read_journal(path: str) -> List[Dict]:
+    """
+    Read every complete record from a journal
+
+    Args:
+        path: Journal file
+
+    Returns:
+        Records in order (a torn final line from a crash is skipped)
+    """
+    records = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                logger.warning(f"Skipping truncated journal record in {path}")
+    return records
+
+
+class CallJournal:
+    """Per-call JSONL journal with batched fsync"""
+
+    def __init__(self, path: str, fsync_batch: int = 8, fsync_interval: float = 1.0):
+        """
+        Open (or reopen) a journal for appending
+
+        Args:
+            path: Journal file
+            fsync_batch: Records written between fsyncs
+            fsync_interval: Longest time in seconds a record may wait for fsync
+        """
+        self.path = path
+        self.fsync_batch = fsync_batch
+        self.fsync_interval = fsync_interval
+
+        self._lock = threading.Lock()
+        self._file = open(path, 'a', encoding='utf-8')
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def append(self, record: Dict):
+        """
+        Write one record
+
+        Args:
+            record: JSON-serializable event; a timestamp is added if missing
+        """
+        record.setdefault('ts', datetime.now().isoformat())
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+
+        with self._lock:
+            if self._file.closed:
+                logger.warning(f"Dropping record for closed journal: {self.path}")
+                return
+
+            self._file.write(line)
+            self._file.flush()
+            self._unsynced += 1
+
+            if self._unsynced >= self.fsync_batch or time.monotonic() - self._last_sync >= self.fsync_interval:
+                self._sync()
+
+    def _sync(self):
+        """Force written records to disk"""
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def close(self):
+        """Sync and close the journal"""
+        with self._lock:
+            if self._file.closed:
+                return
+            self._sync()
+            self._file.close()
@@ -0,0 +1,173 @@
+"""
+Running call statistics
+Aggregates are updated as calls are saved, so reading them never touches the call store
+"""
+import copy
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from typing import Dict
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (seconds) of the duration histogram buckets; the last bucket is open-ended
+DURATION_BUCKETS = [30, 60, 120, 300, 600]
+
+# Rollup buckets kept before the oldest are dropped
+HOURLY_RETENTION = 48
+DAILY_RETENTION = 90
+
+
+def _duration_bucket(duration: float) -> str:
+    """Histogram label for a call duration"""
+    lower = 0
+    for upper in DURATION_BUCKETS:
+        if duration < upper:
+            return f"{lower}-{upper}s"
+        lower = upper
+    return f"{lower}s+"
+
+
+def _empty() -> Dict:
+    """Aggregates for an empty call store"""
+    return {
+        "total_calls": 0,
+        "total_duration_seconds": 0,
+        "duration_histogram": {},
+        "stages_completed": {},
+        "outcomes": {},
+        "hourly": {},
+        "daily": {},
+        "last_call": None
+    }
+
+
+class CallStatistics:
+    """Persistent running aggregates over saved calls"""
+
+    def __init__(self, path: str):
+        """
+        Load aggregates from disk
+
+        Args:
+            path: JSON file the aggregates are persisted to
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self.is_new = not os.path.exists(path)
+
+        self._stats = _empty()
+        if not self.is_new:
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self._stats.update(json.load(f))
+            except Exception as e:
+                logger.error(f"Error loading statistics, rebuilding: {str(e)}")
+                self.is_new = True
+
+    def _apply(self, call_data: Dict, sign: int):
+        """Add (sign=1) or remove (sign=-1) one call's contribution"""
+        stats = self._stats
+        duration = call_data.get('duration', 0) or 0
+
+        def bump(counters: Dict, key, amount=1):
+            counters[key] = counters.get(key, 0) + sign * amount
+            if counters[key] == 0:
+                del counters[key]
+
+        stats["total_calls"] += sign
+        stats["total_duration_seconds"] += sign * duration
+        bump(stats["duration_histogram"], _duration_bucket(duration))
+        bump(stats["stages_completed"], str(call_data.get('stages_completed', 0)))
+
+        outcome = call_data.get('outcome')
+        if isinstance(outcome, dict):
+            outcome = outcome.get('outcome')
+        bump(stats["outcomes"], outcome or "unknown")
+
+        timestamp = call_data.get('timestamp') or datetime.now().isoformat()
+        for rollup, key in (("hourly", timestamp[:13]), ("daily", timestamp[:10])):
+            if sign < 0 and key not in stats[rollup]:
+                # Bucket already aged out of retention
+                continue
+            bucket = stats[rollup].setdefault(key, {"calls": 0, "duration_seconds": 0})
+            bucket["calls"] += sign
+            bucket["duration_seconds"] += sign * duration
+            if bucket["calls"] == 0:
+                del stats[rollup][key]
+
+    def _trim(self):
+        """Drop rollup buckets past retention"""
+        for rollup, retention in (("hourly", HOURLY_RETENTION), ("daily", DAILY_RETENTION)):
+            buckets = self._stats[rollup]
+            for key in sorted(buckets)[:-retention]:
+                del buckets[key]
+
+    def _persist(self):
+        """Write aggregates atomically"""
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._stats, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def record(self, call_data: Dict, persist: bool = True):
+        """
+        Count a newly saved call
+
+        Args:
+            call_data: Saved call record
+            persist: Write aggregates to disk (batch rebuilds persist once at the end)
+        """
+        with self._lock:
+            self._apply(call_data, 1)
+            last = self._stats["last_call"]
+            if last is None or call_data.get('timestamp', '') >= last.get('timestamp', ''):
+                self._stats["last_call"] = call_data
+            self._trim()
+            if persist:
+                self._persist()
+
+    def replace(self, old_call: Dict, new_call: Dict):
+        """
+        Swap an updated call's contribution
+
+        Args:
+            old_call: Call record before the update
+            new_call: Call record after the update
+        """
+        with self._lock:
+            self._apply(old_call, -1)
+            self._apply(new_call, 1)
+            last = self._stats["last_call"]
+            if last is not None and last.get('call_id') == new_call.get('call_id'):
+                self._stats["last_call"] = new_call
+            self._persist()
+
+    def reset(self):
+        """Clear all aggregates (before a full rebuild)"""
+        with self._lock:
+            self._stats = _empty()
+
+    def flush(self):
+        """Write aggregates to disk"""
+        with self._lock:
+            self._persist()
+        self.is_new = False
+
+    def snapshot(self) -> Dict:
+        """
+        Current aggregates
+
+        Returns:
+            Statistics dictionary (totals, histogram, counters and rollups)
+        """
+        with self._lock:
+            stats = copy.deepcopy(self._stats)
+
+        total_calls = stats["total_calls"]
+        stats["average_duration_seconds"] = (
+            stats["total_duration_seconds"] / total_calls if total_calls > 0 else 0
+        )
+        return stats
@@ -21,18 +21,59 @@ class Config:
     AI_MODEL = os.getenv('AI_MODEL', 'claude-3-5-sonnet-20241022')
     MAX_TOKENS = int(os.getenv('MAX_TOKENS', 1024))
     TEMPERATURE = float(os.getenv('TEMPERATURE', 0.7))
+    PROMPT_CACHING = os.getenv('PROMPT_CACHING', 'true').lower() == 'true'
+    CONTEXT_MAX_TURNS = int(os.getenv('CONTEXT_MAX_TURNS', 8))
+    CONTEXT_TOKEN_BUDGET = int(os.getenv('CONTEXT_TOKEN_BUDGET', 2000))
 
     # Speech Configuration
     STT_MODEL = os.getenv('STT_MODEL', 'base')
     TTS_RATE = int(os.getenv('TTS_RATE', 150))
     TTS_VOLUME = float(os.getenv('TTS_VOLUME', 0.9))
+    TTS_CACHE_ENABLED = os.getenv('TTS_CACHE_ENABLED', 'true').lower() == 'true'
+    TTS_CACHE_MEMORY_MB = int(os.getenv('TTS_CACHE_MEMORY_MB', 64))
+    TTS_CACHE_DISK_MB = int(os.getenv('TTS_CACHE_DISK_MB', 512))
+
+    # Voice Activity Detection
+    VAD_ENABLED = os.getenv('VAD_ENABLED', 'true').lower() == 'true'
+    VAD_ENERGY_THRESHOLD_DB = float(os.getenv('VAD_ENERGY_THRESHOLD_DB', -45.0))
+    VAD_HANGOVER_MS = int(os.getenv('VAD_HANGOVER_MS', 800))
+    VAD_MIN_SPEECH_MS = int(os.getenv('VAD_MIN_SPEECH_MS', 250))
+
+    # Turn Pipeline
+    STT_WORKERS = int(os.getenv('STT_WORKERS', 0))
+    STT_BATCH_WINDOW_MS = int(os.getenv('STT_BATCH_WINDOW_MS', 30))
+    STT_MAX_BATCH = int(os.getenv('STT_MAX_BATCH', 8))
+    STT_PARTIAL_INTERVAL = float(os.getenv('STT_PARTIAL_INTERVAL', 1.0))
+    STT_MAX_UTTERANCE_SECONDS = float(os.getenv('STT_MAX_UTTERANCE_SECONDS', 30.0))
+    STT_RESULT_TIMEOUT = float(os.getenv('STT_RESULT_TIMEOUT', 60.0))
+    LLM_WORKERS = int(os.getenv('LLM_WORKERS', 16))
+    MAX_PENDING_TURNS = int(os.getenv('MAX_PENDING_TURNS', 64))
+
+    # Speculative Drafts
+    SPECULATIVE_DRAFTS = os.getenv('SPECULATIVE_DRAFTS', 'true').lower() == 'true'
+    SPECULATIVE_PRESYNTHESIZE = os.getenv('SPECULATIVE_PRESYNTHESIZE', 'true').lower() == 'true'
+
+    # Greeting Pool
+    GREETING_POOL_SIZE = int(os.getenv('GREETING_POOL_SIZE', 4))
+    GREETING_REFRESH_SECONDS = int(os.getenv('GREETING_REFRESH_SECONDS', 300))
+
+    # Background Summaries
+    SUMMARY_WORKERS = int(os.getenv('SUMMARY_WORKERS', 1))
+    SUMMARY_MAX_ATTEMPTS = int(os.getenv('SUMMARY_MAX_ATTEMPTS', 5))
 
     # Call Configuration
     MAX_CALL_DURATION = int(os.getenv('MAX_CALL_DURATION', 600))
     RECORDING_ENABLED = os.getenv('RECORDING_ENABLED', 'true').lower() == 'true'
+    RECORDING_FORMAT = os.getenv('RECORDING_FORMAT', 'flac')  # flac or opus
+    RECORDING_DUAL_CHANNEL = os.getenv('RECORDING_DUAL_CHANNEL', 'true').lower() == 'true'
+    RECORDING_BUFFER_SECONDS = float(os.getenv('RECORDING_BUFFER_SECONDS', 30.0))
 
     # Storage
     DATA_DIR = os.getenv('DATA_DIR', './data')
+    JOURNAL_FSYNC_BATCH = int(os.getenv('JOURNAL_FSYNC_BATCH', 8))
+    JOURNAL_FSYNC_INTERVAL = float(os.getenv('JOURNAL_FSYNC_INTERVAL', 1.0))
+    STORAGE_BACKEND = os.getenv('STORAGE_BACKEND', 'json')  # json or sqlite
+    SQLITE_PATH = os.getenv('SQLITE_PATH', os.path.join(DATA_DIR, 'calls.db'))
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
 
     @classmethod
@@ -44,8 +85,6 @@ class Config:
         # Create data directory if it doesn't exist
         os.makedirs(cls.DATA_DIR, exist_ok=True)
         os.makedirs(os.path.join(cls.DATA_DIR, 'recordings'), exist_ok=True)
-        os.makedirs(os.path.join(cls.DATA_DIR, 'transcripts'), exist_ok=True)
-        os.makedirs(os.path.join(cls.DATA_DIR, 'summaries'), exist_ok=True)
 
         return True
 
@@ -68,29 +107,76 @@ Guidelines:
 - Thank them for their time at the end
 """
 
+# Each stage's "mode" picks how its message is produced:
+#   llm      - generated by Claude from "prompt"
+#   template - one of "templates", slots filled from extracted entities
+#   hybrid   - template unless the reply needs a real answer, then llm
 CONVERSATION_FLOW = [
     {
         "stage": "greeting",
+        "mode": "llm",
         "prompt": "Greet the HR representative and introduce yourself as an AI assistant calling on behalf of a job seeker."
     },
     {
         "stage": "purpose",
+        "mode": "llm",
         "prompt": "Briefly explain you're calling to inquire about current job openings."
     },
     {
         "stage": "question_1",
-        "prompt": "Ask if they have any software engineering positions available."
+        "mode": "hybrid",
+        "prompt": "Ask if they have any software engineering positions available.",
+        "templates": [
+            "Great, thank you. Do you currently have any software engineering positions open?",
+            "Thanks! Are there any software engineering roles available at the moment?"
+        ]
     },
     {
         "stage": "question_2",
-        "prompt": "Ask about the required qualifications for the position."
+        "mode": "hybrid",
+        "prompt": "Ask about the required qualifications for the position.",
+        "templates": [
+            "That's great to hear. What qualifications are you looking for in candidates for the {role} role?",
+            "That's great to hear. What qualifications and experience do candidates need?"
+        ]
     },
     {
         "stage": "question_3",
-        "prompt": "Ask about the application process."
+        "mode": "hybrid",
+        "prompt": "Ask about the application process.",
+        "templates": [
+            "That's really helpful, thank you. What's the best way for candidates to apply?",
+            "Thanks, that's helpful. How should interested candidates apply?"
+        ]
     },
     {
         "stage": "closing",
-        "prompt": "Thank them for their time and end the call politely."
+        "mode": "template",
+        "prompt": "Thank them for their time and end the call politely.",
+        "templates": [
+            "Thank you so much for your time today. Have a great day!",
+            "I really appreciate your help. Thanks, and have a wonderful day!",
+            "Thanks again for the information about the {role} role. Have a great day!"
+        ]
     }
 ]
+
+# Replies when the callee's intent overrides the scripted flow
+INTENT_TEMPLATES = {
+    "end_call": [
+        "Thank you so much for your time. Goodbye!",
+        "I appreciate your time. Have a great day, goodbye!"
+    ],
+    "call_back_later": [
+        "No problem, I'll call back at a better time. Thank you, goodbye!",
+        "Understood, I'll try again later. Thanks, and have a good day!"
+    ],
+    "no_openings": [
+        "Thanks for letting me know. I appreciate your time, have a great day!",
+        "Understood, thank you for checking. Have a wonderful day!"
+    ],
+    "transfer": [
+        "Thank you, I'll hold.",
+        "Sure, thank you. I'll wait."
+    ]
+}
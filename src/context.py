@@ -0,0 +1,113 @@
+"""
+Conversation context window
+Keeps recent turns verbatim and folds older ones into a compact summary
+"""
+import logging
+import re
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+# Longest excerpt kept for a folded turn
+MAX_FOLDED_CHARS = 200
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Roughly estimate the token count of text (about 4 characters per token)
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Estimated token count
+    """
+    return len(text) // 4 + 1
+
+
+class ContextWindow:
+    """Bounded prompt context for one conversation"""
+
+    def __init__(self, max_turns: int = 8, token_budget: int = 2000):
+        """
+        Initialize context window
+
+        Args:
+            max_turns: Most recent messages kept verbatim
+            token_budget: Estimated tokens allowed for summary plus verbatim turns
+        """
+        self.max_turns = max_turns
+        self.token_budget = token_budget
+        self.clear()
+
+    def clear(self):
+        """Drop all turns and the running summary"""
+        self.turns: List[Dict[str, str]] = []
+        self.summary_lines: List[str] = []
+        self._turn_tokens = 0
+        self._summary_tokens = 0
+
+    @property
+    def tokens(self) -> int:
+        """Estimated tokens in the current context"""
+        return self._turn_tokens + self._summary_tokens
+
+    def append(self, role: str, content: str):
+        """
+        Add a message, compacting older turns if the window is over budget
+
+        Args:
+            role: Message role (user or assistant)
+            content: Message text
+        """
+        self.turns.append({"role": role, "content": content})
+        self._turn_tokens += estimate_tokens(content)
+
+        if len(self.turns) > self.max_turns or self.tokens > self.token_budget:
+            self.compact()
+
+    def messages(self) -> List[Dict[str, str]]:
+        """
+        Build the message list for a request
+
+        Returns:
+            Summary of folded turns (if any) followed by the verbatim turns
+        """
+        messages = []
+        if self.summary_lines:
+            messages.append({
+                "role": "user",
+                "content": "Summary of the call so far:\n" + "\n".join(self.summary_lines)
+            })
+        messages.extend(self.turns)
+        return messages
+
+    def compact(self, min_turns: int = 2):
+        """
+        Fold the oldest turns into the summary
+
+        Compaction removes a block of turns at once so the prompt prefix stays
+        stable (and cacheable) for several turns afterwards.
+
+        Args:
+            min_turns: Most recent turns that are never folded, even over budget
+        """
+        target_turns = max(min_turns, self.max_turns // 2)
+        folded = 0
+
+        while len(self.turns) > target_turns or (self.tokens > self.token_budget and len(self.turns) > min_turns):
+            turn = self.turns.pop(0)
+            self._turn_tokens -= estimate_tokens(turn["content"])
+
+            role = "Agent" if turn["role"] == "assistant" else "HR Rep"
+            excerpt = re.split(r'(?<=[.!?])\s', turn["content"].strip(), maxsplit=1)[0][:MAX_FOLDED_CHARS]
+            line = f"- {role}: {excerpt}"
+            self.summary_lines.append(line)
+            self._summary_tokens += estimate_tokens(line)
+            folded += 1
+
+        # The summary itself gets at most half the budget; oldest lines go first
+        while self.summary_lines and self._summary_tokens > self.token_budget // 2:
+            self._summary_tokens -= estimate_tokens(self.summary_lines.pop(0))
+
+        logger.info(f"Compacted {folded} turns into context summary (~{self.tokens} tokens)")
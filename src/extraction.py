@@ -0,0 +1,278 @@
+"""
+Local entity extraction from HR representative replies
+Cheap regex extractors used for template slots and the structured call outcome
+"""
+import re
+from typing import Dict, List, Optional
+
+from intent import END_CALL, CALL_BACK_LATER, NO_OPENINGS, TRANSFER
+
+ROLE = re.compile(
+    r"\b((?:senior|junior|lead|staff|principal|entry[- ]level)\s+)?"
+    r"((?:software|backend|back[- ]end|frontend|front[- ]end|full[- ]?stack|devops|data|machine learning|qa|mobile|cloud)\s+"
+    r"(?:engineer|developer|scientist|analyst))s?\b",
+    re.IGNORECASE
+)
+
+NUMBER_WORDS = {
+    "a": 1, "an": 1, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5,
+    "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10, "a couple of": 2,
+}
+NUMBER = r"(\d+|a couple of|an?|one|two|three|four|five|six|seven|eight|nine|ten)"
+
+# "we have two openings", "there's an open position", "hiring for 3 roles"
+OPENINGS = re.compile(
+    r"\b(?:have|got|there(?:'s| is| are)|hiring for|looking for|filling)\s+(?:about |around |maybe )?"
+    + NUMBER + r"\s+(?:open |new |full[- ]time )?(?:openings?|positions?|roles?|vacanc(?:y|ies)|spots?|jobs?)\b",
+    re.IGNORECASE
+)
+
+# "3+ years", "at least five years of experience", "2 to 4 years"
+YEARS = re.compile(
+    r"\b(at least |minimum(?: of)? )?" + NUMBER + r"(?:\s*(?:-|to)\s*\d+)?\s*(\+)?\s*(?:or more )?years?\b",
+    re.IGNORECASE
+)
+
+EMAIL = re.compile(r"\b[\w.+-]+@[\w-]+(?:\.[\w-]+)+\b")
+# Transcribed speech spells addresses out: "jobs at acme dot com"
+SPOKEN_EMAIL = re.compile(r"\b([\w.]+) at ([\w-]+(?: dot [\w-]+)+)\b", re.IGNORECASE)
+URL = re.compile(
+    r"(?<![@\w.-])(?:https?://\S+|www\.\S+|[\w-]+(?:\.[\w-]+)*\.(?:com|org|io|net|co|jobs)(?:/\S*)?)\b",
+    re.IGNORECASE
+)
+
+# Spoken and written forms mapped to a canonical skill name
+SKILLS = {
+    "python": "Python", "java": "Java", "javascript": "JavaScript", "typescript": "TypeScript",
+    "react": "React", "node": "Node.js", "node.js": "Node.js", "golang": "Go", "rust": "Rust",
+    "c++": "C++", "c#": "C#", ".net": ".NET", "ruby": "Ruby", "rails": "Rails", "php": "PHP",
+    "swift": "Swift", "kotlin": "Kotlin", "scala": "Scala", "sql": "SQL", "postgres": "PostgreSQL",
+    "mysql": "MySQL", "mongodb": "MongoDB", "django": "Django", "flask": "Flask", "spring": "Spring",
+    "angular": "Angular", "vue": "Vue", "graphql": "GraphQL", "aws": "AWS", "azure": "Azure",
+    "gcp": "GCP", "docker": "Docker", "kubernetes": "Kubernetes", "terraform": "Terraform",
+    "linux": "Linux", "spark": "Spark", "kafka": "Kafka", "tensorflow": "TensorFlow",
+    "pytorch": "PyTorch", "machine learning": "Machine Learning",
+}
+SKILL = re.compile(
+    r"(?<![\w+#.])(" + "|".join(re.escape(skill) for skill in sorted(SKILLS, key=len, reverse=True)) + r")(?![\w+#])",
+    re.IGNORECASE
+)
+
+# Sentences with one of these describe what happens after the call
+NEXT_STEP = re.compile(
+    r"\b(send|email|e-mail|apply|submit|forward|reach out|get back|follow up|interview|"
+    r"careers page|our website|call (?:you|me|us) back)\b",
+    re.IGNORECASE
+)
+SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+# Outcome values, most specific first when several apply
+OUTCOME_OPENINGS = "openings_available"
+OUTCOME_NO_OPENINGS = "no_openings"
+OUTCOME_CALL_BACK = "call_back_later"
+OUTCOME_TRANSFERRED = "transferred"
+OUTCOME_DECLINED = "declined"
+OUTCOME_UNKNOWN = "unknown"
+OUTCOMES = [OUTCOME_OPENINGS, OUTCOME_NO_OPENINGS, OUTCOME_CALL_BACK,
+            OUTCOME_TRANSFERRED, OUTCOME_DECLINED, OUTCOME_UNKNOWN]
+
+INTENT_OUTCOMES = {
+    NO_OPENINGS: OUTCOME_NO_OPENINGS,
+    CALL_BACK_LATER: OUTCOME_CALL_BACK,
+    TRANSFER: OUTCOME_TRANSFERRED,
+    END_CALL: OUTCOME_DECLINED,
+}
+
+# Field name -> type of the structured outcome
+OUTCOME_FIELDS = {
+    "openings": int,
+    "roles": list,
+    "experience_years": int,
+    "skills": list,
+    "apply_url": str,
+    "apply_email": str,
+    "next_steps": list,
+    "outcome": str,
+}
+
+
+def _number(value: str) -> int:
+    """Parse a digit string or number word"""
+    value = value.lower()
+    return int(value) if value.isdigit() else NUMBER_WORDS[value]
+
+
+def extract_entities(text: str) -> Dict[str, str]:
+    """
+    Extract slot values from an utterance
+
+    Args:
+        text: Transcribed utterance
+
+    Returns:
+        Dictionary of entity name to value (only entities that were found)
+    """
+    entities = {}
+
+    match = ROLE.search(text)
+    if match:
+        entities["role"] = " ".join(part.strip().lower() for part in match.groups() if part)
+
+    return entities
+
+
+class CallOutcome:
+    """Structured call result, filled in turn by turn"""
+
+    def __init__(self):
+        """Start with every field empty"""
+        self.openings: Optional[int] = None
+        self.roles: List[str] = []
+        self.experience_years: Optional[int] = None
+        self.skills: List[str] = []
+        self.apply_url: Optional[str] = None
+        self.apply_email: Optional[str] = None
+        self.next_steps: List[str] = []
+        self._intent_outcome: Optional[str] = None
+        self._llm_outcome: Optional[str] = None
+
+    def update(self, text: str, intent: Optional[str] = None):
+        """
+        Extract outcome fields from one HR representative reply
+
+        Args:
+            text: Transcribed utterance
+            intent: Intent detected for the utterance, if any
+        """
+        role = extract_entities(text).get("role")
+        if role and role not in self.roles:
+            self.roles.append(role)
+
+        match = OPENINGS.search(text)
+        if match:
+            self.openings = _number(match.group(1))
+
+        for match in YEARS.finditer(text):
+            # Only "N+ years", "at least N years" or "N years ... experience" are requirements
+            if match.group(1) or match.group(3) or "experience" in text[match.end():match.end() + 30].lower():
+                self.experience_years = _number(match.group(2))
+                break
+
+        for match in SKILL.finditer(text):
+            skill = SKILLS[match.group(1).lower()]
+            if skill not in self.skills:
+                self.skills.append(skill)
+
+        email = EMAIL.search(text)
+        if email:
+            self.apply_email = email.group(0).lower()
+        else:
+            spoken = SPOKEN_EMAIL.search(text)
+            if spoken:
+                self.apply_email = f"{spoken.group(1)}@{spoken.group(2).replace(' dot ', '.')}".lower()
+
+        for url in URL.finditer(text.replace(" dot ", ".")):
+            # The domain of a spoken email address also looks like a URL
+            if not (self.apply_email and url.group(0).lower() in self.apply_email):
+                self.apply_url = url.group(0).rstrip(".,")
+                break
+
+        for sentence in SENTENCE_END.split(text):
+            sentence = sentence.strip()
+            if NEXT_STEP.search(sentence) and sentence not in self.next_steps:
+                self.next_steps.append(sentence)
+
+        if intent == NO_OPENINGS:
+            self.openings = 0
+        if intent in INTENT_OUTCOMES:
+            current = self._intent_outcome
+            candidate = INTENT_OUTCOMES[intent]
+            # A goodbye doesn't override a more specific reason for ending
+            if current is None or OUTCOMES.index(candidate) < OUTCOMES.index(current):
+                self._intent_outcome = candidate
+
+    @property
+    def outcome(self) -> str:
+        """Overall result of the call"""
+        if self._intent_outcome in (OUTCOME_NO_OPENINGS, OUTCOME_CALL_BACK):
+            return self._intent_outcome
+        if self.openings or self.roles:
+            return OUTCOME_OPENINGS
+        return self._intent_outcome or self._llm_outcome or OUTCOME_UNKNOWN
+
+    def missing(self) -> List[str]:
+        """
+        Fields the local extractors have not filled
+
+        Returns:
+            Field names worth asking the LLM about (empty once the call is settled)
+        """
+        if self.outcome in (OUTCOME_NO_OPENINGS, OUTCOME_CALL_BACK):
+            # Nothing more was going to be said about openings
+            return []
+
+        missing = [
+            name for name in OUTCOME_FIELDS
+            if name != "outcome" and getattr(self, name) in (None, [])
+        ]
+        if self.outcome == OUTCOME_UNKNOWN:
+            missing.append("outcome")
+        return missing
+
+    def merge(self, values: Dict):
+        """
+        Fill empty fields from another source (e.g. the LLM), coercing types
+
+        Args:
+            values: Field name to value; unknown names and empty values are ignored
+        """
+        for name, value in values.items():
+            kind = OUTCOME_FIELDS.get(name)
+            if kind is None or value in (None, "", []):
+                continue
+            try:
+                if kind is list:
+                    value = [str(item) for item in (value if isinstance(value, list) else [value])]
+                else:
+                    value = kind(value)
+            except (TypeError, ValueError):
+                continue
+
+            if name == "outcome":
+                if value in OUTCOMES and self.outcome == OUTCOME_UNKNOWN:
+                    self._llm_outcome = value
+            elif getattr(self, name) in (None, []):
+                setattr(self, name, value)
+
+    def to_dict(self) -> Dict:
+        """
+        Typed fields for the call record
+
+        Returns:
+            Dictionary of every outcome field
+        """
+        return {name: getattr(self, name) for name in OUTCOME_FIELDS}
+
+    def render(self) -> str:
+        """
+        Format the outcome as a readable bullet list
+
+        Returns:
+            Summary text
+        """
+        lines = [f"• Outcome: {self.outcome.replace('_', ' ').capitalize()}"]
+        if self.openings is not None:
+            lines.append(f"• Openings: {self.openings}")
+        if self.roles:
+            lines.append(f"• Roles: {', '.join(self.roles)}")
+        if self.experience_years is not None:
+            lines.append(f"• Experience required: {self.experience_years}+ years")
+        if self.skills:
+            lines.append(f"• Skills: {', '.join(self.skills)}")
+        if self.apply_url:
+            lines.append(f"• Apply at: {self.apply_url}")
+        if self.apply_email:
+            lines.append(f"• Apply by email: {self.apply_email}")
+        for step in self.next_steps:
+            lines.append(f"• Next step: {step}")
+        return "\n".join(lines)
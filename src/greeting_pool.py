@@ -0,0 +1,100 @@
+"""
+Pre-warmed greeting pool
+Keeps ready-to-play greetings (text and audio) so calls start instantly
+"""
+import logging
+import threading
+import time
+from collections import deque
+from typing import Optional, Tuple
+
+from ai_handler import ConversationHandler, FALLBACK_RESPONSE
+
+logger = logging.getLogger(__name__)
+
+
+class GreetingPool:
+    """Background pool of rendered greetings"""
+
+    def __init__(self, api_key: str, model: str, tts, depth: int = 4,
+                 refresh_interval: float = 300.0):
+        """
+        Initialize greeting pool and start filling it
+
+        Args:
+            api_key: Anthropic API key
+            model: Claude model to use
+            tts: TTSService used to render greetings
+            depth: Number of greetings to keep ready
+            refresh_interval: Seconds after which an idle pool retires its oldest greeting
+        """
+        self.handler = ConversationHandler(api_key=api_key, model=model)
+        self.tts = tts
+        self.depth = depth
+        self.refresh_interval = refresh_interval
+
+        self._pool: deque = deque()
+        self._cond = threading.Condition()
+        self._stopped = False
+
+        self._thread = threading.Thread(target=self._run, name='greeting-pool', daemon=True)
+        self._thread.start()
+        logger.info(f"Started greeting pool with depth={depth}")
+
+    def take(self) -> Optional[Tuple[str, Optional[bytes]]]:
+        """
+        Take a ready greeting from the pool
+
+        Returns:
+            Tuple of (greeting text, audio data) or None if the pool is empty
+        """
+        with self._cond:
+            if not self._pool:
+                logger.warning("Greeting pool empty")
+                return None
+
+            greeting = self._pool.popleft()
+            self._cond.notify()
+            return greeting
+
+    def size(self) -> int:
+        """Number of greetings currently ready"""
+        return len(self._pool)
+
+    def stop(self):
+        """Stop replenishing the pool"""
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+
+    def _run(self):
+        """Keep the pool topped up, rotating stale greetings for variety"""
+        while True:
+            with self._cond:
+                while len(self._pool) >= self.depth and not self._stopped:
+                    if not self._cond.wait(timeout=self.refresh_interval) and self._pool:
+                        # Nothing was taken for a while; retire the oldest greeting
+                        self._pool.popleft()
+                if self._stopped:
+                    return
+
+            greeting = self._generate()
+            if greeting is None:
+                time.sleep(5)
+                continue
+
+            with self._cond:
+                self._pool.append(greeting)
+
+    def _generate(self) -> Optional[Tuple[str, Optional[bytes]]]:
+        """Generate and render one greeting"""
+        try:
+            text = self.handler.start_conversation()
+            if text == FALLBACK_RESPONSE:
+                return None
+
+            return text, self.tts.get_audio_data(text)
+
+        except Exception as e:
+            logger.error(f"Error generating pooled greeting: {str(e)}")
+            return None
@@ -0,0 +1,80 @@
+"""
+Call ID generation
+ULID-style IDs: 48-bit millisecond timestamp + 80 random bits, Crockford base32
+"""
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Optional
+
+CROCKFORD = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+ULID_LENGTH = 26
+
+# Format of IDs generated before ULIDs were introduced
+LEGACY_FORMAT = "%Y%m%d_%H%M%S"
+
+_lock = threading.Lock()
+_last_ms = -1
+_last_random = 0
+
+
+def _encode(value: int, length: int) -> str:
+    """Crockford base32 encode an integer to a fixed width"""
+    chars = []
+    for _ in range(length):
+        chars.append(CROCKFORD[value & 31])
+        value >>= 5
+    return "".join(reversed(chars))
+
+
+def new_ulid() -> str:
+    """
+    Generate a collision-free, time-sortable ID
+
+    IDs from the same millisecond increment the random part, so IDs from this
+    process are strictly increasing.
+
+    Returns:
+        26-character ID
+    """
+    global _last_ms, _last_random
+
+    with _lock:
+        now_ms = int(time.time() * 1000)
+        if now_ms <= _last_ms:
+            now_ms = _last_ms
+            _last_random = (_last_random + 1) & ((1 << 80) - 1)
+            if _last_random == 0:
+                # Random part overflowed; borrow the next millisecond
+                now_ms += 1
+        else:
+            _last_random = int.from_bytes(os.urandom(10), 'big')
+        _last_ms = now_ms
+
+        return _encode(now_ms, 10) + _encode(_last_random, 16)
+
+
+def id_time(call_id: str) -> Optional[datetime]:
+    """
+    Recover the creation time from a call ID
+
+    Args:
+        call_id: ULID or legacy timestamp ID
+
+    Returns:
+        Local creation time, or None for an unrecognized ID
+    """
+    if len(call_id) == ULID_LENGTH:
+        try:
+            ms = 0
+            for char in call_id[:10].upper():
+                ms = ms * 32 + CROCKFORD.index(char)
+            return datetime.fromtimestamp(ms / 1000)
+        except ValueError:
+            return None
+
+    try:
+        return datetime.strptime(call_id, LEGACY_FORMAT)
+    except ValueError:
+        return None
@@ -0,0 +1,158 @@
+"""
+Local intent classifier for HR representative replies
+One compiled regex pass with negation handling and a linear scoring model
+"""
+import logging
+import math
+import re
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+END_CALL = "end_call"
+CALL_BACK_LATER = "call_back_later"
+NO_OPENINGS = "no_openings"
+TRANSFER = "transfer"
+
+# (intent, phrase pattern, weight); patterns are matched on word boundaries
+INTENT_PHRASES: List[Tuple[str, str, float]] = [
+    (END_CALL, r"good ?bye", 2.5),
+    (END_CALL, r"bye", 2.0),
+    # Not "have to go through the careers page"
+    (END_CALL, r"(have|got|need) to go\b(?!\s+(to|through|with|on|ahead|over|into|in|back|and))", 2.0),
+    (END_CALL, r"gotta go", 2.0),
+    (END_CALL, r"can'?t talk", 1.5),
+    (END_CALL, r"not interested", 2.5),
+    (END_CALL, r"no,? thank you", 1.8),
+    (END_CALL, r"no,? thanks", 1.8),
+    (END_CALL, r"stop calling", 3.0),
+    (END_CALL, r"don'?t call", 3.0),
+    (END_CALL, r"have a (good|great|nice) (day|one)", 1.6),
+    (END_CALL, r"thanks for calling", 1.2),
+    (END_CALL, r"take care", 1.0),
+    (END_CALL, r"that'?s all", 1.0),
+    (CALL_BACK_LATER, r"call (me |us )?back", 2.5),
+    (CALL_BACK_LATER, r"busy (right )?now", 2.0),
+    (CALL_BACK_LATER, r"(in|into|heading to) a meeting", 2.0),
+    (CALL_BACK_LATER, r"not a good time", 2.5),
+    (CALL_BACK_LATER, r"bad time", 2.0),
+    # Too common on its own ("we hire at a different time of year"); supports other phrases
+    (CALL_BACK_LATER, r"(another|better|different) time", 1.2),
+    (CALL_BACK_LATER, r"try (again )?(later|tomorrow|next week)", 2.5),
+    (CALL_BACK_LATER, r"later (today|this week)", 1.2),
+    (NO_OPENINGS, r"no (current )?(open )?(openings|positions|vacancies|roles|jobs)", 3.0),
+    (NO_OPENINGS, r"(don'?t|do not) have any (open )?(openings|positions|vacancies|roles|jobs)", 3.0),
+    (NO_OPENINGS, r"not (currently )?hiring", 3.0),
+    (NO_OPENINGS, r"hiring freeze", 3.0),
+    (NO_OPENINGS, r"nothing (open|available)", 2.5),
+    (NO_OPENINGS, r"(positions|roles|openings) (are|have been|were) filled", 2.5),
+    (TRANSFER, r"transfer you", 3.0),
+    (TRANSFER, r"put you through", 3.0),
+    (TRANSFER, r"connect you (with|to)", 3.0),
+    (TRANSFER, r"(speak|talk) (with|to) (the |our )?(hiring manager|recruiter|someone else)", 2.5),
+    (TRANSFER, r"let me (get|grab|find) (someone|somebody|(the |our |my )(hiring manager|recruiter|manager|supervisor|colleague))", 2.5),
+    (TRANSFER, r"hold on", 1.0),
+    (TRANSFER, r"one moment", 1.0),
+]
+
+# Per-intent bias of the scoring model; a lone weak phrase should not fire
+INTENT_BIAS: Dict[str, float] = {
+    END_CALL: -1.5,
+    CALL_BACK_LATER: -1.5,
+    NO_OPENINGS: -1.5,
+    TRANSFER: -1.5,
+}
+
+NEGATORS = {"not", "no", "never", "nothing", "hardly"}
+
+# Words before a phrase that are checked for negation
+NEGATION_WINDOW = 3
+
+WORD = re.compile(r"[\w']+")
+
+# Negation doesn't carry across these ("No, we're not hiring")
+CLAUSE_BREAK = re.compile(r"[.,;!?]")
+
+
+def _is_negator(word: str) -> bool:
+    """Whether a word negates what follows it"""
+    return word in NEGATORS or word.endswith("n't")
+
+
+def _first_letters(pattern: str) -> str:
+    """Letters a phrase pattern can start with (handles a leading group)"""
+    if pattern.startswith("("):
+        group = pattern[1:pattern.index(")")]
+        return "".join(alternative[0] for alternative in group.split("|"))
+    return pattern[0]
+
+
+class IntentClassifier:
+    """Scores utterances against call-flow intents without an LLM round trip"""
+
+    def __init__(self, phrases: List[Tuple[str, str, float]] = INTENT_PHRASES,
+                 bias: Dict[str, float] = INTENT_BIAS, threshold: float = 0.5):
+        """
+        Compile the phrase table into a single regex
+
+        Args:
+            phrases: (intent, pattern, weight) entries
+            bias: Per-intent bias of the linear model
+            threshold: Probability at which an intent is detected
+        """
+        self.bias = bias
+        self.threshold = threshold
+        self._features = [(intent, weight) for intent, _, weight in phrases]
+
+        # Only try the alternation at word starts that can begin some phrase
+        first_letters = "".join(sorted({letter for _, pattern, _ in phrases for letter in _first_letters(pattern)}))
+        alternatives = "|".join(f"(?P<p{i}>{pattern})" for i, (_, pattern, _) in enumerate(phrases))
+        self._pattern = re.compile(f"(?<![\\w'])(?=[{first_letters}])(?:{alternatives})\\b")
+
+    def _is_negated(self, text: str, start: int) -> bool:
+        """Whether a negator appears in the few words before a match, within its clause"""
+        # Phrases like "not hiring" or "no thank you" carry their own negation
+        first = WORD.match(text, start)
+        if first and _is_negator(first.group(0)):
+            return False
+
+        clause = CLAUSE_BREAK.split(text[max(0, start - 40):start])[-1]
+        return any(_is_negator(word) for word in WORD.findall(clause)[-NEGATION_WINDOW:])
+
+    def score(self, text: str) -> Dict[str, float]:
+        """
+        Score every intent for an utterance
+
+        Args:
+            text: Transcribed utterance
+
+        Returns:
+            Dictionary of intent to probability
+        """
+        text = text.lower()
+        totals = dict(self.bias)
+        for match in self._pattern.finditer(text):
+            if self._is_negated(text, match.start()):
+                continue
+            intent, weight = self._features[int(match.lastgroup[1:])]
+            totals[intent] += weight
+
+        return {intent: 1.0 / (1.0 + math.exp(-total)) for intent, total in totals.items()}
+
+    def classify(self, text: str) -> Optional[str]:
+        """
+        Detect the strongest intent in an utterance
+
+        Args:
+            text: Transcribed utterance
+
+        Returns:
+            Intent name or None if no intent passes the threshold
+        """
+        scores = self.score(text)
+        intent, probability = max(scores.items(), key=lambda item: item[1])
+        if probability < self.threshold:
+            return None
+
+        logger.info(f"Detected intent {intent} ({probability:.2f})")
+        return intent
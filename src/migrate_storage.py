@@ -0,0 +1,96 @@
+"""
+Import the JSON call store into the SQLite backend
+
+Usage:
+    python src/migrate_storage.py [--data-dir ./data] [--db ./data/calls.db]
+"""
+import argparse
+import logging
+import os
+import sys
+from typing import Dict, Iterator
+
+from sqlite_storage import SQLiteStorage
+from storage import iter_call_records, iter_legacy_calls, render_transcript
+
+logger = logging.getLogger(__name__)
+
+
+def iter_source_calls(data_dir: str) -> Iterator[Dict]:
+    """
+    Read every call in a JSON data directory without writing to it
+
+    Packed records take precedence over legacy per-call files of the same call.
+
+    Args:
+        data_dir: Data directory to read
+
+    Yields:
+        Call records
+    """
+    seen = set()
+    for call_data in iter_call_records(data_dir):
+        seen.add(call_data.get('call_id'))
+        yield call_data
+
+    for call_data, _ in iter_legacy_calls(data_dir):
+        if call_data['call_id'] not in seen:
+            yield call_data
+
+
+def migrate(data_dir: str, db_path: str) -> int:
+    """
+    Copy every call, transcript and summary into the database
+
+    The JSON files are only read, never modified.
+
+    Args:
+        data_dir: Data directory holding the JSON call store
+        db_path: SQLite database to write to
+
+    Returns:
+        Number of calls imported
+    """
+    storage = SQLiteStorage(data_dir=data_dir, db_path=db_path)
+
+    imported = 0
+    for call_data in iter_source_calls(data_dir):
+        call_id = call_data.get('call_id')
+        try:
+            call_data.setdefault('timestamp', call_data.get('start_time', ''))
+
+            summary = None
+            if call_data.get('summary') is not None:
+                summary = {
+                    "summary": call_data['summary'],
+                    "outcome": call_data.get('outcome'),
+                    "token_usage": call_data.get('token_usage')
+                }
+
+            storage.import_call(
+                call_data,
+                transcript=render_transcript(call_data.get('conversation', [])),
+                summary=summary
+            )
+            imported += 1
+        except Exception as e:
+            logger.error(f"Error importing {call_id}: {str(e)}")
+
+    storage.rebuild_statistics()
+    logger.info(f"Imported {imported} calls into {db_path}")
+    return imported
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import JSON call data into SQLite")
+    parser.add_argument('--data-dir', default=os.getenv('DATA_DIR', './data'))
+    parser.add_argument('--db', default=None, help="Database path (default: DATA_DIR/calls.db)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    migrate(args.data_dir, args.db or os.path.join(args.data_dir, 'calls.db'))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,31 @@
+"""
+Pack calls saved as separate call, transcript and summary files into compressed records
+
+The original files are kept; pass --backup-dir to move them out of the data directory.
+
+Usage:
+    python src/pack_legacy_calls.py [--data-dir ./data] [--backup-dir ./data_legacy]
+"""
+import argparse
+import logging
+import os
+import sys
+
+from storage import DataStorage
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack legacy per-call JSON files into compressed records")
+    parser.add_argument('--data-dir', default=os.getenv('DATA_DIR', './data'))
+    parser.add_argument('--backup-dir', default=None,
+                        help="Move the original files here after packing (default: leave them in place)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    storage = DataStorage(data_dir=args.data_dir)
+    storage.pack_legacy_calls(backup_dir=args.backup_dir)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,309 @@
+"""
+Turn processing pipeline
+Runs STT -> LLM -> TTS for each call turn on per-stage worker executors
+"""
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Optional, Set
+
+from ai_handler import split_sentences
+from audio_frames import speech_payload
+
+logger = logging.getLogger(__name__)
+
+
+class TurnPipeline:
+    """Processes call turns off the Socket.IO handler thread"""
+
+    def __init__(self, socketio, tts,
+                 on_conversation_complete: Callable,
+                 stt_workers: int = 1, llm_workers: int = 16,
+                 max_pending_turns: int = 64):
+        """
+        Initialize turn pipeline
+
+        Args:
+            socketio: SocketIO instance used to emit results to sessions
+            tts: TTSService used to render speech
+            on_conversation_complete: Called with the CallSession when the conversation ends
+            stt_workers: Number of transcription workers
+            llm_workers: Number of I/O-bound Claude request workers
+            max_pending_turns: Maximum queued or running turns across all sessions
+        """
+        self.socketio = socketio
+        self.tts = tts
+        self.on_conversation_complete = on_conversation_complete
+        self.max_pending_turns = max_pending_turns
+
+        self.stt_executor = ThreadPoolExecutor(max_workers=stt_workers, thread_name_prefix='stt')
+        self.llm_executor = ThreadPoolExecutor(max_workers=llm_workers, thread_name_prefix='llm')
+        # A single TTS stage keeps each session's spoken segments in order
+        self.tts_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='tts')
+
+        self._lock = threading.Lock()
+        self._pending_turns = 0
+        # Keyed by call rather than session: a session can start a new call while turns of the old one finish
+        self._call_queues: Dict[str, deque] = {}
+        # Calls whose running turn has already taken its audio from the transcriber
+        self._transcribing: Set[str] = set()
+
+        logger.info(
+            f"Initialized TurnPipeline with stt_workers={stt_workers}, "
+            f"llm_workers={llm_workers}, max_pending_turns={max_pending_turns}"
+        )
+
+    def submit_greeting(self, call):
+        """
+        Generate and speak the greeting for a new call
+
+        Args:
+            call: CallSession that was just started
+        """
+        self.llm_executor.submit(self._greeting_stage, call)
+
+    def submit_draft(self, call, presynthesize: bool = True):
+        """
+        Draft the next stage's reply while the user is still speaking
+
+        Args:
+            call: CallSession whose user just started talking
+            presynthesize: Also render the draft so its audio is cached
+        """
+        self.llm_executor.submit(self._draft_stage, call, presynthesize)
+
+    def submit_partial(self, call):
+        """
+        Run a partial decode of the audio received so far
+
+        Args:
+            call: CallSession whose transcriber has new audio
+        """
+        self.stt_executor.submit(self._partial_stage, call)
+
+    def submit_turn(self, call) -> bool:
+        """
+        Queue the end of a user utterance for processing
+
+        Turns for the same call are processed one at a time, in order. All
+        utterances share the call's transcriber, so one that ends before the
+        previous turn has taken its audio is merged into that turn.
+
+        Args:
+            call: CallSession whose transcriber holds the utterance
+
+        Returns:
+            True if the turn was accepted, False if the pipeline is full
+        """
+        with self._lock:
+            if self._pending_turns >= self.max_pending_turns:
+                logger.warning(f"Turn rejected, pipeline full: {call.session_id}")
+                return False
+
+            queue = self._call_queues.setdefault(call.call_id, deque())
+            if len(queue) > 1 or (queue and call.call_id not in self._transcribing):
+                # The waiting turn will finalize this audio along with its own
+                logger.info(f"Merged utterance into queued turn: {call.session_id}")
+                return True
+
+            self._pending_turns += 1
+            queue.append(call)
+
+            # A turn for this session is already running; it will pick this one up
+            if len(queue) > 1:
+                return True
+
+        self.stt_executor.submit(self._transcribe_stage, call)
+        return True
+
+    def shutdown(self):
+        """Stop all workers, waiting for running jobs to finish"""
+        for executor in (self.stt_executor, self.llm_executor, self.tts_executor):
+            executor.shutdown(wait=True)
+
+    def _emit(self, session_id: str, event: str, data: Dict):
+        """Emit an event to a single session"""
+        self.socketio.emit(event, data, to=session_id)
+
+    def _journal(self, call, record: Dict):
+        """Append a record to the call's journal; journal errors never break the call"""
+        try:
+            call.journal.append(record)
+        except Exception as e:
+            logger.error(f"Error writing call journal: {str(e)}")
+
+    def _draft_stage(self, call, presynthesize: bool):
+        """Generate a speculative draft and optionally pre-render it"""
+        try:
+            draft = call.conversation_handler.draft_next_response()
+
+            # Rendered audio lands in the TTS cache, where the real turn finds it
+            if draft and presynthesize:
+                for sentence in split_sentences(draft):
+                    self.tts.submit(sentence)
+
+        except Exception as e:
+            logger.error(f"Error drafting response: {str(e)}")
+
+    def _partial_stage(self, call):
+        """Commit whatever part of the utterance has become stable"""
+        try:
+            committed = call.transcriber.process()
+            if committed:
+                self._emit(call.session_id, 'user_spoke_partial', {
+                    "text": call.transcriber.committed_text,
+                    "committed": committed
+                })
+
+        except Exception as e:
+            logger.error(f"Error in partial transcription: {str(e)}")
+
+    def _transcribe_stage(self, call):
+        """Transcribe the rest of an utterance and hand it to the LLM stage"""
+        try:
+            with self._lock:
+                # Audio from here on belongs to the next turn
+                self._transcribing.add(call.call_id)
+
+            self._emit(call.session_id, 'processing', {"status": "transcribing"})
+            started = time.monotonic()
+            transcribed_text = call.transcriber.finalize()
+            stt_ms = (time.monotonic() - started) * 1000
+
+            if transcribed_text is None:
+                self._emit(call.session_id, 'error', {"message": "Failed to transcribe audio"})
+                self._turn_done(call)
+                return
+            if not transcribed_text:
+                # Its audio was already taken by the previous turn, or nothing was said
+                self._turn_done(call)
+                return
+
+            logger.info(f"Transcribed: {transcribed_text}")
+            self._emit(call.session_id, 'user_spoke', {"text": transcribed_text})
+
+            self.llm_executor.submit(self._response_stage, call, transcribed_text, stt_ms)
+
+        except Exception as e:
+            logger.error(f"Error transcribing turn: {str(e)}")
+            self._emit(call.session_id, 'error', {"message": str(e)})
+            self._turn_done(call)
+
+    def _response_stage(self, call, transcribed_text: str, stt_ms: float = 0.0):
+        """Stream the AI response and queue each sentence for synthesis"""
+        try:
+            if not call.is_active:
+                self._turn_done(call)
+                return
+
+            handler = call.conversation_handler
+            self._journal(call, {
+                "type": "turn", "role": "user", "content": transcribed_text,
+                "stage": handler.current_stage, "latency_ms": {"stt": round(stt_ms, 1)}
+            })
+
+            self._emit(call.session_id, 'processing', {"status": "generating_response"})
+            latency = {}
+            response = self._speak(call, handler.process_response_stream(transcribed_text), latency)
+
+            if response:
+                self._journal(call, {
+                    "type": "turn", "role": "assistant", "content": response,
+                    "stage": handler.current_stage, "latency_ms": latency
+                })
+
+            # Both run after every queued sentence has been synthesized and sent
+            if handler.is_complete:
+                logger.info("Conversation completed")
+                self.tts_executor.submit(self.on_conversation_complete, call)
+            self.tts_executor.submit(self._turn_done, call)
+
+        except Exception as e:
+            logger.error(f"Error processing speech: {str(e)}")
+            self._emit(call.session_id, 'error', {"message": str(e)})
+            self._turn_done(call)
+
+    def _greeting_stage(self, call):
+        """Stream the greeting and announce the call once it has been spoken"""
+        try:
+            logger.info("Generating greeting audio...")
+            latency = {}
+            greeting = self._speak(call, call.conversation_handler.start_conversation_stream(), latency)
+            self._journal(call, {
+                "type": "turn", "role": "assistant", "content": greeting,
+                "stage": 0, "latency_ms": latency
+            })
+
+            self.tts_executor.submit(
+                self._emit, call.session_id, 'call_started',
+                {"session_id": call.session_id, "greeting": greeting}
+            )
+            logger.info(f"Call started successfully: {call.session_id}")
+
+        except Exception as e:
+            logger.error(f"Error starting call: {str(e)}")
+            self._emit(call.session_id, 'error', {"message": f"Failed to start call: {str(e)}"})
+
+    def _speak(self, call, sentences: Iterable[str], latency: Optional[Dict] = None) -> str:
+        """
+        Queue each sentence for synthesis as soon as it arrives
+
+        Args:
+            call: CallSession to speak to
+            sentences: Iterable of sentence-sized text fragments
+            latency: If given, filled with time to first sentence and total generation time (ms)
+
+        Returns:
+            Full text that was queued
+        """
+        started = time.monotonic()
+        spoken = []
+        for segment, sentence in enumerate(sentences):
+            if segment == 0 and latency is not None:
+                latency['llm_first_sentence'] = round((time.monotonic() - started) * 1000, 1)
+            self.tts_executor.submit(self._synthesize_stage, call, sentence, segment)
+            spoken.append(sentence)
+
+        if latency is not None:
+            latency['llm_total'] = round((time.monotonic() - started) * 1000, 1)
+        return " ".join(spoken)
+
+    def _synthesize_stage(self, call, text: str, segment: int):
+        """Synthesize one sentence and send it to the session"""
+        try:
+            audio_data = self.tts.get_audio_data(text)
+            if call.recorder and audio_data:
+                call.recorder.write_outbound(audio_data)
+
+            self._emit(call.session_id, 'agent_speaking', {
+                "text": text,
+                "audio": speech_payload(audio_data, call.audio_transport, next(call.outbound_seq)),
+                "segment": segment
+            })
+
+        except Exception as e:
+            logger.error(f"Error synthesizing speech: {str(e)}")
+
+    def _turn_done(self, call):
+        """Release a finished turn and start the session's next queued turn"""
+        with self._lock:
+            queue = self._call_queues.get(call.call_id)
+            if not queue:
+                return
+
+            queue.popleft()
+            self._pending_turns -= 1
+            self._transcribing.discard(call.call_id)
+
+            # Drop anything still queued for a call that has ended
+            if not call.is_active:
+                self._pending_turns -= len(queue)
+                queue.clear()
+
+            if not queue:
+                del self._call_queues[call.call_id]
+                return
+
+        self.stt_executor.submit(self._transcribe_stage, call)
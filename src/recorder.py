@@ -0,0 +1,241 @@
+"""
+Streaming call recorder
+Mixes the caller and agent audio onto one timeline and encodes it while the call runs
+"""
+import io
+import logging
+import queue
+import shutil
+import subprocess
+import threading
+import time
+import wave
+from math import gcd
+from typing import Optional
+
+import numpy as np
+from scipy.signal import resample_poly
+
+logger = logging.getLogger(__name__)
+
+INBOUND = 0
+OUTBOUND = 1
+
+# Encoder arguments per format; both are lossless or near-transparent for speech
+FORMATS = {
+    "flac": (".flac", ["-c:a", "flac", "-compression_level", "5"]),
+    "opus": (".ogg", ["-c:a", "libopus", "-b:a", "32k", "-application", "voip"])
+}
+
+_ffmpeg = shutil.which("ffmpeg")
+
+
+def recording_extension(fmt: str) -> str:
+    """
+    File extension a recording in this format will be written with
+
+    Args:
+        fmt: flac or opus
+
+    Returns:
+        Extension, falling back to .wav when no encoder is available
+    """
+    if _ffmpeg and fmt in FORMATS:
+        return FORMATS[fmt][0]
+    return ".wav"
+
+
+class CallRecorder:
+    """Records both legs of a call without blocking the caller"""
+
+    def __init__(self, path: str, sample_rate: int = 16000, fmt: str = "flac",
+                 dual_channel: bool = True, max_buffer_seconds: float = 30.0,
+                 flush_delay: float = 1.0, max_queue_chunks: int = 512):
+        """
+        Start recording
+
+        Args:
+            path: Output file (use recording_extension for the extension)
+            sample_rate: Sample rate of the recording and of inbound audio
+            fmt: flac or opus; WAV is written if ffmpeg is not installed
+            dual_channel: Caller on the left channel, agent on the right; otherwise mixed to mono
+            max_buffer_seconds: Most audio held in memory before it is forced to the encoder
+            flush_delay: How long audio is held so late chunks can still be mixed in
+            max_queue_chunks: Chunks waiting for the writer before new ones are dropped
+        """
+        self.path = path
+        self.sample_rate = sample_rate
+        self.fmt = fmt
+        self.channels = 2 if dual_channel else 1
+        self.max_buffer = int(max_buffer_seconds * sample_rate)
+        self.flush_delay = flush_delay
+        self.dropped = 0
+
+        self._started = time.monotonic()
+        self._queue = queue.Queue(maxsize=max_queue_chunks)
+        self._closing = threading.Event()
+
+        # Pending samples per track, starting at the first sample not yet encoded
+        self._tracks = [np.zeros(0, dtype=np.int16), np.zeros(0, dtype=np.int16)]
+        self._track_end = [0, 0]
+        self._cursor = 0
+
+        self._thread = threading.Thread(target=self._run, name="recorder", daemon=True)
+        self._thread.start()
+
+    def write_inbound(self, samples: np.ndarray):
+        """
+        Record caller audio
+
+        Args:
+            samples: Float32 samples in [-1, 1] at the recording sample rate
+        """
+        # Copy now; the caller's buffer may be reused
+        pcm = (np.clip(samples, -1.0, 1.0) * 32767).astype(np.int16)
+        # The chunk ends as it arrives
+        self._offer((INBOUND, time.monotonic() - len(pcm) / self.sample_rate, pcm))
+
+    def write_outbound(self, audio_data: bytes):
+        """
+        Record agent speech as it is sent to the caller
+
+        Args:
+            audio_data: WAV bytes from the TTS engine
+        """
+        # Decoding and resampling happen on the writer thread
+        self._offer((OUTBOUND, time.monotonic(), audio_data))
+
+    def close(self) -> str:
+        """
+        Stop recording; the writer finishes encoding in the background
+
+        Returns:
+            Path of the recording
+        """
+        self._closing.set()
+        return self.path
+
+    def _offer(self, item):
+        """Queue a chunk for the writer, dropping it if the writer has fallen behind"""
+        if self._closing.is_set():
+            return
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            if not self.dropped:
+                logger.warning(f"Recorder falling behind, dropping audio: {self.path}")
+            self.dropped += 1
+
+    def _open_encoder(self):
+        """Start the encoder; returns (write, close) callables"""
+        if _ffmpeg and self.fmt in FORMATS:
+            process = subprocess.Popen(
+                [
+                    _ffmpeg, "-hide_banner", "-loglevel", "error", "-y",
+                    "-f", "s16le", "-ar", str(self.sample_rate), "-ac", str(self.channels), "-i", "pipe:0",
+                    *FORMATS[self.fmt][1], self.path
+                ],
+                stdin=subprocess.PIPE
+            )
+
+            def close_process():
+                process.stdin.close()
+                process.wait()
+
+            return process.stdin.write, close_process
+
+        logger.warning("ffmpeg not found, recording uncompressed WAV")
+        wav = wave.open(self.path, 'wb')
+        wav.setnchannels(self.channels)
+        wav.setsampwidth(2)
+        wav.setframerate(self.sample_rate)
+        return wav.writeframesraw, wav.close
+
+    def _decode_outbound(self, audio_data: bytes) -> Optional[np.ndarray]:
+        """Convert TTS output to mono int16 at the recording sample rate"""
+        try:
+            with wave.open(io.BytesIO(audio_data), 'rb') as wav:
+                if wav.getsampwidth() != 2:
+                    logger.warning("Skipping agent audio with unsupported sample width")
+                    return None
+                rate = wav.getframerate()
+                samples = np.frombuffer(wav.readframes(wav.getnframes()), dtype=np.int16)
+                samples = samples.reshape(-1, wav.getnchannels()).mean(axis=1)
+        except (wave.Error, EOFError) as e:
+            logger.warning(f"Skipping agent audio that is not WAV: {str(e)}")
+            return None
+
+        if rate != self.sample_rate:
+            divisor = gcd(self.sample_rate, rate)
+            samples = resample_poly(samples, self.sample_rate // divisor, rate // divisor)
+        return np.clip(samples, -32768, 32767).astype(np.int16)
+
+    def _place(self, track: int, at: float, samples: np.ndarray):
+        """Put a chunk on its track at the given time, after anything already on the track"""
+        start = max(self._track_end[track], int((at - self._started) * self.sample_rate), self._cursor)
+        offset = start - self._cursor
+        end = offset + len(samples)
+
+        buffer = self._tracks[track]
+        if len(buffer) < end:
+            buffer = np.concatenate([buffer, np.zeros(end - len(buffer), dtype=np.int16)])
+        buffer[offset:end] = samples
+        self._tracks[track] = buffer
+        self._track_end[track] = start + len(samples)
+
+    def _flush(self, write, up_to: int):
+        """Encode both tracks up to an absolute sample position, padding with silence"""
+        count = up_to - self._cursor
+        if count <= 0:
+            return
+
+        frames = []
+        for track, buffer in enumerate(self._tracks):
+            if len(buffer) < count:
+                buffer = np.concatenate([buffer, np.zeros(count - len(buffer), dtype=np.int16)])
+            frames.append(buffer[:count])
+            self._tracks[track] = buffer[count:]
+
+        if self.channels == 2:
+            data = np.column_stack(frames)
+        else:
+            data = np.clip(frames[0].astype(np.int32) + frames[1], -32768, 32767).astype(np.int16)
+        write(data.tobytes())
+        self._cursor = up_to
+
+    def _run(self):
+        """Writer thread: place chunks on the timeline and stream settled audio to the encoder"""
+        try:
+            write, close_encoder = self._open_encoder()
+        except Exception as e:
+            logger.error(f"Error starting recording: {str(e)}")
+            self._closing.set()
+            return
+
+        try:
+            while True:
+                try:
+                    track, at, payload = self._queue.get(timeout=self.flush_delay / 2)
+                    samples = self._decode_outbound(payload) if track == OUTBOUND else payload
+                    if samples is not None and len(samples):
+                        self._place(track, at, samples)
+                except queue.Empty:
+                    if self._closing.is_set():
+                        break
+
+                settled = int((time.monotonic() - self._started - self.flush_delay) * self.sample_rate)
+                buffered = max(len(buffer) for buffer in self._tracks)
+                self._flush(write, max(settled, self._cursor + buffered - self.max_buffer))
+
+            # Whatever is left, including agent speech that runs past the end of the call
+            self._flush(write, self._cursor + max(len(buffer) for buffer in self._tracks))
+            logger.info(f"Recording saved: {self.path}")
+
+        except Exception as e:
+            logger.error(f"Error writing recording: {str(e)}")
+
+        finally:
+            try:
+                close_encoder()
+            except Exception as e:
+                logger.error(f"Error closing recording: {str(e)}")
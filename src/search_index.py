@@ -0,0 +1,123 @@
+"""
+Full-text search over call transcripts
+Inverted index kept in SQLite FTS5 and updated as transcripts are saved
+"""
+import logging
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    id INTEGER PRIMARY KEY,
+    call_id TEXT NOT NULL UNIQUE,
+    timestamp TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_docs_timestamp ON docs (timestamp);
+CREATE VIRTUAL TABLE IF NOT EXISTS transcripts USING fts5 (content, tokenize = 'porter unicode61');
+"""
+
+# Query terms; everything else (operators, quotes) is dropped so input can't break FTS syntax
+TERM = re.compile(r"\w+")
+
+
+class TranscriptIndex:
+    """Incrementally updated inverted index of transcripts"""
+
+    def __init__(self, path: str):
+        """
+        Open (or create) the index
+
+        Args:
+            path: SQLite database file for the index
+        """
+        self.path = path
+        self.is_new = not os.path.exists(path)
+        self._local = threading.local()
+
+        with self._connection() as conn:
+            conn.executescript(SCHEMA)
+        logger.info(f"Initialized TranscriptIndex: {path}")
+
+    def _connection(self) -> sqlite3.Connection:
+        """One connection per thread"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def index(self, call_id: str, transcript: str, timestamp: Optional[datetime] = None):
+        """
+        Add or replace a call's transcript
+
+        Args:
+            call_id: Call ID
+            transcript: Transcript text
+            timestamp: When the call took place (defaults to now)
+        """
+        timestamp = (timestamp or datetime.now()).isoformat()
+        conn = self._connection()
+        with conn:
+            row = conn.execute("SELECT id FROM docs WHERE call_id = ?", (call_id,)).fetchone()
+            if row:
+                conn.execute("DELETE FROM transcripts WHERE rowid = ?", (row['id'],))
+                conn.execute("UPDATE docs SET timestamp = ? WHERE id = ?", (timestamp, row['id']))
+                doc_id = row['id']
+            else:
+                doc_id = conn.execute(
+                    "INSERT INTO docs (call_id, timestamp) VALUES (?, ?)", (call_id, timestamp)
+                ).lastrowid
+            conn.execute("INSERT INTO transcripts (rowid, content) VALUES (?, ?)", (doc_id, transcript))
+
+    def search(self, query: str, since: Optional[datetime] = None,
+               until: Optional[datetime] = None, limit: int = 20) -> List[Dict]:
+        """
+        Find calls whose transcripts contain every query term
+
+        Args:
+            query: Search terms
+            since: Only calls at or after this time
+            until: Only calls at or before this time
+            limit: Maximum number of results
+
+        Returns:
+            Results ranked by relevance, each with call_id, timestamp, score and snippet
+        """
+        terms = TERM.findall(query)
+        if not terms:
+            return []
+
+        match = " ".join(f'"{term}"' for term in terms)
+        rows = self._connection().execute(
+            """SELECT docs.call_id, docs.timestamp, bm25(transcripts) AS rank,
+                      snippet(transcripts, 0, '[', ']', '...', 12) AS snippet
+               FROM transcripts JOIN docs ON docs.id = transcripts.rowid
+               WHERE transcripts MATCH ? AND docs.timestamp >= ? AND docs.timestamp <= ?
+               ORDER BY rank LIMIT ?""",
+            (
+                match,
+                since.isoformat() if since else "",
+                until.isoformat() if until else "9999",
+                limit
+            )
+        ).fetchall()
+
+        return [
+            {
+                "call_id": row['call_id'],
+                "timestamp": row['timestamp'],
+                # bm25 is lower-is-better; flip it so higher scores rank first
+                "score": round(-row['rank'], 6),
+                "snippet": row['snippet']
+            }
+            for row in rows
+        ]
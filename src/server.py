@@ -2,10 +2,13 @@
 Main server for AI Calling Agent
 Handles WebSocket connections and orchestrates all components
 """
+import itertools
 import os
 import sys
 import logging
+import threading
 from datetime import datetime
+from typing import Dict, Optional
 from flask import Flask, request, jsonify
 from flask_cors import CORS
 from flask_socketio import SocketIO, emit
@@ -16,10 +19,18 @@ import wave
 
 # Import our modules
 from config import Config
-from stt import SpeechToText
-from tts import TextToSpeech
-from ai_handler import ConversationHandler
-from storage import DataStorage
+from stt_service import WhisperService
+from tts import TextToSpeech, TTSService
+from tts_cache import AudioCache
+from ai_handler import ConversationHandler, template_phrases
+from storage import DataStorage, render_transcript
+from sqlite_storage import SQLiteStorage
+from pipeline import TurnPipeline
+from vad import VoiceActivityDetector
+from greeting_pool import GreetingPool
+from summary_queue import SummaryQueue
+from recorder import CallRecorder, recording_extension
+from audio_frames import CODEC_PCM16, negotiate_transport, speech_payload, unpack_frame
 
 # Configure logging
 logging.basicConfig(
@@ -28,47 +39,107 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Caller audio must arrive as 16 kHz mono PCM, which Whisper and the VAD expect
+SAMPLE_RATE = 16000
+
 # Initialize Flask app
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'ai-calling-agent-secret'
 CORS(app)
 socketio = SocketIO(app, cors_allowed_origins="*")
 
-# Validate configuration
-try:
-    Config.validate()
-except ValueError as e:
-    logger.error(f"Configuration error: {str(e)}")
-    sys.exit(1)
-
-# Initialize components
-stt = SpeechToText(model_name=Config.STT_MODEL)
-tts = TextToSpeech(rate=Config.TTS_RATE, volume=Config.TTS_VOLUME)
-storage = DataStorage(data_dir=Config.DATA_DIR)
-
-# Active call sessions
+# Components are built by init_components(), not at import time: Whisper worker
+# processes are spawned and re-import this module as __mp_main__
+stt_service = None
+tts_cache = None
+tts = None
+storage = None
+greeting_pool = None
+summary_queue = None
+pipeline = None
+
+# Active call sessions; end_call claims a call by removing it under the lock
 active_calls = {}
+active_calls_lock = threading.Lock()
 
 
 class CallSession:
     """Represents an active call session"""
 
-    def __init__(self, session_id: str):
+    def __init__(self, session_id: str, audio_transport: str = 'base64'):
         self.session_id = session_id
+        self.audio_transport = audio_transport
+        self.outbound_seq = itertools.count()
+        self.inbound_seq = None
         self.conversation_handler = ConversationHandler(
             api_key=Config.ANTHROPIC_API_KEY,
-            model=Config.AI_MODEL
+            model=Config.AI_MODEL,
+            prompt_caching=Config.PROMPT_CACHING,
+            max_context_turns=Config.CONTEXT_MAX_TURNS,
+            context_token_budget=Config.CONTEXT_TOKEN_BUDGET
         )
         self.start_time = datetime.now()
-        self.audio_chunks = []
+        self.transcriber = stt_service.stream(
+            partial_interval=Config.STT_PARTIAL_INTERVAL,
+            max_utterance=Config.STT_MAX_UTTERANCE_SECONDS
+        )
+        # Incoming chunks are decoded into this instead of a fresh array each time
+        self._chunk_buffer = np.zeros(SAMPLE_RATE, dtype=np.float32)
+        self.audio_received = 0
+        self.vad = VoiceActivityDetector(
+            energy_threshold_db=Config.VAD_ENERGY_THRESHOLD_DB,
+            hangover_ms=Config.VAD_HANGOVER_MS,
+            min_speech_ms=Config.VAD_MIN_SPEECH_MS
+        ) if Config.VAD_ENABLED else None
+        self.draft_requested = False
         self.is_active = True
 
-        logger.info(f"Created call session: {session_id}")
+        # Turns are journaled as they happen so an interrupted call can be recovered
+        self.call_id = storage.new_call_id()
+        self.journal = storage.open_journal(self.call_id)
+        self.journal.append({
+            "type": "start",
+            "session_id": session_id,
+            "start_time": self.start_time.isoformat()
+        })
+
+        self.recorder = CallRecorder(
+            storage.recording_path(self.call_id, recording_extension(Config.RECORDING_FORMAT)),
+            fmt=Config.RECORDING_FORMAT,
+            dual_channel=Config.RECORDING_DUAL_CHANNEL,
+            max_buffer_seconds=Config.RECORDING_BUFFER_SECONDS
+        ) if Config.RECORDING_ENABLED else None
+
+        logger.info(f"Created call session: {session_id} ({self.call_id})")
 
     def get_duration(self):
         """Get call duration in seconds"""
         return (datetime.now() - self.start_time).total_seconds()
 
+    def decode_audio(self, audio_bytes) -> np.ndarray:
+        """
+        Decode 16-bit PCM into the session's reusable float32 chunk buffer
+
+        Args:
+            audio_bytes: Raw PCM (bytes or memoryview)
+
+        Returns:
+            View of the decoded samples; valid until the next chunk is decoded
+        """
+        pcm = np.frombuffer(audio_bytes, dtype=np.int16)
+        if pcm.size > self._chunk_buffer.size:
+            self._chunk_buffer = np.zeros(pcm.size, dtype=np.float32)
+
+        chunk = self._chunk_buffer[:pcm.size]
+        np.multiply(pcm, 1.0 / 32768, out=chunk)
+        self.audio_received += pcm.size
+        return chunk
+
+    def over_limit(self) -> bool:
+        """Whether the call has run, or been sent audio, past MAX_CALL_DURATION"""
+        return (self.get_duration() > Config.MAX_CALL_DURATION or
+                self.audio_received > Config.MAX_CALL_DURATION * SAMPLE_RATE)
+
 
 @app.route('/')
 def index():
@@ -85,6 +156,8 @@ def get_stats():
     """Get call statistics"""
     try:
         stats = storage.get_statistics()
+        if tts_cache:
+            stats['tts_cache'] = tts_cache.stats()
         return jsonify(stats)
     except Exception as e:
         logger.error(f"Error getting stats: {str(e)}")
@@ -93,16 +166,58 @@ def get_stats():
 
 @app.route('/api/calls')
 def list_calls():
-    """List recent calls"""
+    """
+    List calls, newest first
+
+    Query parameters:
+        limit: Page size
+        after: Call ID of the last call on the previous page (keyset cursor)
+        fields: Comma-separated fields to return, e.g. call_id,timestamp,duration,outcome
+    """
     try:
         limit = request.args.get('limit', 20, type=int)
-        calls = storage.list_calls(limit=limit)
-        return jsonify(calls)
+        after = request.args.get('after')
+        fields = [field for field in request.args.get('fields', '').split(',') if field] or None
+        if fields and 'call_id' not in fields:
+            # The cursor is a call ID
+            fields.insert(0, 'call_id')
+
+        calls = storage.list_calls_page(limit=limit, after=after, fields=fields)
+        response = jsonify(calls)
+        if len(calls) == limit:
+            response.headers['X-Next-After'] = calls[-1]['call_id']
+        return response
     except Exception as e:
         logger.error(f"Error listing calls: {str(e)}")
         return jsonify({"error": str(e)}), 500
 
 
+@app.route('/api/search')
+def search_calls():
+    """
+    Search call transcripts
+
+    Query parameters:
+        q: Search terms (all must match)
+        since: ISO date/time lower bound
+        until: ISO date/time upper bound
+        limit: Maximum number of results
+    """
+    try:
+        query = request.args.get('q', '')
+        limit = request.args.get('limit', 20, type=int)
+        try:
+            since = datetime.fromisoformat(request.args['since']) if request.args.get('since') else None
+            until = datetime.fromisoformat(request.args['until']) if request.args.get('until') else None
+        except ValueError:
+            return jsonify({"error": "since/until must be ISO dates"}), 400
+
+        return jsonify(storage.search(query, since=since, until=until, limit=limit))
+    except Exception as e:
+        logger.error(f"Error searching calls: {str(e)}")
+        return jsonify({"error": str(e)}), 500
+
+
 @app.route('/api/calls/<call_id>')
 def get_call(call_id):
     """Get specific call details"""
@@ -129,10 +244,9 @@ def handle_disconnect():
     """Handle client disconnection"""
     logger.info(f"Client disconnected: {request.sid}")
 
-    # Clean up call session if exists
+    # Save whatever the call got through
     if request.sid in active_calls:
-        call = active_calls[request.sid]
-        call.is_active = False
+        end_call(active_calls[request.sid], reason="disconnected")
         logger.info(f"Call session ended: {request.sid}")
 
 
@@ -143,26 +257,40 @@ def handle_start_call(data):
         session_id = request.sid
         logger.info(f"Starting call for session: {session_id}")
 
-        # Create new call session
-        call = CallSession(session_id)
-        active_calls[session_id] = call
+        # Binary audio frames if the client supports them, base64 JSON otherwise
+        transport = negotiate_transport((data or {}).get('transports'))
+        emit('audio_transport', {"transport": transport, "sample_rate": SAMPLE_RATE, "codec": "pcm16"})
 
-        # Generate initial greeting
-        greeting = call.conversation_handler.start_conversation()
+        # A repeated start_call replaces the running call; end it so its journal and recorder are closed
+        existing = active_calls.get(session_id)
+        if existing:
+            logger.warning(f"start_call during an active call, ending it: {existing.call_id}")
+            end_call(existing, reason="restarted")
 
-        # Convert to speech
-        logger.info("Generating greeting audio...")
-        audio_data = tts.get_audio_data(greeting)
-
-        # Send greeting
-        emit('agent_speaking', {
-            "text": greeting,
-            "audio": base64.b64encode(audio_data).decode('utf-8') if audio_data else None
-        })
-
-        emit('call_started', {"session_id": session_id, "greeting": greeting})
-
-        logger.info(f"Call started successfully: {session_id}")
+        # Create new call session
+        call = CallSession(session_id, audio_transport=transport)
+        with active_calls_lock:
+            active_calls[session_id] = call
+
+        # Answer straight from the warm pool when possible
+        pooled = greeting_pool.take() if greeting_pool else None
+        if pooled:
+            greeting, audio_data = pooled
+            call.conversation_handler.reset()
+            call.journal.append({"type": "turn", "role": "assistant", "content": greeting, "stage": 0})
+            if call.recorder and audio_data:
+                call.recorder.write_outbound(audio_data)
+
+            emit('agent_speaking', {
+                "text": greeting,
+                "audio": speech_payload(audio_data, call.audio_transport, next(call.outbound_seq)),
+                "segment": 0
+            })
+            emit('call_started', {"session_id": session_id, "greeting": greeting})
+            logger.info(f"Call started from greeting pool: {session_id}")
+        else:
+            # Greeting is generated and spoken by the pipeline workers
+            pipeline.submit_greeting(call)
 
     except Exception as e:
         logger.error(f"Error starting call: {str(e)}")
@@ -181,12 +309,57 @@ def handle_audio_chunk(data):
 
         call = active_calls[session_id]
 
-        # Decode audio data
-        audio_bytes = base64.b64decode(data['audio'])
-        call.audio_chunks.append(audio_bytes)
-
+        # Decode audio data: a binary frame, or base64 16-bit PCM from older clients
+        if isinstance(data, (bytes, bytearray)):
+            sequence, sample_rate, codec, audio_bytes = unpack_frame(data)
+            if codec != CODEC_PCM16 or sample_rate != SAMPLE_RATE:
+                emit('error', {"message": f"Unsupported audio frame (codec {codec}, {sample_rate} Hz)"})
+                return
+            if call.inbound_seq is not None and sequence != call.inbound_seq + 1:
+                logger.warning(f"Audio frames lost: expected {call.inbound_seq + 1}, got {sequence}")
+            call.inbound_seq = sequence
+        else:
+            audio_bytes = base64.b64decode(data['audio'])
+        audio_array = call.decode_audio(audio_bytes)
         logger.info(f"Received audio chunk ({len(audio_bytes)} bytes)")
 
+        if call.over_limit():
+            logger.warning(f"Call exceeded MAX_CALL_DURATION, ending: {call.call_id}")
+            end_call(call, reason="max_duration")
+            return
+
+        # Record everything the caller sent, including silence
+        if call.recorder:
+            call.recorder.write_inbound(audio_array)
+
+        # Drop silence and detect the end of the utterance on the server
+        end_of_speech = False
+        if call.vad:
+            audio_array, end_of_speech = call.vad.process(audio_array)
+
+        if call.transcriber.is_full():
+            # Already cut off; drop audio until the pipeline takes the utterance
+            end_of_speech = False
+        elif audio_array.size:
+            if not call.transcriber.add_audio(audio_array):
+                # Cut off a runaway utterance and answer what we have
+                logger.warning(f"Utterance reached STT_MAX_UTTERANCE_SECONDS: {session_id}")
+                if call.vad:
+                    call.vad.reset()
+                end_of_speech = True
+
+            # Draft the next reply while the user is still talking
+            if Config.SPECULATIVE_DRAFTS and not call.draft_requested:
+                call.draft_requested = True
+                pipeline.submit_draft(call, presynthesize=Config.SPECULATIVE_PRESYNTHESIZE and tts_cache is not None)
+
+        # Transcribe incrementally while the user is still talking
+        if call.transcriber.ready():
+            pipeline.submit_partial(call)
+
+        if end_of_speech:
+            finish_user_turn(call)
+
     except Exception as e:
         logger.error(f"Error handling audio chunk: {str(e)}")
         emit('error', {"message": str(e)})
@@ -204,53 +377,34 @@ def handle_user_finished_speaking():
 
         call = active_calls[session_id]
 
-        if not call.audio_chunks:
-            logger.warning("No audio chunks to process")
-            return
-
-        # Combine audio chunks
-        logger.info("Processing user audio...")
-        audio_data = b''.join(call.audio_chunks)
-        call.audio_chunks = []  # Clear chunks
+        if call.vad:
+            # The server already ended this utterance on its own
+            if not call.vad.in_speech:
+                return
+            # Speech too short for the VAD to pass on still counts when the client says it's done
+            audio_array = call.vad.flush()
+            if audio_array.size and not call.transcriber.is_full():
+                call.transcriber.add_audio(audio_array)
 
-        # Convert audio bytes to numpy array
-        # Assuming 16-bit PCM audio
-        audio_array = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32) / 32768.0
+        finish_user_turn(call)
 
-        # Transcribe
-        emit('processing', {"status": "transcribing"})
-        transcribed_text = stt.transcribe(audio_array)
-
-        if not transcribed_text:
-            emit('error', {"message": "Failed to transcribe audio"})
-            return
-
-        logger.info(f"Transcribed: {transcribed_text}")
-        emit('user_spoke', {"text": transcribed_text})
+    except Exception as e:
+        logger.error(f"Error processing speech: {str(e)}")
+        emit('error', {"message": str(e)})
 
-        # Generate AI response
-        emit('processing', {"status": "generating_response"})
-        response = call.conversation_handler.process_response(transcribed_text)
 
-        if response is None:
-            # Conversation ended
-            logger.info("Conversation completed")
-            end_call(call)
-            return
+def finish_user_turn(call: CallSession):
+    """Hand the buffered utterance to the turn pipeline"""
+    if not call.transcriber.has_audio():
+        logger.warning("No audio chunks to process")
+        return
 
-        # Convert response to speech
-        emit('processing', {"status": "generating_audio"})
-        audio_data = tts.get_audio_data(response)
+    logger.info("Processing user audio...")
+    call.draft_requested = False
 
-        # Send response
-        emit('agent_speaking', {
-            "text": response,
-            "audio": base64.b64encode(audio_data).decode('utf-8') if audio_data else None
-        })
-
-    except Exception as e:
-        logger.error(f"Error processing speech: {str(e)}")
-        emit('error', {"message": str(e)})
+    # Transcription, response and speech run on the pipeline workers
+    if not pipeline.submit_turn(call):
+        socketio.emit('error', {"message": "Server busy, please repeat that"}, to=call.session_id)
 
 
 @socketio.on('end_call')
@@ -271,61 +425,208 @@ def handle_end_call():
         emit('error', {"message": str(e)})
 
 
-def end_call(call: CallSession):
-    """End call and save data"""
+def end_call(call: CallSession, reason: str = "completed"):
+    """
+    End call and queue it for saving and summarization
+
+    Args:
+        call: CallSession to end
+        reason: Why the call ended: completed, disconnected, max_duration or restarted
+    """
     try:
+        # The client, the pipeline, a disconnect and the watchdog can all end a call;
+        # only the first one to claim it does the work
+        with active_calls_lock:
+            if active_calls.get(call.session_id) is not call:
+                return
+            del active_calls[call.session_id]
         call.is_active = False
+        handler = call.conversation_handler
+        call_id = call.call_id
 
-        # Generate summary
-        logger.info("Generating call summary...")
-        summary = call.conversation_handler.get_conversation_summary()
+        call.journal.append({"type": "end"})
+        call.journal.close()
+        # Encoding finishes on the recorder's own thread
+        recording = call.recorder.close() if call.recorder else None
 
-        # Build transcript
-        transcript = ""
-        for msg in summary['conversation']:
-            role = "Agent" if msg["role"] == "assistant" else "HR Rep"
-            transcript += f"{role}: {msg['content']}\n"
-
-        # Save call data
-        call_data = {
+        # The journaled turns carry timestamps and stage latencies
+        call_data = storage.compact_journal(call_id) or {
             "session_id": call.session_id,
             "start_time": call.start_time.isoformat(),
-            "duration": call.get_duration(),
-            "conversation": summary['conversation'],
-            "summary": summary['summary'],
-            "stages_completed": summary['stages_completed'],
-            "total_exchanges": summary['total_exchanges']
+            "conversation": handler.conversation_history,
+            "total_exchanges": len(handler.conversation_history) // 2
         }
+        call_data.update({
+            "duration": call.get_duration(),
+            "summary": None,
+            "summary_status": "pending",
+            "outcome": handler.outcome.to_dict(),
+            "stages_completed": handler.current_stage,
+            "token_usage": handler.get_usage_totals(),
+            "recording": recording,
+            "end_reason": reason
+        })
+        transcript = render_transcript(call_data["conversation"])
 
-        call_id = storage.save_call(call_data)
-        storage.save_transcript(call_id, transcript)
-        storage.save_summary(call_id, summary)
+        # Summary is generated in the background and attached later
+        summary_queue.enqueue(call_id, call.session_id, call_data, transcript)
+        storage.discard_journal(call_id)
 
-        # Send summary to client
-        emit('call_ended', {
+        socketio.emit('call_ended', {
             "call_id": call_id,
             "duration": call.get_duration(),
-            "summary": summary['summary'],
-            "transcript": transcript
-        })
-
-        # Remove from active calls
-        if call.session_id in active_calls:
-            del active_calls[call.session_id]
+            "summary": None,
+            "transcript": transcript,
+            "reason": reason
+        }, to=call.session_id)
 
-        logger.info(f"Call ended and saved: {call_id}")
+        logger.info(f"Call ended, queued for summary: {call_id}")
 
     except Exception as e:
         logger.error(f"Error ending call: {str(e)}")
 
 
-if __name__ == '__main__':
+def handle_summary_ready(job: Dict, summary: Optional[Dict]):
+    """Push a finished summary to the client that made the call"""
+    if not job["session_id"]:
+        # Recovered call; nobody is waiting for it
+        return
+
+    socketio.emit('summary_ready', {
+        "call_id": job["call_id"],
+        "summary": summary['summary'] if summary else None,
+        "status": "ready" if summary else "failed"
+    }, to=job["session_id"])
+
+
+def recover_interrupted_calls():
+    """Queue calls whose journals outlived the process (crash or kill) for saving"""
+    for call_id in storage.pending_journals():
+        try:
+            if summary_queue.has_job(call_id):
+                # Ended normally; only the journal cleanup was missed
+                storage.discard_journal(call_id)
+                continue
+
+            call_data = storage.compact_journal(call_id)
+            if call_data and call_data["conversation"]:
+                call_data.update({
+                    "summary": None,
+                    "summary_status": "pending",
+                    "outcome": None,
+                    "token_usage": {}
+                })
+                summary_queue.enqueue(call_id, None, call_data, render_transcript(call_data["conversation"]))
+                logger.info(f"Recovered interrupted call: {call_id}")
+
+            storage.discard_journal(call_id)
+
+        except Exception as e:
+            logger.error(f"Error recovering call {call_id}: {str(e)}")
+
+
+def enforce_call_limits():
+    """End calls that run past MAX_CALL_DURATION, including ones whose client has gone quiet"""
+    while True:
+        socketio.sleep(5)
+        for call in list(active_calls.values()):
+            if call.over_limit():
+                logger.warning(f"Call exceeded MAX_CALL_DURATION, ending: {call.call_id}")
+                end_call(call, reason="max_duration")
+
+
+def init_components():
+    """Build the speech, storage and conversation components the handlers use"""
+    global stt_service, tts_cache, tts, storage, greeting_pool, summary_queue, pipeline
+
+    stt_service = WhisperService(
+        model_name=Config.STT_MODEL,
+        num_workers=Config.STT_WORKERS,
+        batch_window=Config.STT_BATCH_WINDOW_MS / 1000.0,
+        max_batch_size=Config.STT_MAX_BATCH,
+        result_timeout=Config.STT_RESULT_TIMEOUT
+    )
+    tts_cache = AudioCache(
+        cache_dir=os.path.join(Config.DATA_DIR, 'tts_cache'),
+        max_memory_bytes=Config.TTS_CACHE_MEMORY_MB * 1024 * 1024,
+        max_disk_bytes=Config.TTS_CACHE_DISK_MB * 1024 * 1024
+    ) if Config.TTS_CACHE_ENABLED else None
+    tts = TTSService(TextToSpeech(rate=Config.TTS_RATE, volume=Config.TTS_VOLUME, cache=tts_cache))
+
+    storage_options = dict(
+        journal_fsync_batch=Config.JOURNAL_FSYNC_BATCH,
+        journal_fsync_interval=Config.JOURNAL_FSYNC_INTERVAL
+    )
+    if Config.STORAGE_BACKEND == 'sqlite':
+        storage = SQLiteStorage(data_dir=Config.DATA_DIR, db_path=Config.SQLITE_PATH, **storage_options)
+    else:
+        storage = DataStorage(data_dir=Config.DATA_DIR, **storage_options)
+
+    greeting_pool = GreetingPool(
+        api_key=Config.ANTHROPIC_API_KEY,
+        model=Config.AI_MODEL,
+        tts=tts,
+        depth=Config.GREETING_POOL_SIZE,
+        refresh_interval=Config.GREETING_REFRESH_SECONDS
+    ) if Config.GREETING_POOL_SIZE > 0 else None
+
+    summary_queue = SummaryQueue(
+        storage,
+        handler_factory=lambda: ConversationHandler(
+            api_key=Config.ANTHROPIC_API_KEY,
+            model=Config.AI_MODEL,
+            prompt_caching=Config.PROMPT_CACHING
+        ),
+        on_ready=handle_summary_ready,
+        jobs_dir=os.path.join(Config.DATA_DIR, 'jobs', 'summaries'),
+        workers=Config.SUMMARY_WORKERS,
+        max_attempts=Config.SUMMARY_MAX_ATTEMPTS
+    )
+
+    pipeline = TurnPipeline(
+        socketio,
+        tts=tts,
+        on_conversation_complete=end_call,
+        # STT threads only wait on the Whisper service, so allow a full batch per process
+        stt_workers=stt_service.num_workers * Config.STT_MAX_BATCH,
+        llm_workers=Config.LLM_WORKERS,
+        max_pending_turns=Config.MAX_PENDING_TURNS
+    )
+
+
+def main():
+    """Validate configuration, start background work and run the server"""
+    try:
+        Config.validate()
+    except ValueError as e:
+        logger.error(f"Configuration error: {str(e)}")
+        sys.exit(1)
+
     logger.info("Starting AI Calling Agent server...")
     logger.info(f"Server: http://{Config.SERVER_HOST}:{Config.SERVER_PORT}")
 
+    init_components()
+    summary_queue.start()
+    recover_interrupted_calls()
+    socketio.start_background_task(enforce_call_limits)
+
+    # Load Whisper models before the first call arrives
+    stt_service.start()
+
+    # Render fixed template replies into the TTS cache
+    if tts_cache:
+        for phrase in template_phrases():
+            tts.submit(phrase)
+
+    # The reloader would run a second copy of everything above in a child process
     socketio.run(
         app,
         host=Config.SERVER_HOST,
         port=Config.SERVER_PORT,
-        debug=True
+        debug=True,
+        use_reloader=False
     )
+
+
+if __name__ == '__main__':
+    main()
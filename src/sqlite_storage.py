@@ -0,0 +1,467 @@
+"""
+SQLite storage backend for conversation logs
+Indexed alternative to the one-file-per-call JSON layout
+"""
+import json
+import logging
+import os
+import sqlite3
+import sys
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from ids import id_time
+from storage import DERIVED_SUMMARY_FIELDS, DataStorage, render_transcript
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS calls (
+    call_id TEXT PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    start_time TEXT,
+    duration REAL NOT NULL DEFAULT 0,
+    outcome TEXT,
+    summary_status TEXT,
+    stages_completed INTEGER,
+    total_exchanges INTEGER,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_calls_timestamp_id ON calls (timestamp, call_id);
+CREATE INDEX IF NOT EXISTS idx_calls_outcome ON calls (outcome);
+CREATE INDEX IF NOT EXISTS idx_calls_duration ON calls (duration);
+
+CREATE TABLE IF NOT EXISTS turns (
+    call_id TEXT NOT NULL REFERENCES calls (call_id) ON DELETE CASCADE,
+    turn_index INTEGER NOT NULL,
+    role TEXT NOT NULL,
+    content TEXT NOT NULL,
+    meta TEXT,
+    PRIMARY KEY (call_id, turn_index)
+);
+
+CREATE TABLE IF NOT EXISTS summaries (
+    call_id TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+"""
+
+# Fields stored in their own columns or tables rather than in the data blob
+COLUMN_FIELDS = ("call_id", "timestamp", "conversation")
+
+# Message fields stored in their own turn columns; the rest go in the meta blob
+TURN_FIELDS = ("role", "content")
+
+
+class SQLiteStorage(DataStorage):
+    """DataStorage backed by a single SQLite database in WAL mode"""
+
+    def __init__(self, data_dir: str = "./data", db_path: Optional[str] = None, **kwargs):
+        """
+        Initialize SQLite storage
+
+        Args:
+            data_dir: Directory for recordings, journals and other non-call files
+            db_path: Database file (defaults to calls.db in data_dir)
+            **kwargs: Passed on to DataStorage
+        """
+        self.db_path = db_path or os.path.join(data_dir, 'calls.db')
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+
+        # The schema must exist before the base class may rebuild statistics
+        with self._connection() as conn:
+            conn.executescript(SCHEMA)
+        super().__init__(data_dir=data_dir, **kwargs)
+        logger.info(f"Initialized SQLiteStorage with database: {self.db_path}")
+
+    def _stats_path(self) -> str:
+        """Statistics live next to the database, separate from the JSON backend's"""
+        return f"{os.path.splitext(self.db_path)[0]}_stats.json"
+
+    def _search_path(self) -> str:
+        """Search index lives next to the database, separate from the JSON backend's"""
+        return f"{os.path.splitext(self.db_path)[0]}_search.db"
+
+    def _check_legacy_files(self):
+        """Call files aren't used by this backend; JSON stores are imported with migrate_storage"""
+
+    def _load_manifest(self) -> Dict[str, int]:
+        """The timestamp index replaces the shard manifest"""
+        return {}
+
+    def _connection(self) -> sqlite3.Connection:
+        """One connection per thread; SQLite connections aren't shareable across threads"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            self._local.conn = conn
+        return conn
+
+    def _write_call(self, conn: sqlite3.Connection, call_data: Dict):
+        """Insert or update a call record and its turns"""
+        call_id = call_data['call_id']
+        blob = {key: value for key, value in call_data.items() if key not in COLUMN_FIELDS}
+        outcome = call_data.get('outcome')
+
+        conn.execute(
+            # An upsert rather than REPLACE, which would cascade-delete the turns
+            """INSERT INTO calls (call_id, timestamp, start_time, duration, outcome,
+                   summary_status, stages_completed, total_exchanges, data)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT (call_id) DO UPDATE SET
+                   timestamp = excluded.timestamp, start_time = excluded.start_time,
+                   duration = excluded.duration, outcome = excluded.outcome,
+                   summary_status = excluded.summary_status,
+                   stages_completed = excluded.stages_completed,
+                   total_exchanges = excluded.total_exchanges, data = excluded.data""",
+            (
+                call_id,
+                call_data['timestamp'],
+                call_data.get('start_time'),
+                call_data.get('duration', 0),
+                outcome.get('outcome') if isinstance(outcome, dict) else outcome,
+                call_data.get('summary_status'),
+                call_data.get('stages_completed'),
+                call_data.get('total_exchanges'),
+                json.dumps(blob, ensure_ascii=False)
+            )
+        )
+
+        if 'conversation' in call_data:
+            conn.execute("DELETE FROM turns WHERE call_id = ?", (call_id,))
+            conn.executemany(
+                "INSERT INTO turns (call_id, turn_index, role, content, meta) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (call_id, index, message['role'], message['content'], self._turn_meta(message))
+                    for index, message in enumerate(call_data['conversation'])
+                ]
+            )
+
+    @staticmethod
+    def _turn_meta(message: Dict) -> Optional[str]:
+        """Extra message fields (timestamps, latencies) as JSON"""
+        meta = {key: value for key, value in message.items() if key not in TURN_FIELDS}
+        return json.dumps(meta, ensure_ascii=False) if meta else None
+
+    def _load_calls(self, rows: List[sqlite3.Row]) -> List[Dict]:
+        """Rebuild call dictionaries from call rows plus their turns"""
+        if not rows:
+            return []
+
+        call_ids = [row['call_id'] for row in rows]
+        placeholders = ",".join("?" * len(call_ids))
+        conversations: Dict[str, List[Dict[str, str]]] = {call_id: [] for call_id in call_ids}
+        for turn in self._connection().execute(
+            f"SELECT call_id, role, content, meta FROM turns WHERE call_id IN ({placeholders}) "
+            f"ORDER BY call_id, turn_index",
+            call_ids
+        ):
+            message = {"role": turn['role'], "content": turn['content']}
+            if turn['meta']:
+                message.update(json.loads(turn['meta']))
+            conversations[turn['call_id']].append(message)
+
+        calls = []
+        for row in rows:
+            call_data = json.loads(row['data'])
+            call_data['call_id'] = row['call_id']
+            call_data['timestamp'] = row['timestamp']
+            call_data['conversation'] = conversations[row['call_id']]
+            calls.append(call_data)
+        return calls
+
+    def save_call(self, call_data: Dict, call_id: Optional[str] = None) -> str:
+        """
+        Save call data to the database
+
+        Args:
+            call_data: Dictionary containing call information
+            call_id: Previously allocated call ID (a new one is generated if omitted)
+
+        Returns:
+            Call ID
+        """
+        try:
+            call_id = call_id or self.new_call_id()
+
+            # Add metadata
+            call_data['call_id'] = call_id
+            call_data['timestamp'] = datetime.now().isoformat()
+
+            conn = self._connection()
+            with conn:
+                row = conn.execute(
+                    "SELECT call_id, timestamp, data FROM calls WHERE call_id = ?", (call_id,)
+                ).fetchone()
+                previous = self._load_calls([row])[0] if row else None
+                self._write_call(conn, call_data)
+
+            if previous is None:
+                self.stats.record(call_data)
+            else:
+                # Re-saving a call must not count it twice
+                self.stats.replace(previous, call_data)
+            logger.info(f"Saved call data: {call_id}")
+            return call_id
+
+        except Exception as e:
+            logger.error(f"Error saving call data: {str(e)}")
+            raise
+
+    def import_call(self, call_data: Dict, transcript: Optional[str] = None,
+                    summary: Optional[Dict] = None):
+        """
+        Store an existing call record unchanged (used by the migration tool)
+
+        Args:
+            call_data: Call record including call_id and timestamp
+            transcript: Transcript text, if any
+            summary: Summary data, if any
+        """
+        conn = self._connection()
+        with conn:
+            self._write_call(conn, call_data)
+            if summary is not None:
+                summary = {key: value for key, value in summary.items() if key not in DERIVED_SUMMARY_FIELDS}
+                conn.execute("INSERT OR REPLACE INTO summaries (call_id, data) VALUES (?, ?)",
+                             (call_data['call_id'], json.dumps(summary, ensure_ascii=False)))
+
+        # The transcript is derived from the turns; it is only needed for search
+        if transcript is not None:
+            self.search_index.index(call_data['call_id'], transcript, id_time(call_data['call_id']))
+
+    def get_call(self, call_id: str) -> Optional[Dict]:
+        """
+        Retrieve call data by ID
+
+        Args:
+            call_id: Call ID to retrieve
+
+        Returns:
+            Call data dictionary or None if not found
+        """
+        try:
+            row = self._connection().execute(
+                "SELECT call_id, timestamp, data FROM calls WHERE call_id = ?", (call_id,)
+            ).fetchone()
+
+            if row is None:
+                logger.warning(f"Call not found: {call_id}")
+                return None
+
+            return self._load_calls([row])[0]
+
+        except Exception as e:
+            logger.error(f"Error retrieving call data: {str(e)}")
+            return None
+
+    def update_call(self, call_id: str, updates: Dict) -> bool:
+        """
+        Merge fields into a saved call record
+
+        Args:
+            call_id: Call ID to update
+            updates: Fields to set
+
+        Returns:
+            True if the call was found and updated
+        """
+        try:
+            conn = self._connection()
+            with conn:
+                row = conn.execute(
+                    "SELECT call_id, timestamp, data FROM calls WHERE call_id = ?", (call_id,)
+                ).fetchone()
+
+                if row is None:
+                    logger.warning(f"Call not found: {call_id}")
+                    return False
+
+                call_data = json.loads(row['data'])
+                call_data['call_id'] = row['call_id']
+                call_data['timestamp'] = row['timestamp']
+                previous = dict(call_data)
+                call_data.update(updates)
+                self._write_call(conn, call_data)
+
+            self.stats.replace(previous, call_data)
+
+            logger.info(f"Updated call data: {call_id}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error updating call data: {str(e)}")
+            return False
+
+    def list_calls(self, limit: int = 100, since: Optional[datetime] = None,
+                   until: Optional[datetime] = None) -> List[Dict]:
+        """
+        List recent calls
+
+        Args:
+            limit: Maximum number of calls to return
+            since: Only calls saved at or after this time
+            until: Only calls saved at or before this time
+
+        Returns:
+            List of call data dictionaries, newest first
+        """
+        try:
+            rows = self._connection().execute(
+                "SELECT call_id, timestamp, data FROM calls WHERE timestamp >= ? AND timestamp <= ? "
+                "ORDER BY timestamp DESC LIMIT ?",
+                (
+                    since.isoformat() if since else "",
+                    until.isoformat() if until else "9999",
+                    min(limit, sys.maxsize)
+                )
+            ).fetchall()
+            return self._load_calls(rows)
+
+        except Exception as e:
+            logger.error(f"Error listing calls: {str(e)}")
+            return []
+
+    def list_calls_page(self, limit: int = 20, after: Optional[str] = None,
+                        fields: Optional[List[str]] = None) -> List[Dict]:
+        """
+        List calls older than a cursor, optionally projected to a few fields
+
+        Turns are only read when the conversation is requested.
+
+        Args:
+            limit: Maximum number of calls to return
+            after: Call ID of the last call on the previous page
+            fields: Fields to return for each call (all fields if omitted)
+
+        Returns:
+            List of (projected) call dictionaries, newest first
+        """
+        try:
+            conn = self._connection()
+            query = "SELECT call_id, timestamp, data FROM calls"
+            params: list = []
+
+            if after:
+                cursor = conn.execute("SELECT timestamp FROM calls WHERE call_id = ?", (after,)).fetchone()
+                if cursor is None:
+                    return []
+                query += " WHERE (timestamp, call_id) < (?, ?)"
+                params += [cursor['timestamp'], after]
+
+            query += " ORDER BY timestamp DESC, call_id DESC LIMIT ?"
+            params.append(limit)
+            rows = conn.execute(query, params).fetchall()
+
+            if not fields or 'conversation' in fields:
+                calls = self._load_calls(rows)
+            else:
+                calls = []
+                for row in rows:
+                    call_data = json.loads(row['data'])
+                    call_data['call_id'] = row['call_id']
+                    call_data['timestamp'] = row['timestamp']
+                    calls.append(call_data)
+
+            if fields:
+                calls = [{field: call_data.get(field) for field in fields} for call_data in calls]
+            return calls
+
+        except Exception as e:
+            logger.error(f"Error listing calls: {str(e)}")
+            return []
+
+    def save_transcript(self, call_id: str, transcript: str):
+        """
+        Make a call's transcript searchable
+
+        The transcript itself is derived from the call's turns, so nothing else is written.
+
+        Args:
+            call_id: Call ID
+            transcript: Transcript text
+        """
+        try:
+            self.search_index.index(call_id, transcript, id_time(call_id))
+            logger.info(f"Indexed transcript: {call_id}")
+
+        except Exception as e:
+            logger.error(f"Error indexing transcript: {str(e)}")
+
+    def get_transcript(self, call_id: str) -> Optional[str]:
+        """
+        Retrieve a call's transcript
+
+        Args:
+            call_id: Call ID
+
+        Returns:
+            Transcript text or None if not found
+        """
+        conn = self._connection()
+        if conn.execute("SELECT 1 FROM calls WHERE call_id = ?", (call_id,)).fetchone() is None:
+            return None
+
+        turns = conn.execute(
+            "SELECT role, content FROM turns WHERE call_id = ? ORDER BY turn_index", (call_id,)
+        ).fetchall()
+        return render_transcript([dict(turn) for turn in turns])
+
+    def get_summary(self, call_id: str) -> Optional[Dict]:
+        """
+        Retrieve a call's summary
+
+        Args:
+            call_id: Call ID
+
+        Returns:
+            Summary data or None if the call has no summary yet
+        """
+        call_data = self.get_call(call_id)
+        if call_data is None:
+            return None
+
+        row = self._connection().execute(
+            "SELECT data FROM summaries WHERE call_id = ?", (call_id,)
+        ).fetchone()
+        summary = json.loads(row['data']) if row else {}
+        if call_data.get('summary') is None and not summary:
+            return None
+
+        summary.update({
+            "conversation": call_data.get('conversation', []),
+            "summary": call_data.get('summary', summary.get('summary')),
+            "outcome": call_data.get('outcome', summary.get('outcome')),
+            "stages_completed": call_data.get('stages_completed'),
+            "total_exchanges": call_data.get('total_exchanges'),
+            "token_usage": call_data.get('token_usage', summary.get('token_usage'))
+        })
+        return summary
+
+    def save_summary(self, call_id: str, summary: Dict):
+        """
+        Save conversation summary
+
+        Args:
+            call_id: Call ID
+            summary: Summary data
+        """
+        # Conversation and counters are already stored with the call
+        summary = {key: value for key, value in summary.items() if key not in DERIVED_SUMMARY_FIELDS}
+
+        try:
+            conn = self._connection()
+            with conn:
+                conn.execute("INSERT OR REPLACE INTO summaries (call_id, data) VALUES (?, ?)",
+                             (call_id, json.dumps(summary, ensure_ascii=False)))
+
+            logger.info(f"Saved summary: {call_id}")
+
+        except Exception as e:
+            logger.error(f"Error saving summary: {str(e)}")
@@ -1,66 +1,548 @@
 """
 Data Storage module for conversation logs
 """
+import gzip
 import json
 import os
 import logging
+import sys
+import threading
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from call_journal import CallJournal, read_journal
+from call_stats import CallStatistics
+from ids import id_time, new_ulid
+from search_index import TranscriptIndex
 
 logger = logging.getLogger(__name__)
 
+# Shard for call IDs that don't encode a date
+UNDATED_SHARD = "undated"
+
+# Each call is one compressed record; transcript and summary views are derived from it
+RECORD_EXT = ".json.gz"
+
+# Per-call files written before records were packed, and their extensions
+LEGACY_FILES = {"calls": ".json", "transcripts": ".txt", "summaries": ".json"}
+
+# Summary fields that are copies of the call record
+DERIVED_SUMMARY_FIELDS = ("conversation", "stages_completed", "total_exchanges")
+
+# Small per-call fields kept in each shard's header index
+HEADER_FIELDS = ("call_id", "session_id", "timestamp", "start_time", "duration", "outcome",
+                 "summary_status", "stages_completed", "total_exchanges")
+HEADER_INDEX = "headers.idx"
+
+
+def _sort_key(call_id: str):
+    """Order calls by creation time; legacy and ULID IDs don't sort together as strings"""
+    return id_time(call_id) or datetime.min, call_id
+
+
+def _project(record: Dict, fields: Optional[List[str]]) -> Dict:
+    """Keep only the requested fields of a record"""
+    if not fields:
+        return record
+    return {field: record.get(field) for field in fields}
+
+
+def _read_record(path: str) -> Dict:
+    """Load a compressed call record"""
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_record(path: str, record: Dict):
+    """Write a compressed call record atomically"""
+    tmp_path = f"{path}.tmp"
+    with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+        json.dump(record, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, path)
+
+
+def render_transcript(conversation: List[Dict]) -> str:
+    """
+    Format a conversation as a plain-text transcript
+
+    Args:
+        conversation: Conversation history messages
+
+    Returns:
+        One "Speaker: text" line per message
+    """
+    transcript = ""
+    for msg in conversation:
+        role = "Agent" if msg["role"] == "assistant" else "HR Rep"
+        transcript += f"{role}: {msg['content']}\n"
+    return transcript
+
+
+def iter_call_records(data_dir: str) -> Iterator[Dict]:
+    """
+    Read every compressed call record under a data directory without opening a store
+
+    Args:
+        data_dir: Data directory containing calls/
+
+    Yields:
+        Call records
+    """
+    for root, _, files in os.walk(os.path.join(data_dir, 'calls')):
+        for filename in sorted(files):
+            if not filename.endswith(RECORD_EXT):
+                continue
+            try:
+                yield _read_record(os.path.join(root, filename))
+            except Exception as e:
+                logger.error(f"Error reading call record {filename}: {str(e)}")
+
+
+def iter_legacy_calls(data_dir: str) -> Iterator[Tuple[Dict, List[str]]]:
+    """
+    Read calls stored as separate call, transcript and summary files
+
+    Handles both the original flat directories and the date-sharded JSON layout.
+    Nothing is written.
+
+    Args:
+        data_dir: Data directory containing calls/, transcripts/ and summaries/
+
+    Yields:
+        Tuple of (call record with its summary fields merged in, paths of its files)
+    """
+    for root, _, files in os.walk(os.path.join(data_dir, 'calls')):
+        for filename in sorted(files):
+            if not filename.endswith(LEGACY_FILES['calls']) or filename == 'manifest.json':
+                continue
+
+            call_id = filename[:-len(LEGACY_FILES['calls'])]
+            call_path = os.path.join(root, filename)
+            try:
+                with open(call_path, 'r', encoding='utf-8') as f:
+                    call_data = json.load(f)
+                call_data.setdefault('call_id', call_id)
+
+                legacy_paths = [call_path]
+                summary = None
+                shard = DataStorage._shard(call_id).split("/")
+                for kind in ('transcripts', 'summaries'):
+                    for path in (
+                        os.path.join(data_dir, kind, f"{call_id}{LEGACY_FILES[kind]}"),
+                        os.path.join(data_dir, kind, *shard, f"{call_id}{LEGACY_FILES[kind]}")
+                    ):
+                        if os.path.exists(path):
+                            legacy_paths.append(path)
+                            if kind == 'summaries':
+                                with open(path, 'r', encoding='utf-8') as f:
+                                    summary = json.load(f)
+
+                # The transcript is a rendering of the conversation; only the summary adds anything
+                if summary:
+                    for key, value in summary.items():
+                        if key not in DERIVED_SUMMARY_FIELDS and call_data.get(key) is None:
+                            call_data[key] = value
+
+            except Exception as e:
+                logger.error(f"Error reading legacy call {call_id}: {str(e)}")
+                continue
+
+            yield call_data, legacy_paths
+
 
 class DataStorage:
     """Handles storing and retrieving conversation data"""
 
-    def __init__(self, data_dir: str = "./data"):
+    def __init__(self, data_dir: str = "./data", journal_fsync_batch: int = 8,
+                 journal_fsync_interval: float = 1.0):
         """
         Initialize data storage
 
         Args:
             data_dir: Directory to store data files
+            journal_fsync_batch: Call journal records written between fsyncs
+            journal_fsync_interval: Longest time in seconds a journal record waits for fsync
         """
         self.data_dir = data_dir
+        self.journal_fsync_batch = journal_fsync_batch
+        self.journal_fsync_interval = journal_fsync_interval
         self.ensure_directories()
+
+        self._index_lock = threading.RLock()
+        self._manifest_path = os.path.join(data_dir, 'calls', 'manifest.json')
+        self._manifest = self._load_manifest()
+        self._check_legacy_files()
+
+        self.stats = CallStatistics(self._stats_path())
+        if self.stats.is_new:
+            self.rebuild_statistics()
+
+        self.search_index = TranscriptIndex(self._search_path())
+        if self.search_index.is_new:
+            self.rebuild_search_index()
         logger.info(f"Initialized DataStorage with directory: {data_dir}")
 
+    def _stats_path(self) -> str:
+        """File the running statistics are persisted to"""
+        return os.path.join(self.data_dir, 'stats.json')
+
+    def rebuild_statistics(self):
+        """Recompute aggregates from every saved call (done once when no stats file exists)"""
+        self.stats.reset()
+        calls = self.list_calls(limit=sys.maxsize)
+        for call_data in calls:
+            self.stats.record(call_data, persist=False)
+        self.stats.flush()
+        logger.info(f"Rebuilt statistics from {len(calls)} calls")
+
+    def _search_path(self) -> str:
+        """Database file of the transcript search index"""
+        return os.path.join(self.data_dir, 'search.db')
+
+    def rebuild_search_index(self):
+        """Index every stored transcript (done once when no index exists)"""
+        indexed = 0
+        for call in self.list_calls_page(limit=sys.maxsize, fields=['call_id']):
+            transcript = self.get_transcript(call['call_id'])
+            if transcript:
+                self.search_index.index(call['call_id'], transcript, id_time(call['call_id']))
+                indexed += 1
+        logger.info(f"Indexed {indexed} transcripts for search")
+
+    def search(self, query: str, since: Optional[datetime] = None,
+               until: Optional[datetime] = None, limit: int = 20) -> List[Dict]:
+        """
+        Full-text search over transcripts
+
+        Args:
+            query: Search terms (all must match)
+            since: Only calls at or after this time
+            until: Only calls at or before this time
+            limit: Maximum number of results
+
+        Returns:
+            Ranked results with call_id, timestamp, score and snippet
+        """
+        return self.search_index.search(query, since=since, until=until, limit=limit)
+
     def ensure_directories(self):
         """Create necessary directories if they don't exist"""
         directories = [
             self.data_dir,
             os.path.join(self.data_dir, 'recordings'),
-            os.path.join(self.data_dir, 'transcripts'),
-            os.path.join(self.data_dir, 'summaries'),
-            os.path.join(self.data_dir, 'calls')
+            os.path.join(self.data_dir, 'calls'),
+            os.path.join(self.data_dir, 'journals')
         ]
 
         for directory in directories:
             os.makedirs(directory, exist_ok=True)
 
-    def save_call(self, call_data: Dict) -> str:
+    def new_call_id(self) -> str:
+        """
+        Allocate an ID for a call that will be saved later
+
+        Returns:
+            Call ID (ULID: unique and sortable by creation time)
+        """
+        return new_ulid()
+
+    @staticmethod
+    def _shard(call_id: str) -> str:
+        """Date shard (YYYY/MM/DD) a call's files live in"""
+        created = id_time(call_id)
+        return created.strftime("%Y/%m/%d") if created else UNDATED_SHARD
+
+    def _record_path(self, call_id: str) -> str:
+        """Location of a call's record"""
+        return os.path.join(self._shard_dir(self._shard(call_id)), f"{call_id}{RECORD_EXT}")
+
+    def _check_legacy_files(self):
+        """Point at the packing command when only legacy per-call files are present"""
+        if self._manifest:
+            return
+
+        for kind in ('transcripts', 'summaries'):
+            path = os.path.join(self.data_dir, kind)
+            if os.path.isdir(path) and any(True for _ in os.scandir(path)):
+                logger.warning(
+                    f"Found legacy call files in {self.data_dir}; run "
+                    f"'python src/pack_legacy_calls.py --data-dir {self.data_dir}' to import them"
+                )
+                return
+
+    def pack_legacy_calls(self, backup_dir: Optional[str] = None) -> int:
+        """
+        Pack calls stored as separate call, transcript and summary files into records
+
+        Calls that already have a record are skipped, so packing can be re-run.
+        The original files are left in place unless a backup directory is given.
+
+        Args:
+            backup_dir: Directory the original files are moved to (keeping their layout)
+
+        Returns:
+            Number of calls packed
+        """
+        packed = 0
+        for call_data, legacy_paths in iter_legacy_calls(self.data_dir):
+            call_id = call_data['call_id']
+            path = self._record_path(call_id)
+            if os.path.exists(path):
+                continue
+
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                _write_record(path, call_data)
+
+                if backup_dir:
+                    for legacy_path in legacy_paths:
+                        target = os.path.join(backup_dir, os.path.relpath(legacy_path, self.data_dir))
+                        os.makedirs(os.path.dirname(target), exist_ok=True)
+                        os.replace(legacy_path, target)
+                packed += 1
+            except Exception as e:
+                logger.error(f"Error packing legacy call {call_id}: {str(e)}")
+
+        if packed:
+            # Counts, headers, statistics and search are rebuilt from the new records
+            with self._index_lock:
+                if os.path.exists(self._manifest_path):
+                    os.unlink(self._manifest_path)
+                for root, _, files in os.walk(os.path.join(self.data_dir, 'calls')):
+                    if HEADER_INDEX in files:
+                        os.unlink(os.path.join(root, HEADER_INDEX))
+                self._manifest = self._load_manifest()
+            self.rebuild_statistics()
+            self.rebuild_search_index()
+            logger.info(f"Packed {packed} legacy calls into compressed records")
+
+        return packed
+
+    def _load_manifest(self) -> Dict[str, int]:
+        """Read the shard manifest, rebuilding it from the directory tree if missing"""
+        if os.path.exists(self._manifest_path):
+            try:
+                with open(self._manifest_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except Exception as e:
+                logger.error(f"Error loading call manifest, rebuilding: {str(e)}")
+
+        manifest = {}
+        calls_dir = os.path.join(self.data_dir, 'calls')
+        for root, _, files in os.walk(calls_dir):
+            count = sum(1 for f in files if f.endswith(RECORD_EXT))
+            if count:
+                manifest[os.path.relpath(root, calls_dir).replace(os.sep, "/")] = count
+
+        self._write_manifest(manifest)
+        return manifest
+
+    def _write_manifest(self, manifest: Dict[str, int]):
+        """Persist the shard manifest atomically"""
+        tmp_path = f"{self._manifest_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self._manifest_path)
+
+    def _shard_dir(self, shard: str) -> str:
+        """Directory holding one shard's call files"""
+        return os.path.join(self.data_dir, 'calls', *shard.split("/"))
+
+    def _load_shard_index(self, shard: str) -> Dict[str, Dict]:
+        """
+        Read a shard's header index, rebuilding it from the call files if missing
+
+        Args:
+            shard: Shard name (YYYY/MM/DD)
+
+        Returns:
+            Call ID to header fields
+        """
+        path = os.path.join(self._shard_dir(shard), HEADER_INDEX)
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+
+        headers = {}
+        shard_dir = self._shard_dir(shard)
+        if os.path.isdir(shard_dir):
+            for filename in os.listdir(shard_dir):
+                if filename.endswith(RECORD_EXT):
+                    record = _read_record(os.path.join(shard_dir, filename))
+                    headers[filename[:-len(RECORD_EXT)]] = _project(record, HEADER_FIELDS)
+
+            with self._index_lock:
+                self._write_shard_index(shard, headers)
+        return headers
+
+    def _write_shard_index(self, shard: str, headers: Dict[str, Dict]):
+        """Persist a shard's header index atomically"""
+        path = os.path.join(self._shard_dir(shard), HEADER_INDEX)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(headers, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def _index_call(self, call_data: Dict, is_new: bool):
+        """Record a saved call's header in its shard index (and count new calls in the manifest)"""
+        call_id = call_data['call_id']
+        shard = self._shard(call_id)
+
+        with self._index_lock:
+            headers = self._load_shard_index(shard)
+            headers[call_id] = _project(call_data, HEADER_FIELDS)
+            self._write_shard_index(shard, headers)
+
+            if is_new:
+                self._manifest[shard] = self._manifest.get(shard, 0) + 1
+                self._write_manifest(self._manifest)
+
+    def _shards_newest_first(self, since: Optional[datetime] = None,
+                             until: Optional[datetime] = None) -> List[str]:
+        """Shards holding calls, newest first, limited to a date range"""
+        with self._index_lock:
+            shards = [shard for shard, count in self._manifest.items() if count > 0]
+
+        dated = sorted((shard for shard in shards if shard != UNDATED_SHARD), reverse=True)
+        if since:
+            dated = [shard for shard in dated if shard >= since.strftime("%Y/%m/%d")]
+        if until:
+            dated = [shard for shard in dated if shard <= until.strftime("%Y/%m/%d")]
+
+        # Undated calls can't be placed in a range
+        if UNDATED_SHARD in shards and not (since or until):
+            dated.append(UNDATED_SHARD)
+        return dated
+
+    def recording_path(self, call_id: str, extension: str) -> str:
+        """
+        Location of a call's audio recording
+
+        Args:
+            call_id: Call ID
+            extension: File extension including the dot, e.g. .flac
+
+        Returns:
+            Path under the recordings directory
+        """
+        return os.path.join(self.data_dir, 'recordings', f"{call_id}{extension}")
+
+    def _journal_path(self, call_id: str) -> str:
+        """Location of a call's journal"""
+        return os.path.join(self.data_dir, 'journals', f"{call_id}.jsonl")
+
+    def open_journal(self, call_id: str) -> CallJournal:
+        """
+        Open the append-only journal for a call in progress
+
+        Args:
+            call_id: Call ID allocated when the call started
+
+        Returns:
+            CallJournal to append turns to
+        """
+        return CallJournal(
+            self._journal_path(call_id),
+            fsync_batch=self.journal_fsync_batch,
+            fsync_interval=self.journal_fsync_interval
+        )
+
+    def compact_journal(self, call_id: str) -> Optional[Dict]:
+        """
+        Build a call record from a call's journal
+
+        Args:
+            call_id: Call ID
+
+        Returns:
+            Call data dictionary (without summary fields) or None if there is no journal
+        """
+        path = self._journal_path(call_id)
+        if not os.path.exists(path):
+            return None
+
+        records = read_journal(path)
+        if not records:
+            return None
+
+        start = next((record for record in records if record.get('type') == 'start'), {})
+        start_time = start.get('start_time', records[0]['ts'])
+
+        conversation = []
+        for record in records:
+            if record.get('type') != 'turn':
+                continue
+            message = {"role": record['role'], "content": record['content'], "timestamp": record['ts']}
+            for key in ('stage', 'latency_ms'):
+                if key in record:
+                    message[key] = record[key]
+            conversation.append(message)
+
+        duration = (datetime.fromisoformat(records[-1]['ts']) - datetime.fromisoformat(start_time)).total_seconds()
+
+        return {
+            "session_id": start.get('session_id'),
+            "start_time": start_time,
+            "duration": duration,
+            "conversation": conversation,
+            "stages_completed": max((message.get('stage', 0) for message in conversation), default=0),
+            "total_exchanges": len(conversation) // 2,
+            "completed": any(record.get('type') == 'end' for record in records)
+        }
+
+    def discard_journal(self, call_id: str):
         """
-        Save call data to JSON file
+        Delete a journal once its call has been handed off for saving
+
+        Args:
+            call_id: Call ID
+        """
+        try:
+            os.unlink(self._journal_path(call_id))
+        except FileNotFoundError:
+            pass
+
+    def pending_journals(self) -> List[str]:
+        """
+        Find journals left behind by calls that never finished (e.g. after a crash)
+
+        Returns:
+            Call IDs with a journal on disk
+        """
+        journals_dir = os.path.join(self.data_dir, 'journals')
+        return sorted(f[:-len('.jsonl')] for f in os.listdir(journals_dir) if f.endswith('.jsonl'))
+
+    def save_call(self, call_data: Dict, call_id: Optional[str] = None) -> str:
+        """
+        Save call data as a compressed record
 
         Args:
             call_data: Dictionary containing call information
+            call_id: Previously allocated call ID (a new one is generated if omitted)
 
         Returns:
             Call ID (filename without extension)
         """
         try:
-            # Generate call ID based on timestamp
-            call_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+            call_id = call_id or self.new_call_id()
 
             # Add metadata
             call_data['call_id'] = call_id
             call_data['timestamp'] = datetime.now().isoformat()
 
             # Save to file
-            filename = os.path.join(self.data_dir, 'calls', f"{call_id}.json")
-
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(call_data, f, indent=2, ensure_ascii=False)
-
+            filename = self._record_path(call_id)
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
+            is_new = not os.path.exists(filename)
+            previous = None if is_new else _read_record(filename)
+            _write_record(filename, call_data)
+
+            self._index_call(call_data, is_new)
+            if previous is None:
+                self.stats.record(call_data)
+            else:
+                # Re-saving a call must not count it twice
+                self.stats.replace(previous, call_data)
             logger.info(f"Saved call data: {call_id}")
             return call_id
 
@@ -79,41 +561,78 @@ class DataStorage:
             Call data dictionary or None if not found
         """
         try:
-            filename = os.path.join(self.data_dir, 'calls', f"{call_id}.json")
+            filename = self._record_path(call_id)
 
             if not os.path.exists(filename):
                 logger.warning(f"Call not found: {call_id}")
                 return None
 
-            with open(filename, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _read_record(filename)
 
         except Exception as e:
             logger.error(f"Error retrieving call data: {str(e)}")
             return None
 
-    def list_calls(self, limit: int = 100) -> List[Dict]:
+    def update_call(self, call_id: str, updates: Dict) -> bool:
+        """
+        Merge fields into a saved call record
+
+        Args:
+            call_id: Call ID to update
+            updates: Fields to set
+
+        Returns:
+            True if the call was found and updated
+        """
+        try:
+            filename = self._record_path(call_id)
+
+            if not os.path.exists(filename):
+                logger.warning(f"Call not found: {call_id}")
+                return False
+
+            call_data = _read_record(filename)
+            previous = dict(call_data)
+            call_data.update(updates)
+            _write_record(filename, call_data)
+
+            self._index_call(call_data, is_new=False)
+            self.stats.replace(previous, call_data)
+
+            logger.info(f"Updated call data: {call_id}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error updating call data: {str(e)}")
+            return False
+
+    def list_calls(self, limit: int = 100, since: Optional[datetime] = None,
+                   until: Optional[datetime] = None) -> List[Dict]:
         """
         List recent calls
 
+        Only the date shards needed to fill the page (and inside the range) are read.
+
         Args:
             limit: Maximum number of calls to return
+            since: Only calls started at or after this time
+            until: Only calls started at or before this time
 
         Returns:
-            List of call data dictionaries
+            List of call data dictionaries, newest first
         """
         try:
-            calls_dir = os.path.join(self.data_dir, 'calls')
-            files = [f for f in os.listdir(calls_dir) if f.endswith('.json')]
+            calls = []
 
-            # Sort by filename (timestamp) in descending order
-            files.sort(reverse=True)
+            for shard in self._shards_newest_first(since, until):
+                for call_id in sorted(self._load_shard_index(shard), key=_sort_key, reverse=True):
+                    created = id_time(call_id)
+                    if created and ((since and created < since) or (until and created > until)):
+                        continue
 
-            calls = []
-            for filename in files[:limit]:
-                filepath = os.path.join(calls_dir, filename)
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    calls.append(json.load(f))
+                    calls.append(_read_record(self._record_path(call_id)))
+                    if len(calls) >= limit:
+                        return calls
 
             return calls
 
@@ -121,70 +640,129 @@ class DataStorage:
             logger.error(f"Error listing calls: {str(e)}")
             return []
 
+    def list_calls_page(self, limit: int = 20, after: Optional[str] = None,
+                        fields: Optional[List[str]] = None) -> List[Dict]:
+        """
+        List calls older than a cursor, optionally projected to a few fields
+
+        Header fields are served from the shard indexes; call files are only
+        opened when other fields are requested.
+
+        Args:
+            limit: Maximum number of calls to return
+            after: Call ID of the last call on the previous page
+            fields: Fields to return for each call (all fields if omitted)
+
+        Returns:
+            List of (projected) call dictionaries, newest first
+        """
+        try:
+            headers_only = bool(fields) and all(field in HEADER_FIELDS for field in fields)
+            shards = self._shards_newest_first()
+            after_key = _sort_key(after) if after else None
+
+            # Newer shards can't contain anything past the cursor
+            if after and self._shard(after) in shards:
+                shards = shards[shards.index(self._shard(after)):]
+
+            page = []
+            for shard in shards:
+                headers = self._load_shard_index(shard)
+                for call_id in sorted(headers, key=_sort_key, reverse=True):
+                    if after_key and _sort_key(call_id) >= after_key:
+                        continue
+
+                    if headers_only:
+                        page.append(_project(headers[call_id], fields))
+                    else:
+                        call_data = self.get_call(call_id)
+                        if call_data:
+                            page.append(_project(call_data, fields))
+
+                    if len(page) >= limit:
+                        return page
+
+            return page
+
+        except Exception as e:
+            logger.error(f"Error listing calls: {str(e)}")
+            return []
+
     def save_transcript(self, call_id: str, transcript: str):
         """
-        Save conversation transcript
+        Make a call's transcript searchable
+
+        The transcript itself is derived from the call record, so nothing else is written.
 
         Args:
             call_id: Call ID
             transcript: Transcript text
         """
         try:
-            filename = os.path.join(self.data_dir, 'transcripts', f"{call_id}.txt")
-
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(transcript)
-
-            logger.info(f"Saved transcript: {call_id}")
+            self.search_index.index(call_id, transcript, id_time(call_id))
+            logger.info(f"Indexed transcript: {call_id}")
 
         except Exception as e:
-            logger.error(f"Error saving transcript: {str(e)}")
+            logger.error(f"Error indexing transcript: {str(e)}")
 
     def save_summary(self, call_id: str, summary: Dict):
         """
         Save conversation summary
 
+        Only fields that aren't already part of the call record are stored.
+
         Args:
             call_id: Call ID
             summary: Summary data
         """
-        try:
-            filename = os.path.join(self.data_dir, 'summaries', f"{call_id}.json")
+        self.update_call(call_id, {
+            key: value for key, value in summary.items() if key not in DERIVED_SUMMARY_FIELDS
+        })
 
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(summary, f, indent=2, ensure_ascii=False)
+    def get_transcript(self, call_id: str) -> Optional[str]:
+        """
+        Retrieve a call's transcript
 
-            logger.info(f"Saved summary: {call_id}")
+        Args:
+            call_id: Call ID
 
-        except Exception as e:
-            logger.error(f"Error saving summary: {str(e)}")
+        Returns:
+            Transcript text or None if not found
+        """
+        call_data = self.get_call(call_id)
+        if call_data is None:
+            return None
+        return render_transcript(call_data.get('conversation', []))
 
-    def get_statistics(self) -> Dict:
+    def get_summary(self, call_id: str) -> Optional[Dict]:
         """
-        Get overall statistics
+        Retrieve a call's summary
+
+        Args:
+            call_id: Call ID
 
         Returns:
-            Dictionary with statistics
+            Summary data or None if the call has no summary yet
         """
-        try:
-            calls = self.list_calls()
+        call_data = self.get_call(call_id)
+        if call_data is None or call_data.get('summary') is None:
+            return None
 
-            total_calls = len(calls)
-            total_duration = sum(call.get('duration', 0) for call in calls)
-            avg_duration = total_duration / total_calls if total_calls > 0 else 0
+        return {
+            "conversation": call_data.get('conversation', []),
+            "summary": call_data['summary'],
+            "outcome": call_data.get('outcome'),
+            "stages_completed": call_data.get('stages_completed'),
+            "total_exchanges": call_data.get('total_exchanges'),
+            "token_usage": call_data.get('token_usage')
+        }
 
-            return {
-                "total_calls": total_calls,
-                "total_duration_seconds": total_duration,
-                "average_duration_seconds": avg_duration,
-                "last_call": calls[0] if calls else None
-            }
+    def get_statistics(self) -> Dict:
+        """
+        Get overall statistics
 
-        except Exception as e:
-            logger.error(f"Error getting statistics: {str(e)}")
-            return {
-                "total_calls": 0,
-                "total_duration_seconds": 0,
-                "average_duration_seconds": 0,
-                "last_call": None
-            }
+        Returns:
+            Dictionary with totals, duration histogram, stage and outcome
+            counters, hourly/daily rollups and the last call
+        """
+        return self.stats.snapshot()
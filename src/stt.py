@@ -4,7 +4,9 @@ Speech-to-Text module using OpenAI Whisper
 import whisper
 import numpy as np
 import logging
-from typing import Optional
+from typing import List, Optional, Tuple
+
+from stt_stream import StreamingTranscriber
 
 logger = logging.getLogger(__name__)
 
@@ -71,6 +73,50 @@ class SpeechToText:
             logger.error(f"Transcription error: {str(e)}")
             return None
 
+    def transcribe_words(self, audio_data: np.ndarray) -> Optional[List[Tuple[str, float, float]]]:
+        """
+        Transcribe audio to words with timestamps
+
+        Args:
+            audio_data: Float32 audio data at 16 kHz
+
+        Returns:
+            List of (word, start, end) in seconds or None if transcription fails
+        """
+        try:
+            self.load_model()
+
+            result = self.model.transcribe(
+                audio_data.astype(np.float32, copy=False),
+                language="en",
+                task="transcribe",
+                fp16=False,
+                word_timestamps=True
+            )
+
+            return [
+                (word["word"], word["start"], word["end"])
+                for segment in result["segments"]
+                for word in segment.get("words", [])
+            ]
+
+        except Exception as e:
+            logger.error(f"Word transcription error: {str(e)}")
+            return None
+
+    def stream(self, partial_interval: float = 1.0, max_utterance: float = 30.0) -> StreamingTranscriber:
+        """
+        Create a streaming transcriber backed by this model
+
+        Args:
+            partial_interval: Seconds of new audio between partial decodes
+            max_utterance: Seconds of audio accepted per utterance
+
+        Returns:
+            StreamingTranscriber for one speaker
+        """
+        return StreamingTranscriber(self, partial_interval=partial_interval, max_utterance=max_utterance)
+
     def transcribe_file(self, audio_file: str) -> Optional[str]:
         """
         Transcribe audio from file
@@ -0,0 +1,408 @@
+"""
+Multi-process Speech-to-Text service using OpenAI Whisper
+Each worker process holds its own model; audio is handed over through
+shared memory and utterances arriving close together are decoded as a batch
+"""
+import itertools
+import logging
+import multiprocessing as mp
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from stt_stream import StreamingTranscriber
+
+logger = logging.getLogger(__name__)
+
+# Messages on the results queue: a worker picked up a job, or finished it
+RESULT_CLAIMED = "claimed"
+RESULT_DONE = "done"
+
+
+def _decode_batch(model, clips: List[np.ndarray]) -> List[str]:
+    """
+    Transcribe a batch of clips with a single decode where possible
+
+    Clips that fit in one 30 second Whisper window are decoded together;
+    longer clips fall back to the sliding-window transcribe.
+
+    Args:
+        model: Loaded Whisper model
+        clips: Float32 audio clips at 16 kHz
+
+    Returns:
+        Transcribed text for each clip
+    """
+    import torch
+    import whisper
+
+    texts: List[Optional[str]] = [None] * len(clips)
+
+    short = [i for i, clip in enumerate(clips) if len(clip) <= whisper.audio.N_SAMPLES]
+    if short:
+        mels = torch.stack([
+            whisper.log_mel_spectrogram(whisper.pad_or_trim(clips[i]), n_mels=model.dims.n_mels)
+            for i in short
+        ]).to(model.device)
+        options = whisper.DecodingOptions(
+            language="en",
+            task="transcribe",
+            fp16=False,
+            without_timestamps=True
+        )
+        for i, result in zip(short, whisper.decode(model, mels, options)):
+            texts[i] = result.text.strip()
+
+    for i, clip in enumerate(clips):
+        if texts[i] is None:
+            result = model.transcribe(clip, language="en", task="transcribe", fp16=False)
+            texts[i] = result["text"].strip()
+
+    return texts
+
+
+def _decode_words(model, clip: np.ndarray) -> List[Tuple[str, float, float]]:
+    """
+    Transcribe a clip to words with timestamps
+
+    Args:
+        model: Loaded Whisper model
+        clip: Float32 audio clip at 16 kHz
+
+    Returns:
+        List of (word, start, end) in seconds
+    """
+    result = model.transcribe(clip, language="en", task="transcribe", fp16=False, word_timestamps=True)
+    return [
+        (word["word"], word["start"], word["end"])
+        for segment in result["segments"]
+        for word in segment.get("words", [])
+    ]
+
+
+def _worker_main(model_name: str, torch_threads: int, tasks, results):
+    """
+    Whisper worker process entry point
+
+    Args:
+        model_name: Whisper model size to load
+        torch_threads: Intra-op threads for this worker
+        tasks: Queue of (job_id, shm_name, segments) batches, None to stop
+        results: Queue receiving (RESULT_CLAIMED, job_id, pid, None) and (RESULT_DONE, job_id, outputs, error)
+    """
+    import torch
+    import whisper
+
+    torch.set_num_threads(torch_threads)
+    model = whisper.load_model(model_name)
+    logger.info(f"Whisper worker {os.getpid()} loaded model: {model_name}")
+
+    while True:
+        task = tasks.get()
+        if task is None:
+            break
+
+        job_id, shm_name, segments = task
+        # Lets the service fail this job if the process dies while decoding it
+        results.put((RESULT_CLAIMED, job_id, os.getpid(), None))
+        shm = shared_memory.SharedMemory(name=shm_name)
+        try:
+            audio = np.ndarray((shm.size // 4,), dtype=np.float32, buffer=shm.buf)
+            clips = [audio[start:start + length] for start, length, _ in segments]
+
+            # Partial decodes need word timings; finals are batched
+            outputs = [None] * len(clips)
+            finals = [i for i, (_, _, words) in enumerate(segments) if not words]
+            for i, text in zip(finals, _decode_batch(model, [clips[i] for i in finals])):
+                outputs[i] = text
+            for i, (_, _, words) in enumerate(segments):
+                if words:
+                    outputs[i] = _decode_words(model, clips[i])
+
+            del audio, clips
+            results.put((RESULT_DONE, job_id, outputs, None))
+        except Exception as e:
+            results.put((RESULT_DONE, job_id, None, str(e)))
+        finally:
+            try:
+                shm.close()
+            except BufferError:
+                # A lingering view still references the block; the owner unlinks it regardless
+                pass
+
+
+class WhisperService:
+    """Pool of Whisper worker processes with cross-session batching"""
+
+    def __init__(self, model_name: str = "base", num_workers: int = 0,
+                 batch_window: float = 0.03, max_batch_size: int = 8,
+                 result_timeout: float = 60.0, monitor_interval: float = 1.0):
+        """
+        Initialize Whisper service (workers start on first use)
+
+        Args:
+            model_name: Whisper model size (tiny, base, small, medium, large)
+            num_workers: Worker processes, 0 for one per two CPU cores
+            batch_window: Seconds to wait for more utterances to batch together
+            max_batch_size: Maximum utterances per decode
+            result_timeout: Longest time in seconds a caller waits for a transcription
+            monitor_interval: Seconds between checks for worker processes that died
+        """
+        cpu_count = os.cpu_count() or 1
+        self.model_name = model_name
+        self.num_workers = num_workers or max(1, cpu_count // 2)
+        self.torch_threads = max(1, cpu_count // self.num_workers)
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.result_timeout = result_timeout
+        self.monitor_interval = monitor_interval
+
+        self._ctx = mp.get_context('spawn')
+        self._tasks = None
+        self._results = None
+        self._workers = []
+        self._requests: "queue.Queue" = queue.Queue()
+        self._jobs: Dict[int, Tuple[shared_memory.SharedMemory, List[Future]]] = {}
+        self._claims: Dict[int, int] = {}  # job_id -> pid of the worker decoding it
+        self._job_ids = itertools.count()
+        self._lock = threading.Lock()
+        self._started = False
+        self._stopping = False
+
+        logger.info(
+            f"Initializing Whisper service with model={model_name}, "
+            f"workers={self.num_workers}, batch_window={batch_window}s"
+        )
+
+    def start(self):
+        """Start worker processes and dispatcher threads"""
+        with self._lock:
+            if self._started:
+                return
+
+            self._tasks = self._ctx.Queue()
+            self._results = self._ctx.Queue()
+            self._workers = [self._spawn_worker() for _ in range(self.num_workers)]
+
+            threading.Thread(target=self._batch_loop, name='stt-batcher', daemon=True).start()
+            threading.Thread(target=self._result_loop, name='stt-results', daemon=True).start()
+            self._started = True
+
+        logger.info(f"Started {self.num_workers} Whisper worker processes")
+
+    def _spawn_worker(self):
+        """Start one worker process"""
+        worker = self._ctx.Process(
+            target=_worker_main,
+            args=(self.model_name, self.torch_threads, self._tasks, self._results),
+            daemon=True
+        )
+        worker.start()
+        return worker
+
+    def submit(self, audio_data: np.ndarray, word_timestamps: bool = False) -> Future:
+        """
+        Queue audio for transcription
+
+        Args:
+            audio_data: Audio data as numpy array (16 kHz)
+            word_timestamps: Resolve to (word, start, end) tuples instead of text
+
+        Returns:
+            Future resolving to the transcribed text (or words) or None
+        """
+        self.start()
+
+        future = Future()
+        if audio_data.size == 0:
+            future.set_result(None)
+            return future
+
+        self._requests.put((audio_data, future, word_timestamps))
+        return future
+
+    def transcribe(self, audio_data: np.ndarray, sample_rate: int = 16000) -> Optional[str]:
+        """
+        Transcribe audio to text, blocking until the result is ready
+
+        Args:
+            audio_data: Audio data as numpy array
+            sample_rate: Sample rate of audio (default 16000 Hz)
+
+        Returns:
+            Transcribed text or None if transcription fails
+        """
+        try:
+            text = self.submit(audio_data).result(timeout=self.result_timeout)
+            if text is not None:
+                logger.info(f"Transcribed: {text}")
+            return text
+
+        except FutureTimeout:
+            logger.error(f"Transcription timed out after {self.result_timeout}s")
+            return None
+        except Exception as e:
+            logger.error(f"Transcription error: {str(e)}")
+            return None
+
+    def transcribe_words(self, audio_data: np.ndarray) -> Optional[List[Tuple[str, float, float]]]:
+        """
+        Transcribe audio to words with timestamps, blocking until ready
+
+        Args:
+            audio_data: Float32 audio data at 16 kHz
+
+        Returns:
+            List of (word, start, end) in seconds or None if transcription fails
+        """
+        try:
+            return self.submit(audio_data, word_timestamps=True).result(timeout=self.result_timeout)
+
+        except FutureTimeout:
+            logger.error(f"Word transcription timed out after {self.result_timeout}s")
+            return None
+        except Exception as e:
+            logger.error(f"Word transcription error: {str(e)}")
+            return None
+
+    def stream(self, partial_interval: float = 1.0, max_utterance: float = 30.0) -> StreamingTranscriber:
+        """
+        Create a streaming transcriber backed by this service
+
+        Args:
+            partial_interval: Seconds of new audio between partial decodes
+            max_utterance: Seconds of audio accepted per utterance
+
+        Returns:
+            StreamingTranscriber for one speaker
+        """
+        return StreamingTranscriber(self, partial_interval=partial_interval, max_utterance=max_utterance)
+
+    def shutdown(self):
+        """Stop dispatcher threads and worker processes"""
+        if not self._started:
+            return
+
+        self._stopping = True
+        self._requests.put(None)
+        for _ in self._workers:
+            self._tasks.put(None)
+        for worker in self._workers:
+            worker.join(timeout=5)
+
+    def _batch_loop(self):
+        """Collect requests arriving within the batch window and dispatch them"""
+        stopping = False
+        while not stopping:
+            item = self._requests.get()
+            if item is None:
+                break
+
+            batch = [item]
+            deadline = time.monotonic() + self.batch_window
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._requests.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            try:
+                self._dispatch(batch)
+            except Exception as e:
+                logger.error(f"Error dispatching transcription batch: {str(e)}")
+                for _, future, _ in batch:
+                    future.set_exception(e)
+
+    def _dispatch(self, batch: List[Tuple[np.ndarray, Future, bool]]):
+        """Copy a batch into one shared memory block and hand it to a worker"""
+        total = sum(audio.size for audio, _, _ in batch)
+        shm = shared_memory.SharedMemory(create=True, size=total * 4)
+
+        buffer = np.ndarray((total,), dtype=np.float32, buffer=shm.buf)
+        segments = []
+        offset = 0
+        for audio, _, word_timestamps in batch:
+            clip = buffer[offset:offset + audio.size]
+            np.copyto(clip, audio, casting='unsafe')
+
+            # Normalize audio
+            peak = np.abs(clip).max()
+            if peak > 1.0:
+                clip /= peak
+
+            segments.append((offset, audio.size, word_timestamps))
+            offset += audio.size
+        del buffer, clip
+
+        job_id = next(self._job_ids)
+        self._jobs[job_id] = (shm, [future for _, future, _ in batch])
+        self._tasks.put((job_id, shm.name, segments))
+
+        logger.info(f"Dispatched transcription batch of {len(batch)} utterances")
+
+    def _result_loop(self):
+        """Resolve futures as worker results arrive and watch for workers that died"""
+        next_check = time.monotonic() + self.monitor_interval
+        while True:
+            try:
+                kind, job_id, payload, error = self._results.get(timeout=self.monitor_interval)
+                if kind == RESULT_CLAIMED:
+                    self._claims[job_id] = payload
+                else:
+                    self._claims.pop(job_id, None)
+                    self._finish_job(job_id, payload, error)
+            except queue.Empty:
+                pass
+            except Exception as e:
+                logger.error(f"Error handling transcription result: {str(e)}")
+
+            if time.monotonic() >= next_check:
+                next_check = time.monotonic() + self.monitor_interval
+                self._check_workers()
+
+    def _check_workers(self):
+        """Fail the jobs of worker processes that exited and start replacements"""
+        if self._stopping:
+            return
+
+        for index, worker in enumerate(self._workers):
+            if not worker.is_alive():
+                logger.error(f"Whisper worker {worker.pid} exited with code {worker.exitcode}, restarting")
+                self._workers[index] = self._spawn_worker()
+
+        live = {worker.pid for worker in self._workers}
+        for job_id, pid in list(self._claims.items()):
+            if pid not in live:
+                del self._claims[job_id]
+                self._finish_job(job_id, None, f"worker {pid} exited")
+
+    def _finish_job(self, job_id: int, outputs: Optional[list], error: Optional[str]):
+        """Release a job's shared memory and resolve its futures"""
+        job = self._jobs.pop(job_id, None)
+        if job is None:
+            return
+        shm, futures = job
+
+        shm.close()
+        shm.unlink()
+
+        if error is not None:
+            logger.error(f"Transcription error: {error}")
+            outputs = [None] * len(futures)
+
+        for future, output in zip(futures, outputs):
+            if not future.done():
+                future.set_result(output)
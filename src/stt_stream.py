@@ -0,0 +1,243 @@
+"""
+Streaming transcription on top of a Whisper transcriber
+Decodes a sliding window while audio arrives and commits stable prefixes
+"""
+import logging
+import re
+import threading
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# (word, start seconds, end seconds) relative to the decoded clip
+Word = Tuple[str, float, float]
+
+
+def _normalize(word: str) -> str:
+    """Normalize a word for hypothesis comparison"""
+    return re.sub(r"[^\w']", "", word.lower())
+
+
+class UtteranceBuffer:
+    """
+    Preallocated float32 buffer for one speaker's uncommitted audio
+
+    Live audio always starts at index 0 so Whisper can be handed a contiguous
+    view instead of a copy. Two arrays are allocated up front: when an
+    utterance ends its audio stays put for the final decode while the next
+    utterance fills the other array.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Allocate the buffer
+
+        Args:
+            capacity: Maximum samples held at once
+        """
+        self.capacity = capacity
+        self._arrays = [np.zeros(capacity, dtype=np.float32), np.zeros(capacity, dtype=np.float32)]
+        self._active = 0
+        self.size = 0
+
+    def append(self, audio_data: np.ndarray) -> int:
+        """
+        Copy audio onto the end of the buffer, converting int16 PCM on the way in
+
+        Args:
+            audio_data: Float32 samples in [-1, 1], or int16 PCM
+
+        Returns:
+            Number of samples stored (less than given if the buffer is full)
+        """
+        count = min(audio_data.size, self.capacity - self.size)
+        target = self._arrays[self._active][self.size:self.size + count]
+        if audio_data.dtype == np.int16:
+            np.multiply(audio_data[:count], 1.0 / 32768, out=target)
+        else:
+            target[:] = audio_data[:count]
+        self.size += count
+        return count
+
+    def view(self) -> np.ndarray:
+        """Zero-copy view of the buffered audio"""
+        return self._arrays[self._active][:self.size]
+
+    def drop(self, count: int):
+        """
+        Discard samples from the front of the buffer
+
+        Args:
+            count: Samples to discard
+        """
+        array = self._arrays[self._active]
+        remaining = self.size - count
+        # Overlapping copy; numpy buffers it when source and destination overlap
+        array[:remaining] = array[count:self.size]
+        self.size = remaining
+
+    def swap(self) -> np.ndarray:
+        """
+        Take the buffered audio and start an empty buffer
+
+        Returns:
+            View of the audio taken; valid until the next swap
+        """
+        taken = self.view()
+        self._active ^= 1
+        self.size = 0
+        return taken
+
+
+class StreamingTranscriber:
+    """
+    Incrementally transcribes one speaker's audio
+
+    Every partial decode covers the audio after the last committed word. Words
+    that two consecutive hypotheses agree on are committed and their audio is
+    dropped, so the final decode at end of utterance only covers the tail.
+    """
+
+    def __init__(self, transcriber, sample_rate: int = 16000,
+                 partial_interval: float = 1.0, max_window: float = 25.0,
+                 max_utterance: float = 30.0):
+        """
+        Initialize streaming transcriber
+
+        Args:
+            transcriber: Object providing transcribe() and transcribe_words()
+            sample_rate: Sample rate of audio (default 16000 Hz)
+            partial_interval: Seconds of new audio between partial decodes, 0 to disable
+            max_window: Seconds of uncommitted audio before words are force-committed
+            max_utterance: Seconds of audio accepted per utterance; the rest is dropped
+        """
+        self.transcriber = transcriber
+        self.sample_rate = sample_rate
+        self.partial_step = int(partial_interval * sample_rate)
+        self.max_window = int(max_window * sample_rate)
+        self.max_utterance = int(max_utterance * sample_rate)
+        self._audio = UtteranceBuffer(self.max_utterance)
+
+        self._buffer_lock = threading.Lock()
+        self._decode_lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        """Clear all per-utterance state (the audio buffer is swapped separately)"""
+        self._offset = 0                 # absolute sample index of self._audio[0]
+        self._total = 0                  # absolute samples received
+        self._last_partial = 0           # absolute samples at last partial decode
+        self._committed: List[str] = []
+        self._hypothesis: List[Word] = []
+
+    @property
+    def committed_text(self) -> str:
+        """Text committed so far for the current utterance"""
+        return " ".join(self._committed)
+
+    def has_audio(self) -> bool:
+        """Whether any audio has been received for the current utterance"""
+        return self._total > 0
+
+    def add_audio(self, audio_data: np.ndarray) -> bool:
+        """
+        Append audio for the current utterance
+
+        Args:
+            audio_data: Float32 audio samples, or int16 PCM
+
+        Returns:
+            False if the utterance has reached max_utterance and audio was dropped
+        """
+        with self._buffer_lock:
+            # Everything received counts, so the buffer (uncommitted audio only) never overflows
+            room = max(0, self.max_utterance - self._total)
+            stored = self._audio.append(audio_data[:room])
+            self._total += stored
+            return stored == audio_data.size
+
+    def is_full(self) -> bool:
+        """Whether the current utterance has reached max_utterance"""
+        return self._total >= self.max_utterance
+
+    def ready(self) -> bool:
+        """Whether enough new audio has arrived for another partial decode"""
+        if not self.partial_step or self._decode_lock.locked():
+            return False
+        return self._total - self._last_partial >= self.partial_step
+
+    def process(self) -> Optional[str]:
+        """
+        Run a partial decode over the uncommitted window
+
+        Returns:
+            Newly committed text, or None if nothing new became stable
+        """
+        with self._decode_lock:
+            with self._buffer_lock:
+                if self._total == self._last_partial:
+                    return None
+                window = self._audio.view()
+                window_offset = self._offset
+                self._last_partial = self._total
+
+            if window.size == 0:
+                return None
+
+            words = self.transcriber.transcribe_words(window)
+            if words is None:
+                return None
+
+            # Agreement between consecutive hypotheses is considered stable
+            stable = 0
+            for new, old in zip(words, self._hypothesis):
+                if _normalize(new[0]) != _normalize(old[0]):
+                    break
+                stable += 1
+
+            # Never let the window grow past what Whisper decodes in one pass
+            if stable == 0 and window.size >= self.max_window and len(words) > 2:
+                stable = len(words) - 2
+
+            self._hypothesis = words[stable:]
+            if stable == 0:
+                return None
+
+            committed = [word.strip() for word, _, _ in words[:stable]]
+            self._committed.extend(committed)
+
+            # Drop audio up to the end of the last committed word
+            cut = int(words[stable - 1][2] * self.sample_rate)
+            self._hypothesis = [
+                (word, start - cut / self.sample_rate, end - cut / self.sample_rate)
+                for word, start, end in self._hypothesis
+            ]
+            with self._buffer_lock:
+                drop = window_offset + cut - self._offset
+                self._audio.drop(drop)
+                self._offset += drop
+
+            text = " ".join(committed)
+            logger.info(f"Committed partial transcript: {text}")
+            return text
+
+    def finalize(self) -> Optional[str]:
+        """
+        Decode the uncommitted tail and end the utterance
+
+        Returns:
+            Full transcript of the utterance or None if transcription fails
+        """
+        with self._decode_lock:
+            with self._buffer_lock:
+                tail = self._audio.swap()
+                committed = list(self._committed)
+                self._reset()
+
+            tail_text = self.transcriber.transcribe(tail) if tail.size else ""
+            if tail_text is None and not committed:
+                return None
+
+            return " ".join(committed + ([tail_text] if tail_text else [])).strip()
@@ -0,0 +1,195 @@
+"""
+Background summarization queue
+Persists finished calls as jobs and generates their summaries off the call path
+"""
+import json
+import logging
+import os
+import queue
+import threading
+from typing import Callable, Dict, Optional
+
+from ai_handler import SUMMARY_ERROR
+
+logger = logging.getLogger(__name__)
+
+
+class SummaryQueue:
+    """Durable job queue that saves calls and attaches summaries later"""
+
+    def __init__(self, storage, handler_factory: Callable, on_ready: Callable,
+                 jobs_dir: str, workers: int = 1, max_attempts: int = 5,
+                 retry_delay: float = 10.0):
+        """
+        Initialize summary queue
+
+        Args:
+            storage: DataStorage used to save calls, transcripts and summaries
+            handler_factory: Callable returning a ConversationHandler for summarizing
+            on_ready: Called with (job, summary or None) when a job finishes
+            jobs_dir: Directory where pending jobs are persisted
+            workers: Number of worker threads
+            max_attempts: Summary attempts before a job is marked failed
+            retry_delay: Base delay in seconds between attempts (doubles each time)
+        """
+        self.storage = storage
+        self.handler_factory = handler_factory
+        self.on_ready = on_ready
+        self.jobs_dir = jobs_dir
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+
+        self._queue: "queue.Queue" = queue.Queue()
+        os.makedirs(jobs_dir, exist_ok=True)
+        logger.info(f"Initialized SummaryQueue in {jobs_dir}")
+
+    def start(self):
+        """Reload jobs left over from a previous run and start workers"""
+        recovered = 0
+        for filename in sorted(os.listdir(self.jobs_dir)):
+            if not filename.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(self.jobs_dir, filename), 'r', encoding='utf-8') as f:
+                    self._queue.put(json.load(f))
+                recovered += 1
+            except Exception as e:
+                logger.error(f"Error loading summary job {filename}: {str(e)}")
+
+        if recovered:
+            logger.info(f"Recovered {recovered} pending summary jobs")
+
+        for i in range(self.workers):
+            threading.Thread(target=self._run, name=f'summary-{i}', daemon=True).start()
+
+    def enqueue(self, call_id: str, session_id: str, call_data: Dict, transcript: str):
+        """
+        Persist a finished call as a job and queue it
+
+        Args:
+            call_id: Allocated call ID
+            session_id: Socket.IO session to notify when the summary is ready
+            call_data: Call record without summary
+            transcript: Rendered transcript text
+        """
+        job = {
+            "call_id": call_id,
+            "session_id": session_id,
+            "call_data": call_data,
+            "transcript": transcript,
+            "saved": False,
+            "attempts": 0
+        }
+        self._persist(job)
+        self._queue.put(job)
+
+    def has_job(self, call_id: str) -> bool:
+        """Whether a call already has a job waiting or running"""
+        return os.path.exists(self._job_path(call_id))
+
+    def pending(self) -> int:
+        """Number of jobs waiting for a worker"""
+        return self._queue.qsize()
+
+    def _job_path(self, call_id: str) -> str:
+        """Location of a persisted job"""
+        return os.path.join(self.jobs_dir, f"{call_id}.json")
+
+    def _persist(self, job: Dict):
+        """Write a job atomically"""
+        path = self._job_path(job["call_id"])
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(job, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def _finish(self, job: Dict, summary: Optional[Dict]):
+        """Drop a completed job and notify"""
+        try:
+            os.unlink(self._job_path(job["call_id"]))
+        except FileNotFoundError:
+            pass
+        self.on_ready(job, summary)
+
+    def _run(self):
+        """Worker loop"""
+        while True:
+            job = self._queue.get()
+            try:
+                self._process(job)
+            except Exception as e:
+                logger.error(f"Error processing summary job {job.get('call_id')}: {str(e)}")
+                self._retry(job)
+
+    def _retry(self, job: Dict, outcome: Optional[Dict] = None):
+        """
+        Schedule another attempt with exponential backoff, or give up
+
+        Args:
+            job: Job whose attempt failed
+            outcome: Extracted outcome to record if the job is given up
+        """
+        call_id = job["call_id"]
+        job["attempts"] += 1
+
+        if job["attempts"] >= self.max_attempts:
+            logger.error(f"Giving up on summary after {job['attempts']} attempts: {call_id}")
+            if not job["saved"]:
+                # The call itself never reached storage; keep the job for the next start
+                self.on_ready(job, None)
+                return
+            try:
+                self.storage.update_call(call_id, {
+                    "summary_status": "failed",
+                    "outcome": outcome or job["call_data"].get("outcome")
+                })
+            except Exception as e:
+                logger.error(f"Error marking summary failed: {str(e)}")
+            self._finish(job, None)
+            return
+
+        try:
+            self._persist(job)
+        except Exception as e:
+            logger.error(f"Error persisting summary job {call_id}: {str(e)}")
+
+        delay = self.retry_delay * 2 ** (job["attempts"] - 1)
+        logger.warning(f"Summary job failed, retrying in {delay:.0f}s: {call_id}")
+        timer = threading.Timer(delay, self._queue.put, args=(job,))
+        timer.daemon = True
+        timer.start()
+
+    def _process(self, job: Dict):
+        """Save the call record, then summarize it"""
+        call_id = job["call_id"]
+        call_data = job["call_data"]
+
+        if not job["saved"]:
+            self.storage.save_call(call_data, call_id=call_id)
+            self.storage.save_transcript(call_id, job["transcript"])
+            job["saved"] = True
+            self._persist(job)
+
+        logger.info(f"Generating call summary: {call_id}")
+        handler = self.handler_factory()
+        handler.restore(call_data["conversation"], call_data["stages_completed"])
+        summary = handler.get_conversation_summary()
+
+        if summary["summary"] == SUMMARY_ERROR:
+            self._retry(job, summary["outcome"])
+            return
+
+        # Fold the summary request into the call's token usage
+        token_usage = dict(call_data.get("token_usage") or {})
+        for key, value in summary["token_usage"].items():
+            token_usage[key] = token_usage.get(key, 0) + value
+
+        self.storage.update_call(call_id, {
+            "summary": summary["summary"],
+            "summary_status": "ready",
+            "outcome": summary["outcome"],
+            "token_usage": token_usage
+        })
+        self._finish(job, summary)
+        logger.info(f"Summary ready: {call_id}")
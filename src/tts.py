@@ -3,27 +3,36 @@ Text-to-Speech module using pyttsx3
 """
 import pyttsx3
 import logging
+import queue
 import tempfile
+import threading
 import os
+from concurrent.futures import Future
 from typing import Optional
 
+from tts_cache import AudioCache
+
 logger = logging.getLogger(__name__)
 
 
 class TextToSpeech:
     """Handles text-to-speech conversion using pyttsx3"""
 
-    def __init__(self, rate: int = 150, volume: float = 0.9):
+    def __init__(self, rate: int = 150, volume: float = 0.9, cache: Optional[AudioCache] = None):
         """
         Initialize TTS engine
 
         Args:
             rate: Speech rate (words per minute)
             volume: Volume (0.0 to 1.0)
+            cache: Optional cache for rendered audio
         """
         self.rate = rate
         self.volume = volume
+        self.cache = cache
         self.engine = None
+        self.voice_id = None
+        self._render_path = None
         logger.info(f"Initializing TTS with rate={rate}, volume={volume}")
 
     def initialize(self):
@@ -41,11 +50,13 @@ class TextToSpeech:
                 for voice in voices:
                     if 'female' in voice.name.lower() or 'zira' in voice.name.lower():
                         self.engine.setProperty('voice', voice.id)
+                        self.voice_id = voice.id
                         logger.info(f"Using voice: {voice.name}")
                         break
                 else:
                     # Use first available voice
                     self.engine.setProperty('voice', voices[0].id)
+                    self.voice_id = voices[0].id
                     logger.info(f"Using voice: {voices[0].name}")
 
             logger.info("TTS engine initialized successfully")
@@ -86,31 +97,62 @@ class TextToSpeech:
             logger.error(f"TTS save error: {str(e)}")
             return False
 
-    def get_audio_data(self, text: str) -> Optional[bytes]:
+    def get_cached_audio(self, text: str) -> Optional[bytes]:
+        """
+        Look up previously rendered audio without touching the engine
+
+        Safe to call from any thread once the engine has been initialized.
+
+        Args:
+            text: Text to convert
+
+        Returns:
+            Cached audio data or None
+        """
+        if not self.cache or self.engine is None:
+            return None
+        return self.cache.get(AudioCache.make_key(text, self.rate, self.volume, self.voice_id))
+
+    def get_audio_data(self, text: str, cache_checked: bool = False) -> Optional[bytes]:
         """
         Convert text to speech and return audio data
 
         Args:
             text: Text to convert
+            cache_checked: The caller already missed the cache for this text (skips a second lookup)
 
         Returns:
             Audio data as bytes or None if conversion fails
         """
         try:
-            # Save to temporary file
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_file:
-                tmp_filename = tmp_file.name
+            self.initialize()
+
+            cache_key = None
+            if self.cache:
+                cache_key = AudioCache.make_key(text, self.rate, self.volume, self.voice_id)
+                audio_data = None if cache_checked else self.cache.get(cache_key)
+                if audio_data is not None:
+                    return audio_data
+
+            # pyttsx3 can only render to a file; reuse one in tmpfs when available
+            if self._render_path is None:
+                render_dir = '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir()
+                self._render_path = os.path.join(render_dir, f"tts-render-{os.getpid()}-{id(self)}.wav")
+
+            # A render that writes nothing must not return the previous utterance
+            if os.path.exists(self._render_path):
+                os.unlink(self._render_path)
 
             # Generate speech
-            if self.save_to_file(text, tmp_filename):
+            if self.save_to_file(text, self._render_path) and os.path.exists(self._render_path):
                 # Read the file
-                with open(tmp_filename, 'rb') as f:
+                with open(self._render_path, 'rb') as f:
                     audio_data = f.read()
 
-                # Clean up
-                os.unlink(tmp_filename)
+                if cache_key and audio_data:
+                    self.cache.put(cache_key, audio_data)
 
-                return audio_data
+                return audio_data or None
 
             return None
 
@@ -125,3 +167,84 @@ class TextToSpeech:
                 self.engine.stop()
         except Exception as e:
             logger.error(f"Stop error: {str(e)}")
+
+
+class TTSService:
+    """Owns a TextToSpeech engine on one dedicated thread"""
+
+    def __init__(self, tts: TextToSpeech):
+        """
+        Initialize TTS service and start its engine thread
+
+        Args:
+            tts: TextToSpeech instance; only ever driven from the engine thread
+        """
+        self.tts = tts
+        self._requests: "queue.Queue" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name='tts-engine', daemon=True)
+        self._thread.start()
+        logger.info("Started TTS engine thread")
+
+    def submit(self, text: str) -> Future:
+        """
+        Queue text for synthesis
+
+        Args:
+            text: Text to convert
+
+        Returns:
+            Future resolving to audio data or None
+        """
+        future = Future()
+
+        # Cache hits don't need the engine thread; a miss here isn't looked up (and counted) again
+        cache_checked = self.tts.cache is not None and self.tts.engine is not None
+        audio_data = self.tts.get_cached_audio(text) if cache_checked else None
+        if audio_data is not None:
+            future.set_result(audio_data)
+            return future
+
+        self._requests.put((text, future, cache_checked))
+        return future
+
+    def get_audio_data(self, text: str) -> Optional[bytes]:
+        """
+        Convert text to speech, blocking until audio is ready
+
+        Args:
+            text: Text to convert
+
+        Returns:
+            Audio data as bytes or None if conversion fails
+        """
+        return self.submit(text).result()
+
+    def shutdown(self):
+        """Stop the engine thread after pending requests are rendered"""
+        self._requests.put(None)
+        self._thread.join(timeout=5)
+
+    def _run(self):
+        """Engine thread: render requests one at a time"""
+        try:
+            self.tts.initialize()
+        except Exception as e:
+            # Keep serving requests; each render retries the engine and resolves to None
+            logger.error(f"TTS engine initialization error: {str(e)}")
+
+        while True:
+            request = self._requests.get()
+            if request is None:
+                break
+
+            text, future, cache_checked = request
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(self.tts.get_audio_data(text, cache_checked=cache_checked))
+            except Exception as e:
+                logger.error(f"TTS render error: {str(e)}")
+                future.set_result(None)
+
+        if self.tts._render_path and os.path.exists(self.tts._render_path):
+            os.unlink(self.tts._render_path)
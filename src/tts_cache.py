@@ -0,0 +1,196 @@
+"""
+Synthesized audio cache
+Content-addressed two-tier (memory LRU + disk) cache for TTS output
+"""
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class AudioCache:
+    """Caches rendered speech keyed on text and voice settings"""
+
+    def __init__(self, cache_dir: str, max_memory_bytes: int = 64 * 1024 * 1024,
+                 max_disk_bytes: int = 512 * 1024 * 1024):
+        """
+        Initialize audio cache
+
+        Args:
+            cache_dir: Directory for the persistent tier
+            max_memory_bytes: Upper bound on audio held in the in-process tier
+            max_disk_bytes: Upper bound on audio kept in the persistent tier
+        """
+        self.cache_dir = cache_dir
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        self._disk: "OrderedDict[str, int]" = OrderedDict()
+        self._disk_bytes = 0
+        self._lock = threading.Lock()
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self._load_disk_index()
+        logger.info(
+            f"Initialized AudioCache in {cache_dir} ({max_memory_bytes} bytes in memory, "
+            f"{self._disk_bytes}/{max_disk_bytes} bytes on disk)"
+        )
+
+    def _load_disk_index(self):
+        """Rebuild the disk tier's LRU order from file modification times"""
+        entries = []
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith('.wav'):
+                    continue
+                stat = os.stat(os.path.join(root, name))
+                entries.append((stat.st_mtime, name[:-len('.wav')], stat.st_size))
+
+        for _, key, size in sorted(entries):
+            self._disk[key] = size
+            self._disk_bytes += size
+        self._evict_disk()
+
+    @staticmethod
+    def make_key(text: str, rate: int, volume: float, voice: Optional[str]) -> str:
+        """
+        Build the cache key for an utterance
+
+        Args:
+            text: Text that is spoken
+            rate: Speech rate (words per minute)
+            volume: Volume (0.0 to 1.0)
+            voice: Voice identifier
+
+        Returns:
+            Hex digest identifying the rendered audio
+        """
+        normalized = " ".join(text.split())
+        material = f"{voice}\x00{rate}\x00{volume}\x00{normalized}"
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> str:
+        """Disk location of a cache entry"""
+        return os.path.join(self.cache_dir, key[:2], f"{key}.wav")
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Look up rendered audio
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Audio data or None on a miss
+        """
+        with self._lock:
+            audio_data = self._memory.get(key)
+            if audio_data is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return audio_data
+
+        try:
+            with open(self._path(key), 'rb') as f:
+                audio_data = f.read()
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.disk_hits += 1
+            self._remember(key, audio_data)
+            if key in self._disk:
+                self._disk.move_to_end(key)
+
+        # Keep recency across restarts
+        try:
+            os.utime(self._path(key))
+        except OSError:
+            pass
+        return audio_data
+
+    def put(self, key: str, audio_data: bytes):
+        """
+        Store rendered audio in both tiers
+
+        Args:
+            key: Cache key from make_key()
+            audio_data: Audio data to cache
+        """
+        with self._lock:
+            self._remember(key, audio_data)
+
+        try:
+            path = self._path(key)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(audio_data)
+            os.replace(tmp_path, path)
+
+            with self._lock:
+                self._disk_bytes += len(audio_data) - self._disk.pop(key, 0)
+                self._disk[key] = len(audio_data)
+                self._evict_disk()
+
+        except Exception as e:
+            logger.error(f"Error writing audio cache entry: {str(e)}")
+
+    def _evict_disk(self):
+        """Delete least recently used files until the disk tier fits its bound"""
+        while self._disk_bytes > self.max_disk_bytes and self._disk:
+            key, size = self._disk.popitem(last=False)
+            self._disk_bytes -= size
+            try:
+                os.unlink(self._path(key))
+            except FileNotFoundError:
+                pass
+
+    def _remember(self, key: str, audio_data: bytes):
+        """Insert into the memory tier, evicting least recently used entries"""
+        if len(audio_data) > self.max_memory_bytes:
+            return
+
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous)
+
+        self._memory[key] = audio_data
+        self._memory_bytes += len(audio_data)
+
+        while self._memory_bytes > self.max_memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+
+    def stats(self) -> Dict:
+        """
+        Get cache counters
+
+        Returns:
+            Dictionary with hit/miss counts and memory usage
+        """
+        with self._lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": (self.memory_hits + self.disk_hits) / lookups if lookups else 0,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+                "disk_entries": len(self._disk),
+                "disk_bytes": self._disk_bytes
+            }
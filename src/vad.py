@@ -0,0 +1,154 @@
+"""
+Voice Activity Detection module
+Energy and zero-crossing based speech detection with automatic endpointing
+"""
+import logging
+from collections import deque
+from typing import List, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class VoiceActivityDetector:
+    """Detects speech in a stream of audio chunks and signals end of speech"""
+
+    def __init__(self, sample_rate: int = 16000, frame_ms: int = 30,
+                 energy_threshold_db: float = -45.0, noise_margin_db: float = 10.0,
+                 max_zcr: float = 0.35, hangover_ms: int = 800,
+                 min_speech_ms: int = 250, pre_roll_ms: int = 200):
+        """
+        Initialize voice activity detector
+
+        Args:
+            sample_rate: Sample rate of audio (default 16000 Hz)
+            frame_ms: Analysis frame length in milliseconds
+            energy_threshold_db: Minimum frame energy (dBFS) to count as speech
+            noise_margin_db: Required energy above the tracked noise floor
+            max_zcr: Zero-crossing rate above which quiet frames are treated as noise
+            hangover_ms: Silence after speech before the utterance is considered over
+            min_speech_ms: Minimum speech in an utterance for it to be endpointed
+            pre_roll_ms: Silence kept before speech onset so words aren't clipped
+        """
+        self.frame_size = int(sample_rate * frame_ms / 1000)
+        self.energy_threshold_db = energy_threshold_db
+        self.noise_margin_db = noise_margin_db
+        self.max_zcr = max_zcr
+        self.hangover_frames = max(1, hangover_ms // frame_ms)
+        self.min_speech_frames = max(1, min_speech_ms // frame_ms)
+        self.pre_roll_samples = int(sample_rate * pre_roll_ms / 1000)
+
+        self.noise_floor_db = energy_threshold_db - noise_margin_db
+        self._remainder = np.zeros(0, dtype=np.float32)
+        self._pre_roll: deque = deque()
+        self._pre_roll_size = 0
+        # Audio of an utterance that hasn't reached min_speech yet
+        self._pending: List[np.ndarray] = []
+        self.reset()
+
+    def reset(self):
+        """Clear utterance state, discarding audio of an unconfirmed utterance (the noise floor is kept)"""
+        self.in_speech = False
+        self._speech_frames = 0
+        self._silence_frames = 0
+        self._pending = []
+
+    def flush(self) -> np.ndarray:
+        """
+        End the current utterance on request (e.g. the client says the user finished)
+
+        Returns:
+            Audio still held back because the utterance was shorter than min_speech
+        """
+        audio = np.concatenate(self._pending) if self._pending else np.zeros(0, dtype=np.float32)
+        self.reset()
+        return audio
+
+    def _classify(self, frames: np.ndarray) -> np.ndarray:
+        """
+        Classify frames as speech or non-speech
+
+        Args:
+            frames: Array of shape (n_frames, frame_size)
+
+        Returns:
+            Boolean array with one entry per frame
+        """
+        energy_db = 10.0 * np.log10(np.mean(frames * frames, axis=1) + 1e-10)
+        zcr = np.mean(np.abs(np.diff(np.signbit(frames), axis=1)), axis=1)
+
+        threshold = max(self.energy_threshold_db, self.noise_floor_db + self.noise_margin_db)
+        # Loud frames are speech; quiet ones only if they aren't noise-like
+        speech = (energy_db > threshold) & ((zcr < self.max_zcr) | (energy_db > threshold + 10.0))
+
+        if not speech.all():
+            self.noise_floor_db = 0.95 * self.noise_floor_db + 0.05 * float(np.mean(energy_db[~speech]))
+
+        return speech
+
+    def process(self, audio_data: np.ndarray) -> Tuple[np.ndarray, bool]:
+        """
+        Run detection on an incoming chunk
+
+        Args:
+            audio_data: Float32 audio samples
+
+        Returns:
+            Tuple of (audio worth buffering, True if the utterance just ended)
+        """
+        samples = np.concatenate((self._remainder, audio_data))
+        n_frames = samples.size // self.frame_size
+        self._remainder = samples[n_frames * self.frame_size:]
+        if n_frames == 0:
+            return np.zeros(0, dtype=np.float32), False
+
+        chunk = samples[:n_frames * self.frame_size]
+        speech = self._classify(chunk.reshape(n_frames, self.frame_size))
+
+        if speech.any():
+            self._speech_frames += int(speech.sum())
+            self._silence_frames = n_frames - 1 - int(np.flatnonzero(speech)[-1])
+
+            if not self.in_speech:
+                self.in_speech = True
+                chunk = np.concatenate(list(self._pre_roll) + [chunk])
+                self._pre_roll.clear()
+                self._pre_roll_size = 0
+            chunk = self._hold(chunk)
+            return chunk, self._check_endpoint()
+
+        if self.in_speech:
+            self._silence_frames += n_frames
+            chunk = self._hold(chunk)
+            return chunk, self._check_endpoint()
+
+        # Silence outside an utterance is only kept as pre-roll
+        self._pre_roll.append(chunk)
+        self._pre_roll_size += chunk.size
+        while self._pre_roll_size - self._pre_roll[0].size >= self.pre_roll_samples:
+            self._pre_roll_size -= self._pre_roll.popleft().size
+        return np.zeros(0, dtype=np.float32), False
+
+    def _hold(self, chunk: np.ndarray) -> np.ndarray:
+        """Keep audio back until the utterance has min_speech of speech, so blips never reach STT"""
+        if self._speech_frames < self.min_speech_frames:
+            self._pending.append(chunk)
+            return np.zeros(0, dtype=np.float32)
+
+        if self._pending:
+            chunk = np.concatenate(self._pending + [chunk])
+            self._pending = []
+        return chunk
+
+    def _check_endpoint(self) -> bool:
+        """Close the utterance once the hangover has elapsed"""
+        if self._silence_frames < self.hangover_frames:
+            return False
+
+        ended = self._speech_frames >= self.min_speech_frames
+        if ended:
+            logger.info(f"End of speech detected ({self._speech_frames} speech frames)")
+        # A blip's held-back audio is dropped here
+        self.reset()
+        return ended
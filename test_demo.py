@@ -127,6 +127,11 @@ def main():
                 "content": response
             })
 
+            # The agent has said goodbye
+            if conversation_handler.is_complete:
+                print("[OK] Conversation completed naturally!")
+                break
+
         # End of call
         call_duration = time.time() - call_start_time
 
@@ -183,9 +188,7 @@ def main():
         print("=" * 70)
         print()
         print("Check the following files for results:")
-        print(f"  - {Config.DATA_DIR}/calls/{call_id}.json")
-        print(f"  - {Config.DATA_DIR}/transcripts/{call_id}.txt")
-        print(f"  - {Config.DATA_DIR}/summaries/{call_id}.json")
+        print(f"  - {storage._record_path(call_id)} (transcript and summary included)")
         print()
 
         return True
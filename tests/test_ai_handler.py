@@ -0,0 +1,56 @@
+"""
+Tests for conversation flow decisions that don't need Claude
+"""
+import pytest
+
+pytest.importorskip("anthropic")
+
+from ai_handler import ConversationHandler  # noqa: E402
+from config import CONVERSATION_FLOW, INTENT_TEMPLATES  # noqa: E402
+
+
+@pytest.mark.parametrize("reply", [
+    "Okay, goodbye!",
+    "No, we don't have any openings right now.",
+    "I'm busy right now, call me back later.",
+])
+def test_ending_intent_completes_after_the_goodbye(reply):
+    handler = ConversationHandler(api_key="test")
+
+    goodbye = list(handler.process_response_stream(reply))
+
+    assert " ".join(goodbye) in [text for variants in INTENT_TEMPLATES.values() for text in variants]
+    assert handler.is_complete
+    assert handler.current_stage == len(CONVERSATION_FLOW) - 1
+
+
+def test_scripted_reply_does_not_complete():
+    handler = ConversationHandler(api_key="test")
+    handler.current_stage = 1
+
+    reply = list(handler.process_response_stream("Sure, happy to help."))
+
+    assert reply
+    assert not handler.is_complete
+
+
+def test_closing_stage_completes_after_its_template():
+    handler = ConversationHandler(api_key="test")
+    handler.current_stage = len(CONVERSATION_FLOW) - 2
+
+    goodbye = list(handler.process_response_stream("Sounds good, thanks."))
+
+    assert " ".join(goodbye) in CONVERSATION_FLOW[-1]["templates"]
+    assert handler.is_complete
+
+
+def test_oversized_context_is_compacted_before_sending():
+    handler = ConversationHandler(api_key="test", context_token_budget=40)
+    handler.context.append("assistant", "A long agent question about the role. " * 2)
+    handler.context.append("user", "A long answer from the HR representative. " * 2)
+    before = handler.estimate_prompt_tokens("Reply briefly.")
+
+    estimated = handler._check_prompt_size("Reply briefly.")
+
+    assert len(handler.context.turns) == 1
+    assert estimated == handler.estimate_prompt_tokens("Reply briefly.") < before
@@ -0,0 +1,55 @@
+"""
+Tests for binary audio framing
+"""
+import base64
+import struct
+
+import pytest
+
+from audio_frames import (CODEC_PCM16, CODEC_WAV, HEADER, TRANSPORT_BASE64, TRANSPORT_BINARY,
+                          negotiate_transport, pack_frame, speech_payload, unpack_frame, wav_sample_rate)
+
+
+def _wav(sample_rate):
+    """Canonical 44-byte WAV header with no samples"""
+    return (b"RIFF" + struct.pack("<I", 36) + b"WAVEfmt " + struct.pack("<IHHIIHH", 16, 1, 1, sample_rate,
+            sample_rate * 2, 2, 16) + b"data" + struct.pack("<I", 0))
+
+
+def test_negotiate_transport():
+    assert negotiate_transport(["binary", "base64"]) == TRANSPORT_BINARY
+    assert negotiate_transport(["base64"]) == TRANSPORT_BASE64
+    assert negotiate_transport(None) == TRANSPORT_BASE64
+    assert negotiate_transport("binary") == TRANSPORT_BASE64
+
+
+def test_frame_round_trip():
+    frame = pack_frame(7, 16000, CODEC_PCM16, b"\x01\x02")
+
+    assert len(frame) == HEADER.size + 2 == 14
+    sequence, sample_rate, codec, payload = unpack_frame(frame)
+    assert (sequence, sample_rate, codec, bytes(payload)) == (7, 16000, CODEC_PCM16, b"\x01\x02")
+    assert isinstance(payload, memoryview)
+
+
+def test_sequence_wraps():
+    assert unpack_frame(pack_frame(2 ** 32 + 3, 16000, CODEC_PCM16, b""))[0] == 3
+
+
+@pytest.mark.parametrize("frame", [b"\x01\x01", b"\x02" + bytes(11)])
+def test_bad_frames_are_rejected(frame):
+    with pytest.raises(ValueError):
+        unpack_frame(frame)
+
+
+def test_speech_payload_matches_transport():
+    audio_data = _wav(22050)
+
+    frame = speech_payload(audio_data, TRANSPORT_BINARY, 1)
+    assert unpack_frame(frame)[1:3] == (22050, CODEC_WAV)
+    assert speech_payload(audio_data, TRANSPORT_BASE64, 1) == base64.b64encode(audio_data).decode('utf-8')
+    assert speech_payload(None, TRANSPORT_BINARY, 1) is None
+
+
+def test_wav_sample_rate_of_non_wav():
+    assert wav_sample_rate(b"not a wav file at all, really") == 0
@@ -0,0 +1,40 @@
+"""
+Tests for running call statistics
+"""
+from call_stats import CallStatistics
+
+
+def _call(call_id, duration, outcome, timestamp="2025-11-09T11:17:08"):
+    return {"call_id": call_id, "duration": duration, "stages_completed": 2,
+            "outcome": {"outcome": outcome}, "timestamp": timestamp}
+
+
+def test_record_and_persist(tmp_path):
+    path = str(tmp_path / "stats.json")
+    stats = CallStatistics(path)
+    assert stats.is_new
+
+    stats.record(_call("a", 20, "interested"))
+    stats.record(_call("b", 70, "no_openings"))
+
+    snapshot = CallStatistics(path).snapshot()
+    assert snapshot["total_calls"] == 2
+    assert snapshot["average_duration_seconds"] == 45
+    assert snapshot["duration_histogram"] == {"0-30s": 1, "60-120s": 1}
+    assert snapshot["outcomes"] == {"interested": 1, "no_openings": 1}
+    assert snapshot["daily"]["2025-11-09"]["calls"] == 2
+
+
+def test_replace_swaps_contribution(tmp_path):
+    stats = CallStatistics(str(tmp_path / "stats.json"))
+    old = _call("a", 20, "unknown")
+    stats.record(old)
+
+    new = _call("a", 20, "interested", timestamp="2025-11-09T12:00:00")
+    stats.replace(old, new)
+
+    snapshot = stats.snapshot()
+    assert snapshot["total_calls"] == 1
+    assert snapshot["outcomes"] == {"interested": 1}
+    assert list(snapshot["hourly"]) == ["2025-11-09T12"]
+    assert snapshot["last_call"]["outcome"] == {"outcome": "interested"}
@@ -0,0 +1,62 @@
+"""
+Tests for the bounded conversation context window
+"""
+from context import ContextWindow, estimate_tokens
+
+
+def test_short_conversation_is_kept_verbatim():
+    window = ContextWindow(max_turns=8)
+    window.append("assistant", "Hello, is this HR?")
+    window.append("user", "Yes, speaking.")
+
+    assert window.messages() == [
+        {"role": "assistant", "content": "Hello, is this HR?"},
+        {"role": "user", "content": "Yes, speaking."},
+    ]
+    assert window.tokens == estimate_tokens("Hello, is this HR?") + estimate_tokens("Yes, speaking.")
+
+
+def test_turn_limit_folds_oldest_turns_in_one_block():
+    window = ContextWindow(max_turns=4, token_budget=10000)
+    for i in range(5):
+        window.append("user" if i % 2 else "assistant", f"Turn {i}. More detail.")
+
+    messages = window.messages()
+    assert len(window.turns) == 2
+    assert messages[0]["role"] == "user"
+    assert messages[0]["content"].splitlines()[1:] == [
+        "- Agent: Turn 0.", "- HR Rep: Turn 1.", "- Agent: Turn 2."
+    ]
+    assert messages[1:] == window.turns
+
+
+def test_token_budget_bounds_the_context():
+    window = ContextWindow(max_turns=100, token_budget=100)
+    for i in range(40):
+        window.append("user", f"Sentence number {i} is fairly long. " * 3)
+
+    # The two most recent turns always stay; the summary gets at most half the budget
+    assert len(window.turns) == 2
+    assert 0 < window.tokens - sum(estimate_tokens(turn["content"]) for turn in window.turns) <= 50
+
+
+def test_clear_drops_summary():
+    window = ContextWindow(max_turns=2)
+    for i in range(4):
+        window.append("user", f"Turn {i}.")
+    window.clear()
+
+    assert window.messages() == []
+    assert window.tokens == 0
+
+
+def test_compact_can_fold_down_to_the_newest_turn():
+    window = ContextWindow(max_turns=8, token_budget=40)
+    window.append("assistant", "A long agent question about the role. " * 2)
+    window.append("user", "A long answer from the HR representative. " * 2)
+    assert len(window.turns) == 2
+
+    window.compact(min_turns=1)
+
+    assert [turn["role"] for turn in window.turns] == ["user"]
+    assert window.summary_lines[0].startswith("- Agent: A long agent question about the role.")
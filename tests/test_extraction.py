@@ -0,0 +1,67 @@
+"""
+Tests for local entity and outcome extraction
+"""
+from extraction import OUTCOME_DECLINED, OUTCOME_NO_OPENINGS, OUTCOME_OPENINGS, CallOutcome, extract_entities
+from intent import END_CALL, NO_OPENINGS
+
+
+def test_extract_role():
+    assert extract_entities("We need a Senior Backend Developer") == {"role": "senior backend developer"}
+    assert extract_entities("Nothing like that here") == {}
+
+
+def test_outcome_fields_build_up_over_turns():
+    outcome = CallOutcome()
+    outcome.update("Yes, we have two openings for senior software engineers.")
+    outcome.update("You need at least 3 years of experience with Python and AWS.")
+    outcome.update("Send your resume to jobs at acme dot com or apply on www.acme.com/careers.")
+
+    assert outcome.to_dict() == {
+        "openings": 2,
+        "roles": ["senior software engineer"],
+        "experience_years": 3,
+        "skills": ["Python", "AWS"],
+        "apply_url": "www.acme.com/careers",
+        "apply_email": "jobs@acme.com",
+        "next_steps": ["Send your resume to jobs at acme dot com or apply on www.acme.com/careers."],
+        "outcome": OUTCOME_OPENINGS,
+    }
+    assert outcome.missing() == []
+
+
+def test_goodbye_does_not_override_no_openings():
+    outcome = CallOutcome()
+    outcome.update("Sorry, we're not hiring right now.", NO_OPENINGS)
+    outcome.update("Goodbye.", END_CALL)
+
+    assert outcome.outcome == OUTCOME_NO_OPENINGS
+    assert outcome.openings == 0
+    assert outcome.missing() == []
+
+
+def test_missing_fields_of_an_unsettled_call():
+    outcome = CallOutcome()
+    outcome.update("Who is this?")
+
+    assert "openings" in outcome.missing()
+    assert "outcome" in outcome.missing()
+
+
+def test_merge_fills_only_empty_fields_and_coerces_types():
+    outcome = CallOutcome()
+    outcome.update("We use Rust mostly.")
+    outcome.merge({"openings": "4", "skills": "Go", "experience_years": "many", "unknown": 1})
+
+    assert outcome.openings == 4
+    assert outcome.skills == ["Rust"]
+    assert outcome.experience_years is None
+
+
+def test_llm_outcome_only_used_when_unknown():
+    outcome = CallOutcome()
+    outcome.merge({"outcome": OUTCOME_DECLINED})
+    assert outcome.outcome == OUTCOME_DECLINED
+
+    outcome = CallOutcome()
+    outcome.merge({"outcome": "made_up"})
+    assert outcome.to_dict()["outcome"] == "unknown"
@@ -0,0 +1,25 @@
+"""
+Tests for ULID call IDs
+"""
+from datetime import datetime, timedelta
+
+from ids import CROCKFORD, ULID_LENGTH, id_time, new_ulid
+
+
+def test_ids_are_unique_and_increasing():
+    ids = [new_ulid() for _ in range(1000)]
+
+    assert len(set(ids)) == len(ids)
+    assert ids == sorted(ids)
+    assert all(len(call_id) == ULID_LENGTH and set(call_id) <= set(CROCKFORD) for call_id in ids)
+
+
+def test_id_time_round_trips():
+    created = id_time(new_ulid())
+    assert abs(created - datetime.now()) < timedelta(seconds=5)
+
+
+def test_id_time_of_legacy_and_unknown_ids():
+    assert id_time("20251109_111708") == datetime(2025, 11, 9, 11, 17, 8)
+    assert id_time("not-an-id") is None
+    assert id_time("U" * ULID_LENGTH) is None
@@ -0,0 +1,45 @@
+"""
+Tests for the local intent classifier
+"""
+import pytest
+
+from intent import CALL_BACK_LATER, END_CALL, NO_OPENINGS, TRANSFER, IntentClassifier
+
+classifier = IntentClassifier()
+
+
+@pytest.mark.parametrize("text, intent", [
+    ("No, we don't have any openings right now.", NO_OPENINGS),
+    ("No. We have no openings.", NO_OPENINGS),
+    ("no, we're not hiring", NO_OPENINGS),
+    ("We have a hiring freeze at the moment.", NO_OPENINGS),
+    ("No, I'm not interested", END_CALL),
+    ("No, no thank you", END_CALL),
+    ("Okay, goodbye!", END_CALL),
+    ("I'm busy right now, can you call me back tomorrow?", CALL_BACK_LATER),
+    ("Let me transfer you to our recruiter.", TRANSFER),
+    ("Let me get the hiring manager.", TRANSFER),
+    ("Sorry, I have to go.", END_CALL),
+    ("Not a good time, try another time.", CALL_BACK_LATER),
+])
+def test_classifies_intent(text, intent):
+    assert classifier.classify(text) == intent
+
+
+@pytest.mark.parametrize("text", [
+    "Yes, we have a few software engineering roles open.",
+    "We are not busy right now.",
+    "I didn't say goodbye.",
+    "Candidates need three years of Python experience.",
+    "You would have to go through our careers page to apply.",
+    "Yes, we have two openings. You need to go to our website.",
+    "We usually hire at a different time of year.",
+    "Let me get back to you on that.",
+])
+def test_no_intent(text):
+    assert classifier.classify(text) is None
+
+
+def test_negation_stays_within_its_clause():
+    # The "not" belongs to the first clause only
+    assert classifier.classify("I'm not sure, but I'm busy right now") == CALL_BACK_LATER
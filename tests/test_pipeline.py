@@ -0,0 +1,73 @@
+"""
+Tests for per-call turn ordering in the turn pipeline
+"""
+import threading
+
+import pytest
+
+pytest.importorskip("anthropic")
+
+from pipeline import TurnPipeline  # noqa: E402
+
+
+class FakeSocketIO:
+    def __init__(self):
+        self.events = []
+
+    def emit(self, event, data, to=None):
+        self.events.append((event, data))
+
+
+class FakeTranscriber:
+    """Accumulates utterances until finalize() takes them"""
+
+    def __init__(self):
+        self.pending = []
+
+    def finalize(self):
+        text, self.pending = " ".join(self.pending), []
+        return text
+
+
+class FakeCall:
+    def __init__(self):
+        self.session_id = "sid"
+        self.call_id = "call"
+        self.is_active = True
+        self.transcriber = FakeTranscriber()
+
+
+def test_utterances_queued_behind_a_turn_are_merged():
+    socketio = FakeSocketIO()
+    pipeline = TurnPipeline(socketio, tts=None, on_conversation_complete=lambda call: None)
+    responded = []
+    started, release, finished = threading.Event(), threading.Event(), threading.Event()
+
+    def respond(call, text, stt_ms=0.0):
+        responded.append(text)
+        started.set()
+        release.wait(5)
+        pipeline._turn_done(call)
+        if len(responded) == 2:
+            finished.set()
+
+    pipeline._response_stage = respond
+    call = FakeCall()
+
+    call.transcriber.pending.append("first")
+    assert pipeline.submit_turn(call)
+    assert started.wait(5)
+
+    # Both end while the first turn is still responding
+    call.transcriber.pending.append("second")
+    assert pipeline.submit_turn(call)
+    call.transcriber.pending.append("third")
+    assert pipeline.submit_turn(call)
+
+    release.set()
+    assert finished.wait(5)
+    pipeline.shutdown()
+
+    assert responded == ["first", "second third"]
+    assert not [event for event, _ in socketio.events if event == 'error']
+    assert pipeline._pending_turns == 0
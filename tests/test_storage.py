@@ -0,0 +1,112 @@
+"""
+Tests for the compressed-record call store
+"""
+import json
+import os
+
+import pytest
+
+from migrate_storage import migrate
+from sqlite_storage import SQLiteStorage
+from storage import DataStorage
+
+CALL_ID = "20251109_111708"
+
+
+def _write_legacy_call(data_dir):
+    """Lay out one call the way older versions saved it"""
+    for kind in ('calls', 'transcripts', 'summaries'):
+        os.makedirs(os.path.join(data_dir, kind), exist_ok=True)
+
+    conversation = [{"role": "assistant", "content": "Hello"}, {"role": "user", "content": "Hi"}]
+    with open(os.path.join(data_dir, 'calls', f"{CALL_ID}.json"), 'w', encoding='utf-8') as f:
+        json.dump({"call_id": CALL_ID, "duration": 12.0, "conversation": conversation}, f)
+    with open(os.path.join(data_dir, 'transcripts', f"{CALL_ID}.txt"), 'w', encoding='utf-8') as f:
+        f.write("Agent: Hello\nHR Rep: Hi\n")
+    with open(os.path.join(data_dir, 'summaries', f"{CALL_ID}.json"), 'w', encoding='utf-8') as f:
+        json.dump({"summary": "Short call", "outcome": {"outcome": "no_answer"}, "conversation": conversation}, f)
+
+
+def _legacy_files(data_dir):
+    return sorted(
+        os.path.relpath(os.path.join(root, name), data_dir)
+        for root, _, files in os.walk(data_dir) for name in files
+        if name.endswith(('.json', '.txt')) and name != 'manifest.json' and 'stats' not in name
+    )
+
+
+def _contents(data_dir):
+    contents = {}
+    for path in _legacy_files(data_dir):
+        with open(os.path.join(data_dir, path), 'rb') as f:
+            contents[path] = f.read()
+    return contents
+
+
+def test_opening_storage_leaves_legacy_files_alone(tmp_path):
+    _write_legacy_call(str(tmp_path))
+    before = _legacy_files(str(tmp_path))
+
+    storage = DataStorage(data_dir=str(tmp_path))
+
+    assert _legacy_files(str(tmp_path)) == before
+    assert storage.get_call(CALL_ID) is None
+
+
+def test_pack_keeps_originals_and_is_rerunnable(tmp_path):
+    _write_legacy_call(str(tmp_path))
+    before = _legacy_files(str(tmp_path))
+    storage = DataStorage(data_dir=str(tmp_path))
+
+    assert storage.pack_legacy_calls() == 1
+    assert storage.pack_legacy_calls() == 0
+
+    assert _legacy_files(str(tmp_path)) == before
+    assert storage.get_summary(CALL_ID)["summary"] == "Short call"
+    assert storage.get_transcript(CALL_ID) == "Agent: Hello\nHR Rep: Hi\n"
+    assert storage.get_statistics()["total_calls"] == 1
+    assert storage.search("hello")[0]["call_id"] == CALL_ID
+
+
+def test_pack_moves_originals_to_backup(tmp_path):
+    data_dir = str(tmp_path / "data")
+    backup_dir = str(tmp_path / "backup")
+    _write_legacy_call(data_dir)
+    before = _legacy_files(data_dir)
+
+    DataStorage(data_dir=data_dir).pack_legacy_calls(backup_dir=backup_dir)
+
+    assert _legacy_files(data_dir) == []
+    assert _legacy_files(backup_dir) == before
+    assert DataStorage(data_dir=data_dir).get_call(CALL_ID)["duration"] == 12.0
+
+
+def test_migrate_to_sqlite_leaves_source_untouched(tmp_path):
+    data_dir = str(tmp_path / "data")
+    _write_legacy_call(data_dir)
+    before = _contents(data_dir)
+
+    assert migrate(data_dir, str(tmp_path / "calls.db")) == 1
+
+    assert _contents(data_dir) == before
+    assert not os.path.exists(os.path.join(data_dir, 'calls', 'manifest.json'))
+
+    storage = SQLiteStorage(data_dir=data_dir, db_path=str(tmp_path / "calls.db"))
+    assert storage.get_summary(CALL_ID)["summary"] == "Short call"
+    assert storage.get_transcript(CALL_ID) == "Agent: Hello\nHR Rep: Hi\n"
+
+
+@pytest.mark.parametrize("backend", ["json", "sqlite"])
+def test_resaving_a_call_does_not_double_count(tmp_path, backend):
+    if backend == "json":
+        storage = DataStorage(data_dir=str(tmp_path))
+    else:
+        storage = SQLiteStorage(data_dir=str(tmp_path))
+
+    call_data = {"duration": 30.0, "stages_completed": 2, "conversation": []}
+    call_id = storage.save_call(dict(call_data))
+    storage.save_call(dict(call_data, duration=90.0), call_id=call_id)
+
+    stats = storage.get_statistics()
+    assert stats["total_calls"] == 1
+    assert stats["total_duration_seconds"] == 90.0
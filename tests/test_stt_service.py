@@ -0,0 +1,55 @@
+"""
+Tests for Whisper worker supervision in the STT service
+"""
+from concurrent.futures import Future
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from stt_service import WhisperService
+
+
+class FakeWorker:
+    def __init__(self, pid, alive=True):
+        self.pid = pid
+        self.exitcode = None if alive else -9
+        self._alive = alive
+
+    def is_alive(self):
+        return self._alive
+
+
+def _job(service, job_id):
+    shm = shared_memory.SharedMemory(create=True, size=16)
+    future = Future()
+    service._jobs[job_id] = (shm, [future])
+    return future
+
+
+def test_dead_worker_fails_its_jobs_and_is_replaced(monkeypatch):
+    service = WhisperService(num_workers=2)
+    service._workers = [FakeWorker(101, alive=False), FakeWorker(102)]
+    monkeypatch.setattr(service, "_spawn_worker", lambda: FakeWorker(103))
+
+    lost = _job(service, 1)
+    running = _job(service, 2)
+    service._claims = {1: 101, 2: 102}
+
+    service._check_workers()
+
+    assert lost.result(timeout=0) is None
+    assert not running.done()
+    assert [worker.pid for worker in service._workers] == [103, 102]
+    assert service._claims == {2: 102}
+    assert 1 not in service._jobs
+
+    service._finish_job(2, ["hello"], None)
+    assert running.result(timeout=0) == "hello"
+
+
+def test_unanswered_transcription_times_out(monkeypatch):
+    service = WhisperService(num_workers=1, result_timeout=0.05)
+    monkeypatch.setattr(service, "submit", lambda audio_data, word_timestamps=False: Future())
+
+    assert service.transcribe(np.zeros(160, dtype=np.float32)) is None
+    assert service.transcribe_words(np.zeros(160, dtype=np.float32)) is None
@@ -0,0 +1,75 @@
+"""
+Tests for streaming transcription
+"""
+import numpy as np
+
+from stt_stream import StreamingTranscriber, UtteranceBuffer
+
+SAMPLE_RATE = 16000
+
+
+class FakeTranscriber:
+    """Returns scripted word hypotheses and records what it was asked to decode"""
+
+    def __init__(self, hypotheses, tail_text):
+        self.hypotheses = list(hypotheses)
+        self.tail_text = tail_text
+        self.decoded = []
+
+    def transcribe_words(self, audio):
+        self.decoded.append(audio.size)
+        return self.hypotheses.pop(0)
+
+    def transcribe(self, audio):
+        self.decoded.append(audio.size)
+        return self.tail_text
+
+
+def test_utterance_buffer_converts_drops_and_swaps():
+    buffer = UtteranceBuffer(4)
+
+    assert buffer.append(np.array([16384, -32768], dtype=np.int16)) == 2
+    assert buffer.append(np.array([0.25, 0.5, 0.75], dtype=np.float32)) == 2
+    assert buffer.view().tolist() == [0.5, -1.0, 0.25, 0.5]
+
+    buffer.drop(3)
+    assert buffer.view().tolist() == [0.5]
+
+    taken = buffer.swap()
+    buffer.append(np.array([0.1], dtype=np.float32))
+    assert taken.tolist() == [0.5]
+    assert buffer.size == 1
+
+
+def test_stable_prefix_is_committed_and_its_audio_dropped():
+    fake = FakeTranscriber([
+        [("Hello", 0.0, 0.5), ("there", 0.5, 1.0)],
+        [("Hello", 0.0, 0.5), ("there", 0.5, 1.0), ("how", 1.0, 1.4)],
+    ], tail_text="how are you")
+    stream = StreamingTranscriber(fake, sample_rate=SAMPLE_RATE, partial_interval=1.0)
+    second = np.zeros(SAMPLE_RATE, dtype=np.float32)
+
+    stream.add_audio(second)
+    assert stream.ready()
+    assert stream.process() is None
+
+    stream.add_audio(second)
+    assert stream.process() == "Hello there"
+    assert stream.committed_text == "Hello there"
+
+    stream.add_audio(second)
+    assert stream.finalize() == "Hello there how are you"
+    # The final decode only covers audio after the last committed word
+    assert fake.decoded == [SAMPLE_RATE, 2 * SAMPLE_RATE, 2 * SAMPLE_RATE]
+    assert not stream.has_audio()
+
+
+def test_audio_past_max_utterance_is_dropped():
+    stream = StreamingTranscriber(FakeTranscriber([], tail_text="hi"), sample_rate=SAMPLE_RATE,
+                                  max_utterance=1.0)
+
+    assert stream.add_audio(np.zeros(SAMPLE_RATE // 2, dtype=np.float32))
+    assert not stream.add_audio(np.zeros(SAMPLE_RATE, dtype=np.float32))
+    assert stream.is_full()
+    assert stream.finalize() == "hi"
+    assert not stream.is_full()
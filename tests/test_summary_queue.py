@@ -0,0 +1,87 @@
+"""
+Tests for the background summary queue
+"""
+import threading
+
+import pytest
+
+pytest.importorskip("anthropic")
+
+from ai_handler import SUMMARY_ERROR  # noqa: E402
+from summary_queue import SummaryQueue  # noqa: E402
+
+
+class FakeStorage:
+    def __init__(self, save_failures=0):
+        self.save_failures = save_failures
+        self.saved = []
+        self.updates = []
+
+    def save_call(self, call_data, call_id=None):
+        if self.save_failures:
+            self.save_failures -= 1
+            raise OSError("disk full")
+        self.saved.append(call_id)
+        return call_id
+
+    def save_transcript(self, call_id, transcript):
+        pass
+
+    def update_call(self, call_id, updates):
+        self.updates.append(updates)
+
+
+class FakeHandler:
+    def __init__(self, result):
+        self.result = result
+
+    def restore(self, conversation, stage):
+        pass
+
+    def get_conversation_summary(self):
+        return {"summary": self.result, "outcome": {"outcome": "unknown"}, "token_usage": {}}
+
+
+def run_job(tmp_path, storage, summary, max_attempts=3):
+    done = threading.Event()
+    results = []
+
+    def on_ready(job, result):
+        results.append(result)
+        done.set()
+
+    queue = SummaryQueue(
+        storage, handler_factory=lambda: FakeHandler(summary), on_ready=on_ready,
+        jobs_dir=str(tmp_path), max_attempts=max_attempts, retry_delay=0.01
+    )
+    queue.start()
+    queue.enqueue("call1", "sid", {"conversation": [], "stages_completed": 0}, "")
+    assert done.wait(5)
+    return queue, results
+
+
+def test_storage_error_is_retried(tmp_path):
+    storage = FakeStorage(save_failures=2)
+    queue, results = run_job(tmp_path, storage, "A good call.")
+
+    assert storage.saved == ["call1"]
+    assert results[0]["summary"] == "A good call."
+    assert storage.updates[-1]["summary_status"] == "ready"
+    assert not queue.has_job("call1")
+
+
+def test_summary_failure_gives_up_after_max_attempts(tmp_path):
+    storage = FakeStorage()
+    queue, results = run_job(tmp_path, storage, SUMMARY_ERROR)
+
+    assert results == [None]
+    assert storage.updates[-1]["summary_status"] == "failed"
+    assert not queue.has_job("call1")
+
+
+def test_unsaved_call_keeps_its_job(tmp_path):
+    storage = FakeStorage(save_failures=10)
+    queue, results = run_job(tmp_path, storage, "A good call.")
+
+    assert results == [None]
+    assert queue.has_job("call1")
@@ -0,0 +1,60 @@
+"""
+Tests for the single-thread TTS service
+"""
+import pytest
+
+pytest.importorskip("pyttsx3")
+
+from tts import TextToSpeech, TTSService  # noqa: E402
+from tts_cache import AudioCache  # noqa: E402
+
+
+def test_engine_failure_resolves_requests_to_none(monkeypatch):
+    def broken_init():
+        raise RuntimeError("no speech driver")
+
+    tts = TextToSpeech()
+    monkeypatch.setattr(tts, "initialize", broken_init)
+    service = TTSService(tts)
+
+    assert service.submit("Hello there.").result(timeout=5) is None
+    service.shutdown()
+
+
+def test_empty_render_does_not_return_previous_audio(monkeypatch, tmp_path):
+    tts = TextToSpeech()
+    monkeypatch.setattr(tts, "initialize", lambda: None)
+    tts._render_path = str(tmp_path / "render.wav")
+
+    def render(text, filename):
+        if text == "first":
+            with open(filename, "wb") as f:
+                f.write(b"first audio")
+        return True
+
+    monkeypatch.setattr(tts, "save_to_file", render)
+    assert tts.get_audio_data("first") == b"first audio"
+    assert tts.get_audio_data("second") is None
+
+
+def test_each_lookup_is_counted_once(monkeypatch, tmp_path):
+    cache = AudioCache(str(tmp_path / "cache"))
+    tts = TextToSpeech(cache=cache)
+    tts.engine = object()
+    monkeypatch.setattr(tts, "initialize", lambda: None)
+    tts._render_path = str(tmp_path / "render.wav")
+
+    def render(text, filename):
+        with open(filename, "wb") as f:
+            f.write(b"audio")
+        return True
+
+    monkeypatch.setattr(tts, "save_to_file", render)
+    service = TTSService(tts)
+
+    assert service.get_audio_data("Hello there.") == b"audio"
+    assert service.get_audio_data("Hello there.") == b"audio"
+    service.shutdown()
+
+    stats = cache.stats()
+    assert (stats["misses"], stats["memory_hits"], stats["hit_rate"]) == (1, 1, 0.5)
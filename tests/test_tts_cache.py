@@ -0,0 +1,48 @@
+"""
+Tests for the two-tier synthesized audio cache
+"""
+import os
+
+from tts_cache import AudioCache
+
+
+def test_memory_and_disk_hits(tmp_path):
+    cache = AudioCache(str(tmp_path), max_memory_bytes=1024)
+    key = AudioCache.make_key("Hello there.", 150, 0.9, None)
+    cache.put(key, b"audio")
+
+    assert cache.get(key) == b"audio"
+    assert cache.stats()["memory_hits"] == 1
+
+    reopened = AudioCache(str(tmp_path), max_memory_bytes=1024)
+    assert reopened.get(key) == b"audio"
+    assert reopened.stats()["disk_hits"] == 1
+
+
+def test_key_ignores_whitespace_but_not_voice_settings():
+    assert AudioCache.make_key("Hi  there", 150, 0.9, None) == AudioCache.make_key("Hi there", 150, 0.9, None)
+    assert AudioCache.make_key("Hi there", 150, 0.9, None) != AudioCache.make_key("Hi there", 160, 0.9, None)
+
+
+def test_disk_tier_evicts_least_recently_used(tmp_path):
+    cache = AudioCache(str(tmp_path), max_memory_bytes=0, max_disk_bytes=25)
+    keys = [AudioCache.make_key(f"sentence {i}", 150, 0.9, None) for i in range(3)]
+
+    cache.put(keys[0], b"x" * 10)
+    cache.put(keys[1], b"x" * 10)
+    cache.get(keys[0])
+    cache.put(keys[2], b"x" * 10)
+
+    assert cache.stats()["disk_bytes"] == 20
+    assert not os.path.exists(cache._path(keys[1]))
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[1]) is None
+
+
+def test_disk_bound_applies_to_existing_files(tmp_path):
+    cache = AudioCache(str(tmp_path), max_memory_bytes=0)
+    for i in range(4):
+        cache.put(AudioCache.make_key(f"sentence {i}", 150, 0.9, None), b"x" * 10)
+
+    reopened = AudioCache(str(tmp_path), max_memory_bytes=0, max_disk_bytes=20)
+    assert reopened.stats()["disk_entries"] == 2
@@ -0,0 +1,71 @@
+"""
+Tests for energy-based voice activity detection
+"""
+import numpy as np
+
+from vad import VoiceActivityDetector
+
+SAMPLE_RATE = 16000
+
+
+def _tone(seconds, amplitude=0.3, frequency=200.0):
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return (amplitude * np.sin(2 * np.pi * frequency * t)).astype(np.float32)
+
+
+def _silence(seconds):
+    return np.zeros(int(seconds * SAMPLE_RATE), dtype=np.float32)
+
+
+def _feed(vad, audio, chunk_seconds=0.1):
+    """Stream audio in chunks, returning the buffered samples and end-of-speech flags"""
+    kept, ended = 0, []
+    step = int(chunk_seconds * SAMPLE_RATE)
+    for start in range(0, audio.size, step):
+        chunk, end_of_speech = vad.process(audio[start:start + step])
+        kept += chunk.size
+        ended.append(end_of_speech)
+    return kept, ended
+
+
+def test_utterance_is_endpointed_after_hangover():
+    vad = VoiceActivityDetector(sample_rate=SAMPLE_RATE, hangover_ms=600, pre_roll_ms=200)
+
+    kept, ended = _feed(vad, np.concatenate([_silence(1.0), _tone(0.5), _silence(1.0)]))
+
+    assert ended.count(True) == 1
+    # Speech plus pre-roll plus the hangover; leading silence is mostly dropped
+    assert 0.5 * SAMPLE_RATE < kept < 1.5 * SAMPLE_RATE
+    assert not vad.in_speech
+
+
+def test_short_blip_is_not_an_utterance():
+    vad = VoiceActivityDetector(sample_rate=SAMPLE_RATE, hangover_ms=300, min_speech_ms=250)
+
+    kept, ended = _feed(vad, np.concatenate([_silence(0.5), _tone(0.06), _silence(1.0)]))
+
+    # The blip's audio never reaches the transcriber
+    assert kept == 0
+    assert not any(ended)
+
+
+def test_flush_returns_audio_held_back_from_a_short_utterance():
+    vad = VoiceActivityDetector(sample_rate=SAMPLE_RATE, min_speech_ms=250)
+
+    kept, ended = _feed(vad, np.concatenate([_silence(0.3), _tone(0.15)]))
+
+    assert kept == 0
+    assert vad.in_speech
+    assert vad.flush().size >= 0.15 * SAMPLE_RATE
+    assert not vad.in_speech
+    assert vad.flush().size == 0
+
+
+def test_noise_is_not_speech():
+    vad = VoiceActivityDetector(sample_rate=SAMPLE_RATE)
+    noise = (np.random.default_rng(0).standard_normal(3 * SAMPLE_RATE) * 0.003).astype(np.float32)
+
+    kept, ended = _feed(vad, noise)
+
+    assert kept == 0
+    assert not any(ended)
@@ -2,11 +2,21 @@
 const socket = io('http://localhost:5000');
 
 let isCallActive = false;
-let mediaRecorder = null;
-let audioChunks = [];
+let micStream = null;
+let captureNode = null;
 let audioContext = null;
 let analyser = null;
 let visualizerBars = [];
+let audioQueue = [];
+let isPlayingAudio = false;
+
+// Audio transport; the server picks binary frames when we offer them
+const FRAME_HEADER_BYTES = 12;  // version, codec, padding, sequence, sample rate
+const FRAME_VERSION = 1;
+const CODEC_PCM16 = 1;
+let audioTransport = 'base64';
+let targetSampleRate = 16000;
+let inboundSeq = 0;
 
 // DOM Elements
 const startBtn = document.getElementById('startBtn');
@@ -41,6 +51,12 @@ socket.on('disconnect', () => {
     resetCall();
 });
 
+socket.on('audio_transport', (data) => {
+    console.log('Audio transport:', data.transport);
+    audioTransport = data.transport;
+    targetSampleRate = data.sample_rate;
+});
+
 socket.on('call_started', (data) => {
     console.log('Call started:', data);
     updateStatus('Call in progress - Agent speaking...', true);
@@ -49,15 +65,22 @@ socket.on('call_started', (data) => {
 
 socket.on('agent_speaking', (data) => {
     console.log('Agent speaking:', data.text);
-    addMessage('agent', data.text);
 
-    // Play audio if available
-    if (data.audio) {
-        playAudio(data.audio);
+    // Later sentences of a streamed reply extend the current message
+    if (data.segment > 0) {
+        appendToLastMessage('agent', data.text);
     } else {
-        // Fallback: use browser's speech synthesis
-        speak(data.text);
+        addMessage('agent', data.text);
     }
+
+    // Queue audio so streamed sentences play back in order
+    audioQueue.push(data);
+    playNextAudio();
+});
+
+socket.on('user_spoke_partial', (data) => {
+    console.log('User speaking:', data.text);
+    updateStatus('HR representative: ' + data.text, true);
 });
 
 socket.on('user_spoke', (data) => {
@@ -72,11 +95,16 @@ socket.on('processing', (data) => {
 
 socket.on('call_ended', (data) => {
     console.log('Call ended:', data);
-    updateStatus('Call ended', false);
+    updateStatus(data.reason === 'max_duration' ? 'Call ended - time limit reached' : 'Call ended', false);
     showSummary(data);
     resetCall();
 });
 
+socket.on('summary_ready', (data) => {
+    console.log('Summary ready:', data);
+    summaryContent.textContent = data.summary || 'Summary could not be generated.';
+});
+
 socket.on('error', (data) => {
     console.error('Error:', data.message);
     alert('Error: ' + data.message);
@@ -89,6 +117,7 @@ async function startCall() {
     try {
         // Request microphone access
         const stream = await navigator.mediaDevices.getUserMedia({ audio: true });
+        micStream = stream;
 
         // Initialize audio context for visualization (with resume for browser policy)
         audioContext = new (window.AudioContext || window.webkitAudioContext)();
@@ -105,34 +134,18 @@ async function startCall() {
         // Start visualizer
         visualize();
 
-        // Setup media recorder
-        mediaRecorder = new MediaRecorder(stream);
-        audioChunks = [];
-
-        mediaRecorder.ondataavailable = (event) => {
-            audioChunks.push(event.data);
+        // Stream microphone audio to the server as 16-bit PCM
+        inboundSeq = 0;
+        captureNode = audioContext.createScriptProcessor(4096, 1, 1);
+        captureNode.onaudioprocess = (event) => {
+            if (!isCallActive) return;
+            sendAudio(downsample(event.inputBuffer.getChannelData(0), audioContext.sampleRate));
         };
+        source.connect(captureNode);
+        captureNode.connect(audioContext.destination);
 
-        mediaRecorder.onstop = () => {
-            // Convert audio chunks to base64 and send
-            const audioBlob = new Blob(audioChunks, { type: 'audio/webm' });
-            const reader = new FileReader();
-
-            reader.onloadend = () => {
-                const base64Audio = reader.result.split(',')[1];
-                socket.emit('audio_chunk', { audio: base64Audio });
-                socket.emit('user_finished_speaking');
-            };
-
-            reader.readAsDataURL(audioBlob);
-            audioChunks = [];
-        };
-
-        // Start recording
-        mediaRecorder.start();
-
-        // Emit start call event
-        socket.emit('start_call', {});
+        // Emit start call event, offering binary audio frames
+        socket.emit('start_call', { transports: ['binary', 'base64'] });
 
         isCallActive = true;
         startBtn.disabled = true;
@@ -163,8 +176,14 @@ function resetCall() {
     startBtn.disabled = false;
     endBtn.disabled = true;
 
-    if (mediaRecorder && mediaRecorder.state !== 'inactive') {
-        mediaRecorder.stop();
+    if (captureNode) {
+        captureNode.disconnect();
+        captureNode = null;
+    }
+
+    if (micStream) {
+        micStream.getTracks().forEach(track => track.stop());
+        micStream = null;
     }
 
     if (audioContext) {
@@ -172,6 +191,9 @@ function resetCall() {
         audioContext = null;
     }
 
+    audioQueue = [];
+    isPlayingAudio = false;
+
     hideProcessing();
 }
 
@@ -220,7 +242,7 @@ function hideProcessing() {
 
 // Show call summary
 function showSummary(data) {
-    summaryContent.textContent = data.summary;
+    summaryContent.textContent = data.summary || 'Generating summary...';
 
     // Show stats
     stats.innerHTML = `
@@ -237,22 +259,112 @@ function showSummary(data) {
     summary.classList.add('show');
 }
 
-// Play audio from base64
-function playAudio(base64Audio) {
-    const audio = new Audio('data:audio/wav;base64,' + base64Audio);
+// Append text to the most recent message from the same role
+function appendToLastMessage(role, text) {
+    const last = conversation.lastElementChild;
+    if (last && last.classList.contains(role)) {
+        last.querySelector('.text').textContent += ' ' + text;
+        conversation.scrollTop = conversation.scrollHeight;
+    } else {
+        addMessage(role, text);
+    }
+}
+
+// Play queued agent audio one segment at a time
+function playNextAudio() {
+    if (isPlayingAudio || audioQueue.length === 0) return;
+
+    const data = audioQueue.shift();
+    isPlayingAudio = true;
+
+    const done = () => {
+        isPlayingAudio = false;
+        playNextAudio();
+    };
+
+    // Play audio if available (binary frame or base64 WAV)
+    if (data.audio) {
+        playAudio(data.audio, done);
+    } else {
+        // Fallback: use browser's speech synthesis
+        speak(data.text, done);
+    }
+}
+
+// Play audio from a binary frame or base64
+function playAudio(audioData, onEnded) {
+    let src = null;
+    if (typeof audioData === 'string') {
+        src = 'data:audio/wav;base64,' + audioData;
+    } else {
+        // Skip the frame header; the payload is a complete WAV file
+        const wav = new Uint8Array(audioData, FRAME_HEADER_BYTES);
+        src = URL.createObjectURL(new Blob([wav], { type: 'audio/wav' }));
+    }
+
+    const finished = () => {
+        if (src.startsWith('blob:')) URL.revokeObjectURL(src);
+        if (onEnded) onEnded();
+    };
+
+    const audio = new Audio(src);
+    audio.onended = finished;
     audio.play().catch(err => {
         console.error('Error playing audio:', err);
-        // Fallback handled by caller
+        finished();
     });
 }
 
+// Resample microphone audio to the server's rate as 16-bit PCM
+function downsample(samples, inputRate) {
+    const ratio = inputRate / targetSampleRate;
+    const pcm = new Int16Array(Math.floor(samples.length / ratio));
+
+    for (let i = 0; i < pcm.length; i++) {
+        // Average the input samples that fall into this output sample
+        const start = Math.floor(i * ratio);
+        const end = Math.min(samples.length, Math.floor((i + 1) * ratio));
+        let sum = 0;
+        for (let j = start; j < end; j++) sum += samples[j];
+        const value = Math.max(-1, Math.min(1, sum / Math.max(1, end - start)));
+        pcm[i] = value < 0 ? value * 0x8000 : value * 0x7FFF;
+    }
+
+    return pcm;
+}
+
+// Send one chunk of PCM in the negotiated transport
+function sendAudio(pcm) {
+    if (audioTransport === 'binary') {
+        const frame = new ArrayBuffer(FRAME_HEADER_BYTES + pcm.byteLength);
+        const header = new DataView(frame);
+        header.setUint8(0, FRAME_VERSION);
+        header.setUint8(1, CODEC_PCM16);
+        header.setUint32(4, inboundSeq++);
+        header.setUint32(8, targetSampleRate);
+        new Int16Array(frame, FRAME_HEADER_BYTES).set(pcm);
+        socket.emit('audio_chunk', frame);
+    } else {
+        // Fallback for servers that only accept base64 JSON
+        const bytes = new Uint8Array(pcm.buffer);
+        let binary = '';
+        for (let i = 0; i < bytes.length; i += 0x8000) {
+            binary += String.fromCharCode.apply(null, bytes.subarray(i, i + 0x8000));
+        }
+        socket.emit('audio_chunk', { audio: btoa(binary) });
+    }
+}
+
 // Fallback: Browser speech synthesis
-function speak(text) {
+function speak(text, onEnded) {
     if ('speechSynthesis' in window) {
         const utterance = new SpeechSynthesisUtterance(text);
         utterance.rate = 0.9;
         utterance.pitch = 1;
+        utterance.onend = onEnded;
         window.speechSynthesis.speak(utterance);
+    } else if (onEnded) {
+        onEnded();
     }
 }
 
@@ -293,18 +405,8 @@ function setupVoiceDetection() {
                 isSpeaking = false;
                 silenceStart = null;
 
-                if (mediaRecorder && mediaRecorder.state === 'recording') {
-                    updateStatus('Processing response...', true);
-                    mediaRecorder.stop();
-
-                    // Restart recording for next response
-                    setTimeout(() => {
-                        if (isCallActive && mediaRecorder) {
-                            audioChunks = [];
-                            mediaRecorder.start();
-                        }
-                    }, 1000);
-                }
+                updateStatus('Processing response...', true);
+                socket.emit('user_finished_speaking');
             }
         }
 